@@ -0,0 +1,162 @@
+"""Compare response decoding paths on ticker and market list payloads.
+
+    python -m benchmarks.decode                      # payloads shaped like Upbit's
+    python -m benchmarks.decode --record payloads/   # record live payloads first
+    python -m benchmarks.decode --payloads payloads/ # replay recorded payloads
+
+Every path requests the payload over the same `MockTransport`, without a
+network. "dicts" is the former path (`response.json()` then
+`model_validate` per item); "bytes" and "lean" go through the client's
+`_get_list`, which resources use: the current `validate_json` on the body, and
+the opt-in record path (`UpbitClient(lean=True)`) after its schema check.
+Memory is what one decoded list keeps alive.
+"""
+import argparse
+import json
+import pathlib
+import timeit
+import tracemalloc
+import typing as t
+
+import httpx
+import pydantic
+
+from src.base import HTTPClientBase
+from src.client.upbit.types import Market, Ticker
+
+_CAUTIONS = (
+    "PRICE_FLUCTUATIONS",
+    "TRADING_VOLUME_SOARING",
+    "DEPOSIT_AMOUNT_SOARING",
+    "GLOBAL_PRICE_DIFFERENCES",
+    "CONCENTRATION_OF_SMALL_ACCOUNTS",
+)
+
+
+def _market(code: str) -> dict[str, t.Any]:
+    return {
+        "market": code,
+        "korean_name": "비트코인",
+        "english_name": "Bitcoin",
+        "market_event": {"warning": False, "caution": {name: False for name in _CAUTIONS}},
+    }
+
+
+def _ticker(code: str, i: int) -> dict[str, t.Any]:
+    price = 1000.0 + i
+    return {
+        "market": code,
+        "trade_date": "20260101",
+        "trade_time": "000000",
+        "trade_date_kst": "20260101",
+        "trade_time_kst": "090000",
+        "trade_timestamp": 1767225600000 + i,
+        "opening_price": price,
+        "high_price": price * 1.05,
+        "low_price": price * 0.95,
+        "trade_price": price * 1.01,
+        "prev_closing_price": price,
+        "change": "RISE",
+        "change_price": price * 0.01,
+        "change_rate": 0.01,
+        "signed_change_price": price * 0.01,
+        "signed_change_rate": 0.01,
+        "trade_volume": 0.5,
+        "acc_trade_price": 1.2e9,
+        "acc_trade_price_24h": 2.4e9,
+        "acc_trade_volume": 1200.5,
+        "acc_trade_volume_24h": 2400.25,
+        "highest_52_week_price": price * 2,
+        "highest_52_week_date": "2025-03-01",
+        "lowest_52_week_price": price / 2,
+        "lowest_52_week_date": "2025-08-01",
+        "timestamp": 1767225600000 + i,
+    }
+
+
+def synthetic_payloads(markets: int) -> dict[str, bytes]:
+    codes = [f"KRW-C{i:03d}" for i in range(markets)]
+    return {
+        "market": json.dumps([_market(code) for code in codes]).encode(),
+        "ticker": json.dumps([_ticker(code, i) for i, code in enumerate(codes)]).encode(),
+    }
+
+
+def record(directory: pathlib.Path) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    with httpx.Client(base_url="https://api.upbit.com") as client:
+        markets = client.get("/v1/market/all", params={"is_details": "true"}).raise_for_status()
+        (directory / "market.json").write_bytes(markets.content)
+        codes = [m["market"] for m in markets.json() if m["market"].startswith("KRW-")]
+        tickers = client.get("/v1/ticker", params={"markets": ",".join(codes)}).raise_for_status()
+        (directory / "ticker.json").write_bytes(tickers.content)
+
+
+def _http_client(payloads: dict[str, bytes]) -> httpx.Client:
+    def _serve(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=payloads[request.url.path.strip("/")])
+
+    return httpx.Client(transport=httpx.MockTransport(_serve))
+
+
+def _dicts(http: httpx.Client, fmt: t.Type[pydantic.BaseModel], url: str) -> t.List[pydantic.BaseModel]:
+    return [fmt.model_validate(item) for item in http.get(url).raise_for_status().json()]
+
+
+def _get_list(client: HTTPClientBase, fmt: t.Type[pydantic.BaseModel], url: str, *, lean: bool = False) -> t.List[t.Any]:
+    items, error = client._get_list(fmt, url=url, lean=lean)
+    if items is None:
+        raise t.cast(Exception, error)
+    return items
+
+
+def _retained(decode: t.Callable[[], t.Any]) -> int:
+    tracemalloc.start()
+    try:
+        decoded = decode()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del decoded
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--payloads", type=pathlib.Path, help="Directory with market.json and ticker.json")
+    parser.add_argument("--record", type=pathlib.Path, help="Record live payloads into this directory and use them")
+    parser.add_argument("--markets", type=int, default=250, help="Markets in synthetic payloads")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record)
+        args.payloads = args.record
+    payloads = (
+        {name: (args.payloads / f"{name}.json").read_bytes() for name in ("market", "ticker")}
+        if args.payloads
+        else synthetic_payloads(args.markets)
+    )
+
+    http = _http_client(payloads)
+    client = HTTPClientBase(client=http)
+    for name, fmt in (("market", Market), ("ticker", Ticker)):
+        url = f"https://upbit.invalid/{name}"
+        fast = _get_list(client, fmt, url)
+        assert fast == _dicts(http, fmt, url)
+        _get_list(client, fmt, url, lean=True)
+        assert [record.to_model() for record in _get_list(client, fmt, url, lean=True)] == fast
+
+        paths: dict[str, t.Callable[[], t.Any]] = {
+            "dicts": lambda: _dicts(http, fmt, url),
+            "bytes": lambda: _get_list(client, fmt, url),
+            "lean": lambda: _get_list(client, fmt, url, lean=True),
+        }
+        print(f"{name}: {len(fast)} items, {len(payloads[name]) / 1024:.1f} KiB")
+        for path, decode in paths.items():
+            seconds = min(timeit.repeat(decode, number=args.repeat, repeat=5)) / args.repeat
+            print(f"  {path:<6} {seconds * 1e3:7.3f} ms  {_retained(decode) / 1024:8.1f} KiB retained")
+
+
+if __name__ == "__main__":
+    main()
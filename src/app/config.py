@@ -1,6 +1,55 @@
 from __future__ import annotations
 
-from src.base import BaseModel
+import typing as t
+
+from src.base import (
+    BaseModel,
+    TransportConfig,
+    RetryPolicy,
+    CircuitBreakerPolicy,
+    CachePolicy,
+)
+
+from .event import EventSinkPolicy
+from .schedule import Cadence
+
+
+class ScheduleConfig(BaseModel):
+    tick_seconds: float = 1.0
+    """Seconds between ticks. Every tick checks which sources are due."""
+
+    tickers: Cadence = Cadence(interval=5.0)
+    """Ticker refreshes."""
+
+    candles: Cadence = Cadence(interval=86_400.0, offset=5.0)
+    """Candle refreshes, right after each daily candle close (00:00 UTC)."""
+
+    fng: Cadence = Cadence(interval=86_400.0, offset=600.0)
+    """Fear & Greed refreshes, once a day after the index is published."""
+
+
+class MarketEventPolicy(BaseModel):
+    delta: bool = False
+    """Send market data as deltas in the long-running mode instead of a full
+    snapshot every tick. Consumers rebuild it with `MarketDataDecoder`.
+    """
+
+    snapshot_every: int = 60
+    """In delta mode, every this many market events is a full snapshot."""
+
+
+class BacktestPolicy(BaseModel):
+    initial_capital: float = 1_000_000.0
+    """Starting capital in KRW, split equally between the backtested markets."""
+
+    fee: float = 0.0005
+    """Fee per fill as a fraction of the traded value (Upbit KRW market: 0.05%)."""
+
+    slippage: float = 0.0005
+    """Price impact per fill as a fraction of the traded value."""
+
+    regime_window: int = 7
+    """Days averaged into the sentiment regime the signals read."""
 
 
 class AppConfig(BaseModel):
@@ -11,6 +60,45 @@ class AppConfig(BaseModel):
     """The threshold configurations.
     This could include sentiment and technical parameters.
     """
+
+    http: TransportConfig = TransportConfig()
+    """The connection pool and protocol settings shared by all API clients."""
+
+    retry: RetryPolicy = RetryPolicy()
+    """The retry policy for transient API failures."""
+
+    circuit_breaker: CircuitBreakerPolicy = CircuitBreakerPolicy()
+    """The per-host circuit breaker settings."""
+
+    cache: CachePolicy = CachePolicy()
+    """The response cache settings for slow-changing endpoints."""
+
+    lean_models: bool = False
+    """Decode tickers and candles into slotted, validation-free records
+    after a one-time schema check. Cuts decode time and memory per snapshot.
+    """
+
+    candle_store: str | None = None
+    """Directory of the local candle store.
+    When set, candles are synced incrementally into it instead of re-downloaded every run.
+    """
+
+    fng_store: str | None = None
+    """File of the local Fear & Greed history.
+    When set, the full history is downloaded once and only new days afterwards.
+    """
+
+    events: EventSinkPolicy = EventSinkPolicy()
+    """Where run events are written and how sinks behave when they fall behind."""
+
+    backtest: BacktestPolicy = BacktestPolicy()
+    """Capital and execution costs of backtests."""
+
+    market_events: MarketEventPolicy = MarketEventPolicy()
+    """How market data is carried in the events of the long-running mode."""
+
+    schedule: ScheduleConfig = ScheduleConfig()
+    """The tick rate and per-source refresh cadences of the long-running mode."""
     
 
 class Thresholds(BaseModel):
@@ -44,6 +132,8 @@ class SentimentThresholds(BaseModel):
     """Threshold for extreme greed sentiment.
     if fng(Fear and Greed) index is above this value,
     the market is considered to be in extreme greed.
+    The classifier already counts everything from `greed` up as extreme
+    greed, so this only has to be at or above `greed`.
     """
 
 
@@ -51,4 +141,24 @@ class TechnicalThresholds(BaseModel):
     ma_period: int
     """The moving average period for technical analysis.
     This period is used to determine market trends.
-    """
\ No newline at end of file
+    """
+
+    ma_periods: t.List[int] = [5, 20, 60, 120]
+    """Additional moving average periods computed alongside `ma_period`,
+    e.g. to draw an MA ribbon.
+    """
+
+    volatility_window: int = 14
+    """The ATR period for volatility analysis."""
+
+    volatility_smoothing: t.Literal["simple", "exponential", "wilder"] = "simple"
+    """How true ranges are averaged into the ATR."""
+
+    indicators: t.List[AnyIndicatorSpec] = []
+    """Extra indicators to compute on every run, e.g. `{kind: rsi, period: 14}`.
+    Strategies declare the ones they rely on themselves.
+    """
+
+
+# Imported last: the technical package imports `AppConfig` from this module.
+from .service.technical.indicators import AnyIndicatorSpec  # noqa: E402
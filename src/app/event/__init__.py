@@ -1,6 +1,22 @@
 from .event import Event
+from .sinks import (
+    EventSink,
+    EventSinkPolicy,
+    FanOutSink,
+    RotatingFileSink,
+    SinkStats,
+    StdoutSink,
+    UnixSocketSink,
+)
 
 
 __all__ = [
     "Event",
+    "EventSink",
+    "EventSinkPolicy",
+    "FanOutSink",
+    "RotatingFileSink",
+    "SinkStats",
+    "StdoutSink",
+    "UnixSocketSink",
 ]
\ No newline at end of file
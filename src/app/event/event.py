@@ -1,3 +1,5 @@
+import typing as t
+
 from src.base import BaseModel, JSONValue
 
 class Event(BaseModel): 
@@ -30,6 +32,16 @@ class Event(BaseModel):
         )
     
 
+    @classmethod
+    def MarketDataDelta(cls, run_id: str, delta: JSONValue) -> "Event":
+        return cls(
+            id="market_data_delta",
+            type="market",
+            run_id=run_id,
+            data=delta,
+        )
+    
+
     @classmethod
     def SentimentAnalyzed(cls, artifact: JSONValue) -> "Event":
         return cls(
@@ -47,4 +59,72 @@ class Event(BaseModel):
             type="technical",
             run_id="default_run",
             data=artifact,
-        )
\ No newline at end of file
+        )
+    
+
+    @classmethod
+    def TechnicalScanned(cls, artifact: JSONValue) -> "Event":
+        return cls(
+            id="technical_scanned",
+            type="technical",
+            run_id="default_run",
+            data=artifact,
+        )
+    
+
+    @classmethod
+    def Backtested(cls, run_id: str, artifact: JSONValue) -> "Event":
+        return cls(
+            id="backtested",
+            type="backtest",
+            run_id=run_id,
+            data=artifact,
+        )
+    
+
+    @classmethod
+    def Tick(
+        cls,
+        run_id: str,
+        *,
+        tick: int,
+        lag: float,
+        skipped: int,
+        refreshed: t.Sequence[str],
+        changed: t.Sequence[str],
+    ) -> "Event":
+        return cls(
+            id="tick",
+            type="system",
+            run_id=run_id,
+            data={
+                "tick": tick,
+                "lag": lag,
+                "skipped": skipped,
+                "refreshed": list(refreshed),
+                "changed": list(changed),
+            },
+        )
+    
+
+    @classmethod
+    def TickFailed(cls, run_id: str, *, tick: int, error: BaseException) -> "Event":
+        return cls(
+            id="tick_failed",
+            type="system",
+            run_id=run_id,
+            data={
+                "tick": tick,
+                "error": f"{type(error).__name__}: {error}",
+            },
+        )
+    
+
+    @classmethod
+    def StageFinished(cls, run_id: str, *, timing: JSONValue) -> "Event":
+        return cls(
+            id="stage_finished",
+            type="system",
+            run_id=run_id,
+            data=timing,
+        )
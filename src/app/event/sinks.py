@@ -0,0 +1,348 @@
+"""Where run events go.
+
+Producers hand events to a sink with `emit` and move on: each sink keeps a
+bounded queue that a background thread drains in batches, serializing
+events to NDJSON and writing a whole batch at once. When the writer falls
+behind and the queue fills up, the sink's overflow policy decides between
+blocking the producer, dropping the oldest queued events, or sampling.
+"""
+from __future__ import annotations
+
+import abc
+import collections
+import logging
+import os
+import pathlib
+import socket
+import sys
+import threading
+import typing as t
+
+from src.base import BaseModel
+
+from .event import Event
+
+logger = logging.getLogger(__name__)
+
+OverflowPolicy = t.Literal["block", "drop_oldest", "sample"]
+
+
+class SinkStats(BaseModel):
+
+    emitted: int = 0
+    """Events handed to the sink."""
+
+    written: int = 0
+    """Events written out."""
+
+    dropped: int = 0
+    """Events discarded by the overflow policy or lost to a failed write."""
+
+    batches: int = 0
+    """Writes performed; `written / batches` is the mean batch size."""
+
+
+class EventSink(abc.ABC):
+    """Serializes events on a background thread and writes them in batches.
+
+    Overflow policies, applied when the queue holds `queue_size` events:
+
+    - "block": `emit` waits until the writer has made room.
+    - "drop_oldest": the oldest queued event is discarded for the new one.
+    - "sample": from half full on, only every `sample_every`-th event is
+      queued (evicting the oldest when full) and the rest are dropped.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue_size: int = 1024,
+        batch_size: int = 256,
+        overflow: OverflowPolicy = "block",
+        sample_every: int = 10,
+    ) -> None:
+        if queue_size < 1 or batch_size < 1 or sample_every < 1:
+            raise ValueError("queue_size, batch_size and sample_every must be at least 1.")
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.overflow = overflow
+        self.sample_every = sample_every
+        self.stats = SinkStats()
+        self._queue: collections.deque[Event] = collections.deque()
+        self._condition = threading.Condition()
+        self._pending = 0
+        self._sampled = 0
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._drain,
+            name=f"event-sink-{type(self).__name__}",
+            daemon=True,
+        )
+        self._thread.start()
+
+
+    @abc.abstractmethod
+    def _write(self, payload: bytes) -> None:
+        """Write one batch of NDJSON lines."""
+
+
+    def _shutdown(self) -> None:
+        """Release the output once the queue is drained."""
+
+
+    def emit(self, event: Event) -> None:
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("The event sink is closed.")
+            self.stats.emitted += 1
+
+            if self.overflow == "sample" and len(self._queue) >= self.queue_size // 2:
+                self._sampled += 1
+                if self._sampled % self.sample_every:
+                    self.stats.dropped += 1
+                    return
+
+            if len(self._queue) >= self.queue_size:
+                if self.overflow == "block":
+                    self._condition.wait_for(lambda: len(self._queue) < self.queue_size or self._closed)
+                    if self._closed:
+                        raise RuntimeError("The event sink is closed.")
+                else:
+                    self._queue.popleft()
+                    self._pending -= 1
+                    self.stats.dropped += 1
+
+            self._queue.append(event)
+            self._pending += 1
+            self._condition.notify_all()
+
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event has been written; False on timeout."""
+        with self._condition:
+            return self._condition.wait_for(lambda: self._pending == 0, timeout)
+
+
+    def close(self) -> None:
+        """Write out what is queued, then stop the writer."""
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        self._shutdown()
+
+
+    def __enter__(self) -> t.Self:
+        return self
+
+
+    def __exit__(self, *exc: t.Any) -> None:
+        self.close()
+
+
+    def _drain(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queue or self._closed)
+                if not self._queue:
+                    return
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._condition.notify_all()
+
+            try:
+                self._write(b"".join(event.model_dump_json().encode() + b"\n" for event in batch))
+            except Exception as e:
+                logger.warning("%s dropped %d events: %s", type(self).__name__, len(batch), e)
+                written = 0
+            else:
+                written = len(batch)
+
+            with self._condition:
+                self._pending -= len(batch)
+                self.stats.written += written
+                self.stats.dropped += len(batch) - written
+                self.stats.batches += 1
+                self._condition.notify_all()
+
+
+class StdoutSink(EventSink):
+    """NDJSON on standard output, one event per line."""
+
+    def __init__(self, **kwargs: t.Any) -> None:
+        self._stream = sys.stdout.buffer
+        super().__init__(**kwargs)
+
+
+    def _write(self, payload: bytes) -> None:
+        self._stream.write(payload)
+        self._stream.flush()
+
+
+class RotatingFileSink(EventSink):
+    """NDJSON appended to `path`, which is rotated to `path.1` ... `path.<backups>`
+    once it would grow beyond `max_bytes`. Batches are never split across files.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_bytes: int = 64 * 1024 * 1024,
+        backups: int = 5,
+        **kwargs: t.Any,
+    ) -> None:
+        self.path = pathlib.Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._file = self.path.open("ab")
+        super().__init__(**kwargs)
+
+
+    def _write(self, payload: bytes) -> None:
+        if self._file.tell() and self._file.tell() + len(payload) > self.max_bytes:
+            self._rotate()
+        self._file.write(payload)
+        self._file.flush()
+
+
+    def _rotate(self) -> None:
+        self._file.close()
+        if self.backups > 0:
+            for index in range(self.backups - 1, 0, -1):
+                source = self.path.with_name(f"{self.path.name}.{index}")
+                if source.exists():
+                    source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+            self._file = self.path.open("ab")
+        else:
+            self._file = self.path.open("wb")
+
+
+    def _shutdown(self) -> None:
+        self._file.close()
+
+
+class UnixSocketSink(EventSink):
+    """NDJSON streamed to a Unix stream socket listening at `path`.
+
+    The connection is opened lazily and re-opened after a failure; a batch
+    that cannot be sent is dropped rather than held back.
+    """
+
+    def __init__(self, path: str | os.PathLike[str], **kwargs: t.Any) -> None:
+        self.path = os.fspath(path)
+        self._socket: socket.socket | None = None
+        super().__init__(**kwargs)
+
+
+    def _write(self, payload: bytes) -> None:
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                self._socket.connect(self.path)
+            except OSError:
+                self._disconnect()
+                raise
+        try:
+            self._socket.sendall(payload)
+        except OSError:
+            self._disconnect()
+            raise
+
+
+    def _disconnect(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+
+    def _shutdown(self) -> None:
+        self._disconnect()
+
+
+class FanOutSink:
+    """Emits every event to several sinks."""
+
+    def __init__(self, sinks: t.Sequence[EventSink]) -> None:
+        self.sinks = list(sinks)
+
+
+    def emit(self, event: Event) -> None:
+        for sink in self.sinks:
+            sink.emit(event)
+
+
+    def flush(self, timeout: float | None = None) -> bool:
+        return all([sink.flush(timeout) for sink in self.sinks])
+
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            sink.close()
+
+
+    def __enter__(self) -> t.Self:
+        return self
+
+
+    def __exit__(self, *exc: t.Any) -> None:
+        self.close()
+
+
+class EventSinkPolicy(BaseModel):
+    """Settings for where run events are written."""
+
+    outputs: t.List[t.Literal["stdout", "file", "socket"]] = ["stdout"]
+    """The sinks every event goes to."""
+
+    file_path: str = ".data/events/events.ndjson"
+    """File of the file sink."""
+
+    file_max_bytes: int = 64 * 1024 * 1024
+    """Size at which the file sink rotates."""
+
+    file_backups: int = 5
+    """Rotated files kept by the file sink."""
+
+    socket_path: str = "/tmp/investment-events.sock"
+    """Unix socket the socket sink connects to."""
+
+    queue_size: int = 1024
+    """Events a sink holds before its overflow policy applies."""
+
+    batch_size: int = 256
+    """Most events serialized and written at once."""
+
+    overflow: OverflowPolicy = "block"
+    """What a sink does when its writer falls behind: block, drop_oldest or sample."""
+
+    sample_every: int = 10
+    """Events kept under the sample policy: one in this many."""
+
+
+    def build(self) -> FanOutSink:
+        queue = {
+            "queue_size": self.queue_size,
+            "batch_size": self.batch_size,
+            "overflow": self.overflow,
+            "sample_every": self.sample_every,
+        }
+        sinks: t.List[EventSink] = []
+        for output in self.outputs:
+            if output == "stdout":
+                sinks.append(StdoutSink(**queue))
+            elif output == "file":
+                sinks.append(
+                    RotatingFileSink(
+                        self.file_path,
+                        max_bytes=self.file_max_bytes,
+                        backups=self.file_backups,
+                        **queue,
+                    )
+                )
+            else:
+                sinks.append(UnixSocketSink(self.socket_path, **queue))
+        return FanOutSink(sinks)
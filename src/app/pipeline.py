@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import time
+import typing as t
+from concurrent import futures
+
+from src.base import BaseModel
+
+from .event import Event
+
+
+class StageTiming(BaseModel):
+
+    stage: str
+    """The name of the stage."""
+
+    started_at: float
+    """Seconds between the start of the pipeline and the start of this stage."""
+
+    elapsed: float
+    """Seconds the stage ran for."""
+
+
+class StageResult(t.NamedTuple):
+    stage: str
+    """The name of the finished stage."""
+
+    value: t.Any
+    """What the stage returned."""
+
+    timing: StageTiming
+    """When the stage ran and for how long."""
+
+
+def _timed(fn: t.Callable[..., t.Any], kwargs: dict[str, t.Any]) -> t.Tuple[t.Any, float, float]:
+    started = time.perf_counter()
+    result = fn(**kwargs)
+    return result, started, time.perf_counter()
+
+
+class _Stage(t.NamedTuple):
+    fn: t.Callable[..., t.Any]
+    inputs: t.Tuple[str, ...]
+    output: str | None
+    event: t.Callable[[t.Any], Event] | None
+
+
+class Pipeline:
+    """A dependency graph of stages.
+
+    Each stage declares the values it reads (`inputs`, passed as keyword
+    arguments) and the value it produces (`output`). A stage starts on the
+    executor as soon as all of its inputs exist, so stages that do not depend
+    on each other run concurrently. `stream` yields each stage's result as it
+    completes; `run` turns these into the stage's event, if it has one,
+    followed by a `StageFinished` timing event. A failing stage cancels the
+    stages not started yet and its exception propagates out of the iteration.
+    With a process pool, stage functions and values must be picklable.
+    """
+
+    def __init__(self) -> None:
+        self._stages: dict[str, _Stage] = {}
+        self._producers: dict[str, str] = {}
+
+
+    def add(
+        self,
+        name: str,
+        fn: t.Callable[..., t.Any],
+        *,
+        inputs: t.Sequence[str] = (),
+        output: str | None = None,
+        event: t.Callable[[t.Any], Event] | None = None,
+    ) -> None:
+        if name in self._stages:
+            raise ValueError(f"Stage '{name}' is already registered.")
+        if output is not None and output in self._producers:
+            raise ValueError(f"Output '{output}' is already produced by stage '{self._producers[output]}'.")
+        self._stages[name] = _Stage(fn=fn, inputs=tuple(inputs), output=output, event=event)
+        if output is not None:
+            self._producers[output] = name
+
+
+    @property
+    def outputs(self) -> t.FrozenSet[str]:
+        """The values produced by the stages."""
+        return frozenset(self._producers)
+
+
+    def stream(
+        self,
+        executor: futures.Executor,
+        **values: t.Any,
+    ) -> t.Generator[StageResult, None, dict[str, t.Any]]:
+        """Run every stage, starting from the given `values`, yielding each result as it completes.
+
+        Returns (as the generator's value, e.g. `results = yield from ...`)
+        the given values together with every stage output.
+        """
+        for key in values:
+            if key in self._producers:
+                raise ValueError(f"'{key}' is produced by stage '{self._producers[key]}' and cannot be given.")
+        for name, stage in self._stages.items():
+            for key in stage.inputs:
+                if key not in values and key not in self._producers:
+                    raise ValueError(f"Stage '{name}' reads '{key}', which is neither given nor produced.")
+
+        origin = time.perf_counter()
+        results = dict(values)
+        running: dict[futures.Future[t.Tuple[t.Any, float, float]], str] = {}
+        waiting = dict(self._stages)
+
+        def _submit_ready() -> None:
+            for name, stage in list(waiting.items()):
+                if all(key in results for key in stage.inputs):
+                    kwargs = {key: results[key] for key in stage.inputs}
+                    running[executor.submit(_timed, stage.fn, kwargs)] = name
+                    del waiting[name]
+
+        _submit_ready()
+        try:
+            while running:
+                done, _ = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    stage = self._stages[name]
+                    value, started, finished = future.result()
+                    if stage.output is not None:
+                        results[stage.output] = value
+                    yield StageResult(
+                        stage=name,
+                        value=value,
+                        timing=StageTiming(
+                            stage=name,
+                            started_at=started - origin,
+                            elapsed=finished - started,
+                        ),
+                    )
+                _submit_ready()
+        finally:
+            for future in running:
+                future.cancel()
+
+        if waiting:
+            raise ValueError(f"Stages {sorted(waiting)} wait on each other's outputs.")
+        return results
+
+
+    def run(
+        self,
+        executor: futures.Executor,
+        run_id: str,
+        **values: t.Any,
+    ) -> t.Generator[Event, None, dict[str, t.Any]]:
+        """`stream` as events: each stage's own event, then its `StageFinished` timing."""
+        results = yield from self._events(self.stream(executor, **values), run_id)
+        return results
+
+
+    def _events(
+        self,
+        stream: t.Generator[StageResult, None, dict[str, t.Any]],
+        run_id: str,
+    ) -> t.Generator[Event, None, dict[str, t.Any]]:
+        while True:
+            try:
+                result = next(stream)
+            except StopIteration as stop:
+                return stop.value
+            event = self._stages[result.stage].event
+            if event is not None:
+                yield event(result.value)
+            yield Event.StageFinished(run_id, timing=result.timing.to_dict())
@@ -1,4 +1,6 @@
+import threading
 import typing as t
+from concurrent import futures
 
 from src.client import (
     UpbitClient, 
@@ -7,13 +9,51 @@ from src.client import (
 
 from .config import AppConfig
 from .event import Event
-from .service.market import MarketService
+from .pipeline import Pipeline
+from .schedule import RefreshTracker, Schedule
+from .service.market import (
+    MarketData,
+    MarketDataEncoder,
+    MarketService,
+    CandleStore,
+    FearAndGreedStore,
+    Source,
+    SOURCES,
+)
+from .service.backtest import Backtester
 from .service.sentiment import SentimentAnalyzer
-from .service.technical import TechnicalAnalyzer
+from .service.technical import TechnicalAnalyzer, TechnicalScanner
 from .service.strategy import StrategyExecutor
 from .service.executor import ExecutorService
 
 
+def _ticker_version(data: MarketData) -> t.Hashable:
+    return frozenset((ticker.market, ticker.trade_timestamp) for ticker in data.tickers)
+
+
+def _candle_version(data: MarketData) -> t.Hashable:
+    # Candles are newest first; only the newest, still-open one is revised.
+    if not data.candles:
+        return ()
+    newest = data.candles[0]
+    return len(data.candles), newest.candle_date_time_utc, newest.timestamp
+
+
+def _fng_version(data: MarketData) -> t.Hashable:
+    entries = data.fear_and_greed.entries
+    if not entries:
+        return ()
+    return len(entries), entries[0].timestamp, entries[0].value
+
+
+_SOURCE_VERSIONS: dict[Source, t.Callable[[MarketData], t.Hashable]] = {
+    "tickers": _ticker_version,
+    "candles": _candle_version,
+    "fng": _fng_version,
+}
+"""Cheap keys per source that change whenever a refresh brought new data."""
+
+
 class Runner: 
 
     def __init__(
@@ -21,16 +61,38 @@ class Runner:
         config: AppConfig,
         upbit_client: UpbitClient,
         alternative_client: AlternativeClient,
+        *,
+        stage_workers: int = 4,
     ) -> None:
+        self.config = config
         self.market_service = MarketService(
             config, 
             upbit_client, 
-            alternative_client
+            alternative_client,
+            candle_store=CandleStore(config.candle_store) if config.candle_store else None,
+            fng_store=FearAndGreedStore(config.fng_store) if config.fng_store else None,
         )
         self.sentiment_analyzer = SentimentAnalyzer(config)
-        self.technical_analyzer = TechnicalAnalyzer(config)
         self.strategy_executor = StrategyExecutor(config)
+        self.technical_analyzer = TechnicalAnalyzer(
+            config,
+            indicators=self.strategy_executor.indicators,
+        )
         self.executor_service = ExecutorService(config)
+        self.technical_scanner = TechnicalScanner(
+            config,
+            indicators=self.strategy_executor.indicators,
+        )
+        self.backtester = Backtester(
+            config,
+            technical_analyzer=self.technical_analyzer,
+            sentiment_analyzer=self.sentiment_analyzer,
+            scanner=self.technical_scanner,
+        )
+        self._stage_executor = futures.ThreadPoolExecutor(
+            max_workers=stage_workers,
+            thread_name_prefix="pipeline-stage",
+        )
 
     
     def run(
@@ -42,17 +104,200 @@ class Runner:
 
         data = self.market_service.get_data("KRW")
         yield Event.MarketDataFetched(data=data.to_dict())
-        
-        sentiment_artifact = self.sentiment_analyzer.analyze(data=data)
-        yield Event.SentimentAnalyzed(artifact=sentiment_artifact.to_dict())
-        
-        technical_artifact = self.technical_analyzer.analyze(data=data)
-        yield Event.TechnicalAnalyzed(artifact=technical_artifact.to_dict())
 
-        strategy_artifact = self.strategy_executor.execute(
-            sentiment_artifact, 
-            technical_artifact
+        pipeline = self._pipeline(self.technical_analyzer)
+        yield from pipeline.run(self._stage_executor, run_id, data=data)
+
+
+    def scan(
+        self,
+        run_id: str = "default_run",
+        *,
+        top_n: int | None = None,
+    ) -> t.Iterable[Event]:
+        """Technical analysis of the `top_n` validated tickers (all when None)."""
+
+        yield Event.Start(run_id=run_id)
+
+        data = self.market_service.get_data("KRW")
+        yield Event.MarketDataFetched(data=data.to_dict())
+
+        markets = [
+            validated.ticker.market
+            for validated in data.get_validated_tickers(top_n=top_n)
+        ]
+        frames = self.market_service.get_frames(markets)
+        scan_artifact = self.technical_scanner.scan(frames)
+        yield Event.TechnicalScanned(artifact=scan_artifact.to_dict())
+
+
+    def backtest(
+        self,
+        run_id: str = "default_run",
+        *,
+        top_n: int | None = None,
+    ) -> t.Iterable[Event]:
+        """Backtest the `top_n` validated tickers (all when None) over their stored history."""
+
+        yield Event.Start(run_id=run_id)
+
+        data = self.market_service.get_data("KRW")
+        yield Event.MarketDataFetched(data=data.to_dict())
+
+        markets = [
+            validated.ticker.market
+            for validated in data.get_validated_tickers(top_n=top_n)
+        ]
+        frames, fear_and_greed = self.market_service.get_history(markets)
+        backtest_artifact = self.backtester.run(frames, fear_and_greed)
+        yield Event.Backtested(run_id, artifact=backtest_artifact.to_dict())
+
+
+    def serve(
+        self,
+        run_id: str = "default_run",
+        *,
+        stop: threading.Event | None = None,
+    ) -> t.Iterable[Event]:
+        """Run on the fixed schedule of `config.schedule` until `stop` is set.
+
+        Clients, stores and analyzers stay alive between ticks. A tick only
+        refreshes the sources whose cadence is due, and a stage only re-runs
+        when a source it reads changed: sentiment on new Fear & Greed entries,
+        technical analysis on new candles (incrementally, with a streaming
+        analyzer), and the strategy when either artifact was renewed. A failed
+        refresh or analysis is reported and retried on the next tick. With
+        `config.market_events.delta`, market data goes out as
+        `MarketDataDelta` events carrying only what changed.
+        """
+        schedule = self.config.schedule
+        tracker = RefreshTracker(
+            {
+                "tickers": schedule.tickers,
+                "candles": schedule.candles,
+                "fng": schedule.fng,
+            }
         )
-        
-        self.executor_service.act_on_strategy(strategy_artifact)
-    
\ No newline at end of file
+        technical_analyzer = TechnicalAnalyzer(
+            self.config,
+            indicators=self.strategy_executor.indicators,
+            streaming=True,
+        )
+        encoder = (
+            MarketDataEncoder(snapshot_every=self.config.market_events.snapshot_every)
+            if self.config.market_events.delta
+            else None
+        )
+        data: MarketData | None = None
+        artifacts: dict[str, t.Any] = {}
+        # Sources whose analysis has not succeeded since they last changed.
+        stale: t.Set[str] = set()
+
+        yield Event.Start(run_id=run_id)
+
+        for tick in Schedule(schedule.tick_seconds, stop=stop):
+            due = tracker.due(tick.wall)
+            if not due:
+                continue
+
+            try:
+                if data is None:
+                    refreshed = self.market_service.get_data("KRW")
+                    changed = list(SOURCES)
+                else:
+                    refreshed = self.market_service.refresh(data, due)
+                    changed = [
+                        source
+                        for source in due
+                        if _SOURCE_VERSIONS[source](refreshed) != _SOURCE_VERSIONS[source](data)
+                    ]
+            except Exception as e:
+                yield Event.TickFailed(run_id, tick=tick.number, error=e)
+                continue
+
+            data = refreshed
+            tracker.mark(due, tick.wall)
+            yield Event.Tick(
+                run_id,
+                tick=tick.number,
+                lag=tick.lag,
+                skipped=tick.skipped,
+                refreshed=due,
+                changed=changed,
+            )
+            if changed and encoder is not None:
+                yield Event.MarketDataDelta(run_id, delta=encoder.encode(data).to_dict())
+            elif changed:
+                yield Event.MarketDataFetched(data=data.to_dict())
+
+            stale.update(source for source in changed if source in ("fng", "candles"))
+            if not stale:
+                continue
+            pipeline = self._pipeline(
+                technical_analyzer,
+                sentiment="fng" in stale,
+                technical="candles" in stale,
+            )
+            try:
+                results = yield from pipeline.run(
+                    self._stage_executor,
+                    run_id,
+                    data=data,
+                    **{key: value for key, value in artifacts.items() if key not in pipeline.outputs},
+                )
+            except Exception as e:
+                yield Event.TickFailed(run_id, tick=tick.number, error=e)
+                continue
+            artifacts = {
+                key: results[key]
+                for key in ("sentiment_artifact", "technical_artifact")
+            }
+            stale.clear()
+
+
+    def _pipeline(
+        self,
+        technical_analyzer: TechnicalAnalyzer,
+        *,
+        sentiment: bool = True,
+        technical: bool = True,
+    ) -> Pipeline:
+        """The stages after the fetch: sentiment and technical analysis of
+        `data` side by side, then the strategy once both artifacts exist.
+        Left-out analyses have to be given their artifact when run.
+        """
+        pipeline = Pipeline()
+        if sentiment:
+            pipeline.add(
+                "sentiment",
+                self.sentiment_analyzer.analyze,
+                inputs=["data"],
+                output="sentiment_artifact",
+                event=lambda artifact: Event.SentimentAnalyzed(artifact=artifact.to_dict()),
+            )
+        if technical:
+            pipeline.add(
+                "technical",
+                technical_analyzer.analyze,
+                inputs=["data"],
+                output="technical_artifact",
+                event=lambda artifact: Event.TechnicalAnalyzed(artifact=artifact.to_dict()),
+            )
+        pipeline.add(
+            "strategy",
+            self.strategy_executor.execute,
+            inputs=["sentiment_artifact", "technical_artifact"],
+            output="strategy_artifact",
+        )
+        pipeline.add(
+            "execution",
+            self.executor_service.act_on_strategy,
+            inputs=["strategy_artifact"],
+        )
+        return pipeline
+
+
+    def close(self) -> None:
+        self._stage_executor.shutdown(wait=False, cancel_futures=True)
+        self.technical_scanner.close()
+        self.market_service.close()
@@ -0,0 +1,103 @@
+"""Fixed-rate ticks and per-source refresh cadences for long-running runs."""
+from __future__ import annotations
+
+import math
+import threading
+import time
+import typing as t
+
+from src.base import BaseModel
+
+
+class Tick(t.NamedTuple):
+    number: int
+    """Ticks since the schedule started, counting skipped ones."""
+
+    wall: float
+    """Wall-clock time (epoch seconds) the tick fired at."""
+
+    lag: float
+    """Seconds between the tick's deadline and the moment it fired."""
+
+    skipped: int
+    """Ticks dropped right before this one because the previous one overran."""
+
+
+class Schedule:
+    """Ticks every `period` seconds without drift.
+
+    Tick n is due at `start + n * period` on the monotonic clock, so time spent
+    handling a tick does not push the following ones back. When a tick overruns
+    one or more periods, the missed deadlines are skipped rather than fired in
+    a burst. Setting `stop` ends the iteration, also in the middle of a wait.
+    """
+
+    def __init__(
+        self,
+        period: float,
+        *,
+        stop: threading.Event | None = None,
+    ) -> None:
+        if period <= 0:
+            raise ValueError("Tick period must be positive.")
+        self.period = period
+        self.stop = stop or threading.Event()
+
+
+    def __iter__(self) -> t.Iterator[Tick]:
+        start = time.monotonic()
+        number = 0
+        while not self.stop.is_set():
+            deadline = start + number * self.period
+            if self.stop.wait(max(0.0, deadline - time.monotonic())):
+                return
+            now = time.monotonic()
+            lag = now - deadline
+            skipped = int(lag // self.period)
+            if skipped:
+                number += skipped
+                lag -= skipped * self.period
+            yield Tick(number=number, wall=time.time(), lag=lag, skipped=skipped)
+            number += 1
+
+
+class Cadence(BaseModel):
+    """How often one data source is refreshed.
+
+    Wall-clock time is cut into slots of `interval` seconds shifted by `offset`
+    (UTC, epoch aligned); a source is due once per slot. An interval of 86400
+    with an offset of a few seconds thus refreshes right after every daily
+    candle close at 00:00 UTC, whenever the run was started.
+    """
+
+    interval: float
+    """Seconds between refreshes."""
+
+    offset: float = 0.0
+    """Seconds after each slot boundary at which the refresh is due."""
+
+
+    def slot(self, wall: float) -> int:
+        return math.floor((wall - self.offset) / self.interval)
+
+
+class RefreshTracker:
+    """Remembers the slot each source was last refreshed in."""
+
+    def __init__(self, cadences: t.Mapping[str, Cadence]) -> None:
+        self.cadences = dict(cadences)
+        self._slots: dict[str, int] = {}
+
+
+    def due(self, wall: float) -> t.List[str]:
+        """Sources whose current slot has not been refreshed yet, in cadence order."""
+        return [
+            source
+            for source, cadence in self.cadences.items()
+            if self._slots.get(source) != cadence.slot(wall)
+        ]
+
+
+    def mark(self, sources: t.Iterable[str], wall: float) -> None:
+        for source in sources:
+            self._slots[source] = self.cadences[source].slot(wall)
@@ -0,0 +1,6 @@
+from .api import Backtester
+from .artifact import BacktestArtifact, BacktestReport, BacktestSummary
+from .signals import SignalFn, trend_sentiment_signal
+
+
+__all__ = ['Backtester', 'BacktestArtifact', 'BacktestReport', 'BacktestSummary', 'SignalFn', 'trend_sentiment_signal']
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import array
+import itertools
+import math
+import operator
+import time
+import typing as t
+
+from .artifact import (
+    BacktestArtifact,
+    BacktestReport,
+    BacktestSummary,
+)
+from .signals import SignalFn, trend_sentiment_signal
+from ..market import FearAndGreedData, OHLCVFrame
+from ..sentiment import SentimentAnalyzer
+from ..technical import TechnicalAnalyzer, TechnicalArtifact, TechnicalScanner
+from ...config import AppConfig
+
+
+def _target(value: float) -> float:
+    return 0.0 if math.isnan(value) else min(1.0, max(0.0, value))
+
+
+def _forward_fill(previous: float, value: float) -> float:
+    return previous if math.isnan(value) else value
+
+
+class _Sleeve(t.NamedTuple):
+    timestamps: "array.array[int] | memoryview"
+    equity: "array.array[float]"
+    traded: float
+    trades: int
+    fees: float
+
+
+class Backtester:
+    """Replays stored history through the live analyzers and simulates a strategy.
+
+    Every market is analyzed once over its whole history with the batch
+    `TechnicalAnalyzer` (or a `TechnicalScanner` for many markets), and the
+    Fear & Greed history once with `SentimentAnalyzer.analyze_history`. The
+    signal then maps these columns to a target position per candle, and the
+    simulation runs over whole columns with C-level iterators:
+
+    - a target decided at a close is filled at the next candle's open, so
+      signals never trade on the candle they were computed from;
+    - the previous position carries the gap from close to open, the new one
+      the move from open to close;
+    - every fill pays `fee + slippage` on the traded value;
+    - positions are held as a constant fraction of the market's equity.
+
+    Each market trades its own equal share of `initial_capital`; the
+    portfolio is the sum of these sleeves.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        *,
+        technical_analyzer: TechnicalAnalyzer | None = None,
+        sentiment_analyzer: SentimentAnalyzer | None = None,
+        scanner: TechnicalScanner | None = None,
+        signal_fn: SignalFn | None = None,
+    ) -> None:
+        self.config = config
+        self.technical_analyzer = technical_analyzer or TechnicalAnalyzer(config)
+        self.sentiment_analyzer = sentiment_analyzer or SentimentAnalyzer(config)
+        self.scanner = scanner
+        self.signal_fn: SignalFn = signal_fn or trend_sentiment_signal
+        if self.technical_analyzer.streaming:
+            raise ValueError("Backtests need a batch TechnicalAnalyzer, not a streaming one.")
+
+
+    def run(
+        self,
+        frames: t.Mapping[str, OHLCVFrame],
+        fear_and_greed: FearAndGreedData,
+    ) -> BacktestArtifact:
+        started = time.perf_counter()
+        frames = {market: frame for market, frame in frames.items() if len(frame) >= 2}
+        if not frames:
+            raise ValueError("Backtests need at least one market with two or more candles.")
+
+        policy = self.config.backtest
+        sentiment = self.sentiment_analyzer.analyze_history(
+            fear_and_greed,
+            regime_window=policy.regime_window,
+        )
+        technicals = self._analyze(frames)
+
+        capital = policy.initial_capital / len(frames)
+        sleeves = {
+            market: self._simulate(
+                frame,
+                self.signal_fn(frame, technicals[market], sentiment),
+                capital,
+            )
+            for market, frame in frames.items()
+        }
+
+        return BacktestArtifact(
+            portfolio=self._portfolio(sleeves, capital),
+            markets={
+                market: BacktestSummary(**self._summarize(sleeve, capital))
+                for market, sleeve in sleeves.items()
+            },
+            elapsed=time.perf_counter() - started,
+        )
+
+
+    def _analyze(self, frames: t.Mapping[str, OHLCVFrame]) -> t.Mapping[str, TechnicalArtifact]:
+        if self.scanner is not None:
+            return self.scanner.scan(frames).artifacts
+        return {market: self.technical_analyzer.analyze_frame(frame) for market, frame in frames.items()}
+
+
+    def _simulate(
+        self,
+        frame: OHLCVFrame,
+        targets: t.Sequence[float],
+        capital: float,
+    ) -> _Sleeve:
+        if len(targets) != len(frame):
+            raise ValueError(f"The signal returned {len(targets)} targets for {len(frame)} candles.")
+        cost = self.config.backtest.fee + self.config.backtest.slippage
+
+        # Position held through each candle's session, and the one before it.
+        held = array.array("d", [0.0])
+        held.extend(map(_target, targets[:-1]))
+        previous = array.array("d", [0.0]) + held[:-1]
+
+        gaps = array.array("d", [1.0])
+        gaps.extend(map(operator.truediv, frame.open[1:], frame.close[:-1]))
+        sessions = array.array("d", map(operator.truediv, frame.close, frame.open))
+        traded = array.array("d", map(abs, map(operator.sub, held, previous)))
+
+        # Equity factor through the gap from the previous close to this open.
+        carried = array.array("d", map(lambda before, gap: 1.0 + before * (gap - 1.0), previous, gaps))
+        growth = map(
+            lambda carry, after, session, turnover: (
+                carry * (1.0 - turnover * cost) * (1.0 + after * (session - 1.0))
+            ),
+            carried, held, sessions, traded,
+        )
+        equity = array.array("d", itertools.accumulate(growth, operator.mul, initial=capital))
+        # Fills happen at the open, on the equity carried through the gap.
+        at_open = map(operator.mul, equity[:-1], carried)
+        traded_value = math.fsum(map(operator.mul, traded, at_open))
+
+        return _Sleeve(
+            timestamps=frame.timestamp,
+            equity=equity[1:],
+            traded=traded_value,
+            trades=len(traded) - traded.count(0.0),
+            fees=traded_value * cost,
+        )
+
+
+    @staticmethod
+    def _drawdown(equity: t.Sequence[float]) -> "array.array[float]":
+        peaks = itertools.accumulate(equity, max)
+        return array.array("d", map(lambda value, peak: value / peak - 1.0, equity, peaks))
+
+
+    def _summarize(self, sleeve: _Sleeve, capital: float) -> dict[str, t.Any]:
+        drawdown = self._drawdown(sleeve.equity)
+        mean_equity = math.fsum(sleeve.equity) / len(sleeve.equity)
+        return {
+            "bars": len(sleeve.equity),
+            "start": sleeve.timestamps[0],
+            "end": sleeve.timestamps[-1],
+            "total_return": sleeve.equity[-1] / capital - 1.0,
+            "max_drawdown": min(drawdown),
+            "turnover": sleeve.traded / mean_equity,
+            "trades": sleeve.trades,
+            "fees": sleeve.fees,
+        }
+
+
+    def _portfolio(self, sleeves: t.Mapping[str, _Sleeve], capital: float) -> BacktestReport:
+        """Sum the sleeves on the union of their candle times. A sleeve holds its
+        starting capital before its first candle and its last equity after it.
+        """
+        timestamps = sorted(set(itertools.chain.from_iterable(sleeve.timestamps for sleeve in sleeves.values())))
+        index = {timestamp: i for i, timestamp in enumerate(timestamps)}
+        total = array.array("d", [0.0]) * len(timestamps)
+
+        for sleeve in sleeves.values():
+            values = array.array("d", [math.nan]) * len(timestamps)
+            for timestamp, value in zip(sleeve.timestamps, sleeve.equity):
+                values[index[timestamp]] = value
+            filled = itertools.accumulate(values, _forward_fill, initial=capital)
+            next(filled)
+            total = array.array("d", map(operator.add, total, filled))
+
+        portfolio = _Sleeve(
+            timestamps=array.array("q", timestamps),
+            equity=total,
+            traded=math.fsum(sleeve.traded for sleeve in sleeves.values()),
+            trades=sum(sleeve.trades for sleeve in sleeves.values()),
+            fees=math.fsum(sleeve.fees for sleeve in sleeves.values()),
+        )
+        summary = self._summarize(portfolio, capital * len(sleeves))
+        return BacktestReport(
+            **summary,
+            timestamps=timestamps,
+            equity=total.tolist(),
+            drawdown=self._drawdown(total).tolist(),
+        )
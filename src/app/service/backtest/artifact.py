@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import typing as t
+
+from src.base import BaseModel
+
+
+class BacktestSummary(BaseModel):
+
+    bars: int
+    """Candles replayed."""
+
+    start: int
+    """Epoch seconds (UTC) of the first candle."""
+
+    end: int
+    """Epoch seconds (UTC) of the last candle."""
+
+    total_return: float
+    """Final equity over initial capital, minus one."""
+
+    max_drawdown: float
+    """The deepest fall from a running equity peak, as a negative fraction."""
+
+    turnover: float
+    """Traded value over mean equity; 2.0 is one full round trip of the capital."""
+
+    trades: int
+    """Candles on which the position changed."""
+
+    fees: float
+    """Fees and slippage paid, in KRW."""
+
+
+class BacktestReport(BacktestSummary):
+
+    timestamps: t.List[int]
+    """Epoch seconds (UTC) of each candle, ascending."""
+
+    equity: t.List[float]
+    """Equity in KRW at each close."""
+
+    drawdown: t.List[float]
+    """Fall from the running equity peak at each close, as a negative fraction."""
+
+
+class BacktestArtifact(BaseModel):
+
+    portfolio: BacktestReport
+    """All markets together, with equal starting capital per market."""
+
+    markets: t.Dict[str, BacktestSummary]
+    """The result of every market on its own capital sleeve, by market code."""
+
+    elapsed: float
+    """Seconds spent on analysis and simulation, excluding data loading."""
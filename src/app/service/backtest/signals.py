@@ -0,0 +1,53 @@
+"""Signals turn a market's analysis into target positions, one per candle.
+
+A target is the fraction of the market's capital to hold from the next
+candle's open on: 0 is flat, 1 fully invested. NaN counts as flat and
+values are clipped to [0, 1]. Signals see whole columns at once and are
+expected to compute over them in one pass rather than candle by candle.
+"""
+from __future__ import annotations
+
+import array
+import math
+import typing as t
+
+from ..market.ohlcv import OHLCVFrame
+from ..sentiment import SentimentSeries
+from ..technical import TechnicalArtifact
+
+_DAY = 86_400
+
+
+class SignalFn(t.Protocol):
+    def __call__(
+        self,
+        frame: OHLCVFrame,
+        technical: TechnicalArtifact,
+        sentiment: SentimentSeries,
+    ) -> t.Sequence[float]:
+        ...
+
+
+def sentiment_by_candle(frame: OHLCVFrame, sentiment: SentimentSeries) -> t.List[str | None]:
+    """The sentiment regime in effect on each candle's UTC day; None without an entry."""
+    regimes = dict(zip((timestamp // _DAY for timestamp in sentiment.timestamps), sentiment.regimes))
+    return list(map(regimes.get, (timestamp // _DAY for timestamp in frame.timestamp)))
+
+
+def trend_sentiment_signal(
+    frame: OHLCVFrame,
+    technical: TechnicalArtifact,
+    sentiment: SentimentSeries,
+) -> "array.array[float]":
+    """Long while the close is above the trend SMA (`ma_period`), except in an
+    Extreme Greed regime, where profits are taken; flat otherwise.
+    """
+    sma = technical.metrix.sma.series
+    regimes = sentiment_by_candle(frame, sentiment)
+
+    def target(close: float, average: float | None, regime: str | None) -> float:
+        if average is None or math.isnan(average):
+            return 0.0
+        return 1.0 if close > average and regime != "Extreme Greed" else 0.0
+
+    return array.array("d", map(target, frame.close, sma, regimes))
@@ -1,5 +1,10 @@
-from .api import MarketService
-from .data import MarketData
-from .ohlcv import OHLCV, OHLCVData
+from .api import MarketService, Source, SOURCES
+from .data import MarketData, FearAndGreedData
+from .delta import MarketDataDelta, MarketDataEncoder, MarketDataDecoder
+from .fng_store import FearAndGreedStore
+from .ohlcv import OHLCV, OHLCVData, OHLCVFrame
+from .plan import FetchPlan, FetchTimings
+from .shared import SharedFrames
+from .store import CandleStore, CandleColumns
 
-__all__ = ['MarketService', 'MarketData', 'OHLCV', 'OHLCVData']
\ No newline at end of file
+__all__ = ['MarketService', 'Source', 'SOURCES', 'MarketData', 'FearAndGreedData', 'MarketDataDelta', 'MarketDataEncoder', 'MarketDataDecoder', 'FearAndGreedStore', 'OHLCV', 'OHLCVData', 'OHLCVFrame', 'FetchPlan', 'FetchTimings', 'SharedFrames', 'CandleStore', 'CandleColumns']
\ No newline at end of file
@@ -1,9 +1,25 @@
+import datetime as dt
+import typing as t
+from concurrent import futures
+
 from src.client import UpbitClient, AlternativeClient
+from src.client.upbit.types import Candle, Market, Ticker
 
 from .data import FearAndGreedData, MarketData
+from .fng_store import FearAndGreedStore
+from .ohlcv import OHLCVFrame
+from .plan import FetchPlan
+from .store import CandleStore
 from ...config import AppConfig
 from ...types import CurrencyType
 
+
+Source = t.Literal["tickers", "candles", "fng"]
+"""A data source of `MarketData` that can be refreshed on its own."""
+
+SOURCES: t.Tuple[Source, ...] = ("tickers", "candles", "fng")
+
+
 class MarketService: 
 
 
@@ -12,30 +28,154 @@ class MarketService:
         config: AppConfig,
         upbit: UpbitClient,
         alternative: AlternativeClient,
+        *,
+        candle_store: CandleStore | None = None,
+        fng_store: FearAndGreedStore | None = None,
+        max_workers: int = 4,
     ) -> None:
         self.config = config
         self.upbit = upbit
         self.alternative = alternative
+        self.candle_store = candle_store
+        self.fng_store = fng_store
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="market-fetch",
+        )
 
 
     def get_data(self, currency: CurrencyType) -> MarketData:
+        """Fetch a market snapshot.
 
-        tickers = self.upbit.v1.ticker.get_all(
-            ",".join(
-                market.market 
-                for market in self.upbit.v1.market.get_all() 
-                if market.quote_currency == currency
-            )
-        )
-        candles = self.upbit.v1.candles.get_by_days(
-            market="KRW-BTC",
-            count=200,
-        )
-        fng_entries = self.alternative.fng.get()
+        Candles and the fear and greed index do not depend on anything and
+        start immediately; tickers start as soon as the market list arrives.
+        """
+        results, timings = self._plan(currency, SOURCES).run(self._executor)
         return MarketData(
             currency=currency,
-            tickers=tickers,
-            candles=candles,
-            fear_and_greed=FearAndGreedData(entries=fng_entries.data),
+            tickers=results["tickers"],
+            candles=results["candles"],
+            fear_and_greed=results["fng"],
+            timings=timings,
+        )
+
+
+    def refresh(
+        self,
+        data: MarketData,
+        sources: t.Iterable[Source],
+    ) -> MarketData:
+        """A copy of `data` in which only `sources` are fetched again.
+
+        Long-running loops use it to refresh each source on its own cadence
+        instead of re-downloading the whole snapshot every tick.
+        """
+        sources = set(sources)
+        if not sources:
+            return data
+
+        results, timings = self._plan(data.currency, sources).run(self._executor)
+        return data.model_copy(
+            update={
+                "tickers": results.get("tickers", data.tickers),
+                "candles": results.get("candles", data.candles),
+                "fear_and_greed": results.get("fng", data.fear_and_greed),
+                "timings": timings,
+            }
         )
+
+
+    def _plan(self, currency: CurrencyType, sources: t.Collection[Source]) -> FetchPlan:
+
+        def _tickers(markets: t.List[Market]) -> t.List[Ticker]:
+            return self.upbit.v1.ticker.get_all(
+                [
+                    market.market 
+                    for market in markets 
+                    if market.quote_currency == currency
+                ]
+            )
+
+        plan = FetchPlan()
+        if "tickers" in sources:
+            plan.add("markets", self.upbit.v1.market.get_all)
+            plan.add("tickers", _tickers, depends_on=["markets"])
+        if "candles" in sources:
+            plan.add("candles", lambda: self._get_candles(market="KRW-BTC", count=200))
+        if "fng" in sources:
+            plan.add("fng", self._get_fear_and_greed)
+        return plan
+
+
+    def get_frames(
+        self,
+        markets: t.Iterable[str],
+        *,
+        count: int = 200,
+    ) -> dict[str, OHLCVFrame]:
+        """Daily candles of many markets as frames, for a universe scan.
+
+        Requests run on the fetch pool; the client's rate limiter keeps them
+        within the candle group's limit however many markets are asked for.
+        """
+        markets = list(markets)
+        candles = self._executor.map(lambda market: self._get_candles(market=market, count=count), markets)
+        return {market: OHLCVFrame.from_candles(page) for market, page in zip(markets, candles)}
+
+
+    def get_history(
+        self,
+        markets: t.Iterable[str],
+    ) -> t.Tuple[dict[str, OHLCVFrame], FearAndGreedData]:
+        """The full daily history of `markets` and of the Fear & Greed index,
+        for backtests. Needs both stores configured.
+
+        Candle series are backfilled to the start of each market's history
+        (one request per market once complete) and synced to the present.
+        """
+        if self.candle_store is None or self.fng_store is None:
+            raise ValueError("Backtests need both `candle_store` and `fng_store` configured.")
+        candle_store = self.candle_store
+
+        def _frame(market: str) -> OHLCVFrame:
+            candle_store.backfill(self.upbit, market, "days")
+            candle_store.sync(self.upbit, market, "days")
+            with candle_store.read(market, "days") as columns:
+                return OHLCVFrame.from_columns(columns)
+
+        markets = list(markets)
+        frames = self._executor.map(_frame, markets)
+        self.fng_store.sync(self.alternative)
+        return dict(zip(markets, frames)), self.fng_store.history()
+
+
+    def _get_candles(self, *, market: str, count: int) -> t.List[Candle]:
+        """Daily candles, newest first; served from the candle store when one is configured,
+        in which case only candles since the last stored one are downloaded. An empty
+        store starts with the last `count` days; older history is left to `get_history`.
+        """
+        if self.candle_store is None:
+            return self.upbit.v1.candles.get_by_days(market=market, count=count)
+
+        today = dt.datetime.now(dt.timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        self.candle_store.sync(
+            self.upbit,
+            market,
+            "days",
+            start=today - dt.timedelta(days=count - 1),
+        )
+        return self.candle_store.candles(market, "days", count=count)
+
+
+    def _get_fear_and_greed(self, *, count: int = 10) -> FearAndGreedData:
+        """The latest daily entries, newest first; from the history store when one is configured."""
+        if self.fng_store is None:
+            return FearAndGreedData(entries=self.alternative.fng.get(limit=count).data)
+
+        self.fng_store.sync(self.alternative)
+        return self.fng_store.history(count=count)
+
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
         
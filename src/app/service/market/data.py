@@ -1,25 +1,32 @@
+import functools
 import typing as t
 import datetime as dt
 
 from src.base import BaseModel
-from src.client.upbit.types import Ticker, Candle
+from src.client.upbit.types import Ticker, Candle, LeanTicker, LeanCandle
 from src.client.alternative.types import FearAndGreedEntry
 
 from .ohlcv import (
-    OHLCV, 
-    OHLCVData
+    OHLCVData,
+    OHLCVFrame,
 )
+from .plan import FetchTimings
 from .validated_tickers import ValidatedTickers
 from ...types import CurrencyType
 
 
-def _default_volume_calculation(ticker: Ticker) -> float:
+_DAY = 86_400
+
+_EPOCH_ORDINAL = dt.date(1970, 1, 1).toordinal()
+
+
+def _default_volume_calculation(ticker: Ticker | LeanTicker) -> float:
     return ticker.acc_trade_volume_24h
 
-def _default_change_calculation(ticker: Ticker) -> float:
+def _default_change_calculation(ticker: Ticker | LeanTicker) -> float:
     return ticker.signed_change_rate * 100    
 
-def _default_volatility_calculation(ticker: Ticker) -> float:
+def _default_volatility_calculation(ticker: Ticker | LeanTicker) -> float:
     return ((ticker.high_price - ticker.low_price) / ticker.trade_price) * 100 if ticker.trade_price > 0 else 0
     
 def _default_sort_by(validated_ticker: ValidatedTickers) -> float:
@@ -30,15 +37,21 @@ class FearAndGreedData(BaseModel):
     entries: t.List[FearAndGreedEntry]
     """List of fear and greed index entries."""
 
+    @functools.cached_property
+    def by_day(self) -> dict[int, FearAndGreedEntry]:
+        """Entries keyed by UTC day number (`timestamp // 86400`), built once."""
+        return {entry.timestamp // _DAY: entry for entry in self.entries}
+
     def get_entry(self, yyyymmdd: str) -> t.Optional[FearAndGreedEntry]:
         if not yyyymmdd.isdigit() or len(yyyymmdd) != 8:
             raise ValueError("Date must be in 'YYYYMMDD' format.")
         
-        for entry in self.entries:
-            if dt.datetime.fromtimestamp(entry.timestamp).strftime("%Y%m%d") == yyyymmdd:
-                return entry
-            
-        return None
+        date = dt.date(int(yyyymmdd[:4]), int(yyyymmdd[4:6]), int(yyyymmdd[6:]))
+        return self.get_entry_for(date)
+
+    def get_entry_for(self, date: dt.date) -> t.Optional[FearAndGreedEntry]:
+        """The entry published for the UTC `date`, in O(1)."""
+        return self.by_day.get(date.toordinal() - _EPOCH_ORDINAL)
 
 
 class MarketData(BaseModel): 
@@ -46,31 +59,25 @@ class MarketData(BaseModel):
     currency: CurrencyType
     """The currency type for the market data."""
 
-    tickers: t.List[Ticker]
-    """List of tickers for the specified currency."""
+    tickers: t.List[Ticker | LeanTicker]
+    """List of tickers for the specified currency; lean records when the client decodes leanly."""
 
-    candles: t.List[Candle]
-    """List of candles for the specified currency."""
+    candles: t.List[Candle | LeanCandle]
+    """List of candles for the specified currency; lean records when the client decodes leanly."""
 
     fear_and_greed: FearAndGreedData
     """The fear and greed index data by date."""
 
+    timings: FetchTimings | None = None
+    """Per-request timings of the fetch that produced this snapshot."""
+
+
+    def get_ohlcv_frame(self) -> OHLCVFrame:
+        return OHLCVFrame.from_candles(self.candles)
+
 
     def get_ohlcv_data(self) -> OHLCVData:
-        ohlcv_data: OHLCVData = {}
-        
-        for candle in self.candles:
-            ohlcv = OHLCV(
-                open=candle.opening_price,
-                high=candle.high_price,
-                low=candle.low_price,
-                close=candle.trade_price,
-                volume=candle.candle_acc_trade_volume,
-                value=candle.candle_acc_trade_price,
-            )
-            ohlcv_data[dt.datetime.fromisoformat(candle.candle_date_time_utc)] = ohlcv
-        
-        return ohlcv_data
+        return dict(self.get_ohlcv_frame().as_dict())
 
 
     def get_validated_tickers(
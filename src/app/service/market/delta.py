@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import typing as t
+
+from src.base import BaseModel
+from src.client.upbit.types import Ticker, Candle, LeanTicker, LeanCandle
+from src.client.alternative.types import FearAndGreedEntry
+
+from .data import FearAndGreedData, MarketData
+from .plan import FetchTimings
+from ...types import CurrencyType
+
+
+class MarketDataDelta(BaseModel):
+
+    sequence: int
+    """Position of this delta in the stream, starting at 0."""
+
+    full: bool
+    """Whether this is a full snapshot that replaces all previous state."""
+
+    currency: CurrencyType
+    """The currency type of the market data."""
+
+    tickers: t.List[Ticker | LeanTicker] = []
+    """Tickers whose `trade_timestamp` changed, or all tickers in a snapshot."""
+
+    removed_markets: t.List[str] = []
+    """Markets that no longer have a ticker."""
+
+    candles: t.List[Candle | LeanCandle] = []
+    """New or revised candles, or all candles in a snapshot; newest first."""
+
+    candle_count: int
+    """Candles in the full data; older ones fall out of the window."""
+
+    fear_and_greed: t.List[FearAndGreedEntry] = []
+    """New index entries, or all entries in a snapshot; newest first."""
+
+    fear_and_greed_count: int
+    """Index entries in the full data."""
+
+    timings: FetchTimings | None = None
+    """Per-request timings of the fetch that produced the data."""
+
+
+class MarketDataEncoder:
+    """Turns successive `MarketData` snapshots into `MarketDataDelta`s.
+
+    The first delta, and every `snapshot_every`-th one after it, is a full
+    snapshot so consumers can join the stream or recover from a gap; the
+    others carry only what changed since the previous one.
+    """
+
+    def __init__(self, *, snapshot_every: int = 60) -> None:
+        if snapshot_every < 1:
+            raise ValueError("snapshot_every must be at least 1.")
+        self.snapshot_every = snapshot_every
+        self._sequence = 0
+        self._tickers: dict[str, int] = {}
+        self._candles: dict[str, Candle | LeanCandle] = {}
+        self._fear_and_greed: set[int] = set()
+
+
+    def encode(self, data: MarketData) -> MarketDataDelta:
+        sequence = self._sequence
+        self._sequence += 1
+        full = sequence % self.snapshot_every == 0
+
+        tickers = [
+            ticker
+            for ticker in data.tickers
+            if full or self._tickers.get(ticker.market) != ticker.trade_timestamp
+        ]
+        markets = {ticker.market for ticker in data.tickers}
+        removed = [] if full else [market for market in self._tickers if market not in markets]
+        candles = [
+            candle
+            for candle in data.candles
+            if full or self._candles.get(candle.candle_date_time_utc) != candle
+        ]
+        entries = [
+            entry
+            for entry in data.fear_and_greed.entries
+            if full or entry.timestamp not in self._fear_and_greed
+        ]
+
+        self._tickers = {ticker.market: ticker.trade_timestamp for ticker in data.tickers}
+        self._candles = {candle.candle_date_time_utc: candle for candle in data.candles}
+        self._fear_and_greed = {entry.timestamp for entry in data.fear_and_greed.entries}
+
+        return MarketDataDelta(
+            sequence=sequence,
+            full=full,
+            currency=data.currency,
+            tickers=tickers,
+            removed_markets=removed,
+            candles=candles,
+            candle_count=len(data.candles),
+            fear_and_greed=entries,
+            fear_and_greed_count=len(data.fear_and_greed.entries),
+            timings=data.timings,
+        )
+
+
+class MarketDataDecoder:
+    """Rebuilds `MarketData` on the consumer side from a stream of deltas.
+
+    Deltas must be applied in order starting from a full snapshot; a gap in
+    the sequence raises `ValueError`, after which the next snapshot resumes
+    the stream.
+    """
+
+    def __init__(self) -> None:
+        self._sequence: int | None = None
+        self._tickers: dict[str, Ticker | LeanTicker] = {}
+        self._candles: dict[str, Candle | LeanCandle] = {}
+        self._fear_and_greed: dict[int, FearAndGreedEntry] = {}
+
+
+    def apply(self, delta: MarketDataDelta | t.Mapping[str, t.Any]) -> MarketData:
+        """Apply `delta` (a model or the `data` of its event) and return the full data."""
+        if not isinstance(delta, MarketDataDelta):
+            delta = MarketDataDelta.from_dict(delta)
+
+        if delta.full:
+            self._tickers.clear()
+            self._candles.clear()
+            self._fear_and_greed.clear()
+        elif self._sequence is None or delta.sequence != self._sequence + 1:
+            self._sequence = None
+            raise ValueError(f"Missed market data deltas before {delta.sequence}; waiting for a full snapshot.")
+
+        self._sequence = delta.sequence
+        for market in delta.removed_markets:
+            self._tickers.pop(market, None)
+        self._tickers.update((ticker.market, ticker) for ticker in delta.tickers)
+        self._candles.update((candle.candle_date_time_utc, candle) for candle in delta.candles)
+        self._fear_and_greed.update((entry.timestamp, entry) for entry in delta.fear_and_greed)
+
+        candles = sorted(self._candles.values(), key=lambda candle: candle.candle_date_time_utc, reverse=True)
+        del candles[delta.candle_count:]
+        self._candles = {candle.candle_date_time_utc: candle for candle in candles}
+
+        entries = sorted(self._fear_and_greed.values(), key=lambda entry: entry.timestamp, reverse=True)
+        del entries[delta.fear_and_greed_count:]
+        self._fear_and_greed = {entry.timestamp: entry for entry in entries}
+
+        return MarketData(
+            currency=delta.currency,
+            tickers=list(self._tickers.values()),
+            candles=candles,
+            fear_and_greed=FearAndGreedData(entries=entries),
+            timings=delta.timings,
+        )
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+import pathlib
+import threading
+import time
+import typing as t
+
+from src.client import AlternativeClient
+from src.client.alternative.types import FearAndGreedEntry
+
+from .data import FearAndGreedData
+
+_DAY = 86_400
+
+
+class FearAndGreedStore:
+    """Local, append-only history of the daily Fear & Greed index.
+
+    Entries are kept oldest first in one NDJSON file. The first `sync`
+    downloads the full history (`limit=0`); later ones request only the days
+    published since the last stored entry. Loaded histories come with the
+    O(1) day index of `FearAndGreedData`.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = pathlib.Path(path)
+        self._lock = threading.Lock()
+        self._entries: t.List[FearAndGreedEntry] | None = None
+
+
+    def _load(self) -> t.List[FearAndGreedEntry]:
+        if self._entries is None:
+            self._entries = (
+                [
+                    FearAndGreedEntry.model_validate_json(line)
+                    for line in self.path.read_bytes().splitlines()
+                    if line.strip()
+                ]
+                if self.path.exists()
+                else []
+            )
+        return self._entries
+
+
+    def last_timestamp(self) -> int | None:
+        with self._lock:
+            entries = self._load()
+            return entries[-1].timestamp if entries else None
+
+
+    def append(self, entries: t.Iterable[FearAndGreedEntry]) -> int:
+        """Append entries newer than the last stored one and return how many were written."""
+        with self._lock:
+            stored = self._load()
+            last = stored[-1].timestamp if stored else None
+            new = sorted(
+                (entry for entry in entries if last is None or entry.timestamp > last),
+                key=lambda entry: entry.timestamp,
+            )
+            if not new:
+                return 0
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as f:
+                f.write(b"".join(
+                    entry.model_dump_json(exclude={"time_until_update"}).encode() + b"\n"
+                    for entry in new
+                ))
+            stored.extend(new)
+            return len(new)
+
+
+    def sync(self, client: AlternativeClient) -> int:
+        """Bring the history up to date and return the entries written."""
+        last = self.last_timestamp()
+        if last is None:
+            return self.append(client.fng.get(limit=0).data)
+
+        missing = (int(time.time()) - last) // _DAY
+        if missing < 1:
+            return 0
+        return self.append(client.fng.get(limit=missing + 1).data)
+
+
+    def history(self, *, count: int | None = None) -> FearAndGreedData:
+        """The newest `count` entries (all when None), newest first like the API."""
+        with self._lock:
+            entries = self._load()
+            selected = entries[max(0, len(entries) - count):] if count is not None else entries[:]
+        selected.reverse()
+        return FearAndGreedData(entries=selected)
@@ -1,23 +1,33 @@
 from __future__ import annotations
 
+import array
+import bisect
 import datetime as dt
+import typing as t
+from collections.abc import Mapping
 
 from src.base import BaseModel
 
+if t.TYPE_CHECKING:
+    from src.client.upbit.types import Candle
+    from .store import CandleColumns
+
 OHLCVData = dict[dt.datetime, 'OHLCV']
 
+_EPOCH = dt.datetime(1970, 1, 1)
+
 class OHLCV(BaseModel):
 
-    open: int
+    open: float
     """Opening price."""
 
-    high: int
+    high: float
     """Highest price."""
 
-    low: int
+    low: float
     """Lowest price."""
 
-    close: int
+    close: float
     """Closing price."""
 
     volume: float
@@ -25,3 +35,212 @@ class OHLCV(BaseModel):
 
     value: float
     """Trading value."""
+
+
+def candle_epoch(candle: Candle) -> int:
+    """Epoch seconds of the start of the candle period."""
+    return int(
+        dt.datetime.fromisoformat(candle.candle_date_time_utc)
+        .replace(tzinfo=dt.timezone.utc)
+        .timestamp()
+    )
+
+
+def epoch_to_datetime(timestamp: int) -> dt.datetime:
+    """Naive UTC datetime of `timestamp`, matching the keys of `OHLCVData`."""
+    return _EPOCH + dt.timedelta(seconds=timestamp)
+
+
+def datetime_to_epoch(date: dt.datetime) -> int:
+    if date.tzinfo is not None:
+        date = date.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return int((date - _EPOCH).total_seconds())
+
+
+Column = t.Union["array.array[float]", memoryview]
+"""A contiguous float64 column; an `array.array('d')` or a typed `memoryview`."""
+
+
+class OHLCVFrame:
+    """Columnar OHLCV series in ascending time order.
+
+    Every column is a contiguous buffer: `timestamp` holds int64 epoch seconds
+    of the candle start (UTC), the price and volume columns hold float64.
+    `column` hands out zero-copy `memoryview`s, and `as_dict` offers the
+    `OHLCVData` mapping for code written against the dict of `OHLCV` models.
+    """
+
+    __slots__ = ("timestamp", "open", "high", "low", "close", "volume", "value")
+
+    COLUMNS: t.ClassVar[t.Tuple[str, ...]] = ("timestamp", "open", "high", "low", "close", "volume", "value")
+
+    def __init__(
+        self,
+        *,
+        timestamp: "array.array[int] | memoryview",
+        open: Column,
+        high: Column,
+        low: Column,
+        close: Column,
+        volume: Column,
+        value: Column,
+    ) -> None:
+        lengths = {len(c) for c in (timestamp, open, high, low, close, volume, value)}
+        if len(lengths) > 1:
+            raise ValueError("All OHLCV columns must have the same length.")
+
+        self.timestamp = timestamp
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+        self.value = value
+
+
+    @classmethod
+    def empty(cls) -> OHLCVFrame:
+        return cls(
+            timestamp=array.array("q"),
+            **{name: array.array("d") for name in cls.COLUMNS[1:]},
+        )
+
+
+    @classmethod
+    def from_candles(cls, candles: t.Iterable[Candle]) -> OHLCVFrame:
+        """Build a frame from API candles in one pass; either time order is accepted."""
+        timestamp, open, high, low, close, volume, value = (
+            array.array("q"), array.array("d"), array.array("d"), array.array("d"),
+            array.array("d"), array.array("d"), array.array("d"),
+        )
+        for candle in candles:
+            timestamp.append(candle_epoch(candle))
+            open.append(candle.opening_price)
+            high.append(candle.high_price)
+            low.append(candle.low_price)
+            close.append(candle.trade_price)
+            volume.append(candle.candle_acc_trade_volume)
+            value.append(candle.candle_acc_trade_price)
+
+        return cls(
+            timestamp=timestamp,
+            open=open,
+            high=high,
+            low=low,
+            close=close,
+            volume=volume,
+            value=value,
+        )._sorted()
+
+
+    @classmethod
+    def from_columns(cls, columns: CandleColumns, *, copy: bool = True) -> OHLCVFrame:
+        """Build a frame from a stored series.
+
+        With `copy=False` the frame shares the store's memory maps and is only
+        valid until `columns` is closed.
+        """
+        if copy:
+            return cls(
+                timestamp=array.array("q", columns["timestamp"]),
+                **{name: array.array("d", columns[name]) for name in cls.COLUMNS[1:]},
+            )
+        return cls(**{name: columns[name] for name in cls.COLUMNS})
+
+
+    @classmethod
+    def from_ohlcv_data(cls, ohlcv_data: OHLCVData) -> OHLCVFrame:
+        dates = sorted(ohlcv_data.keys())
+        rows = [ohlcv_data[d] for d in dates]
+        return cls(
+            timestamp=array.array("q", (datetime_to_epoch(d) for d in dates)),
+            open=array.array("d", (row.open for row in rows)),
+            high=array.array("d", (row.high for row in rows)),
+            low=array.array("d", (row.low for row in rows)),
+            close=array.array("d", (row.close for row in rows)),
+            volume=array.array("d", (row.volume for row in rows)),
+            value=array.array("d", (row.value for row in rows)),
+        )
+
+
+    def _sorted(self) -> OHLCVFrame:
+        ts = self.timestamp
+        if all(ts[i] < ts[i + 1] for i in range(len(ts) - 1)):
+            return self
+        if all(ts[i] > ts[i + 1] for i in range(len(ts) - 1)):
+            for name in self.COLUMNS:
+                t.cast(array.array, getattr(self, name)).reverse()
+            return self
+
+        order = sorted(range(len(ts)), key=ts.__getitem__)
+        return OHLCVFrame(
+            timestamp=array.array("q", (ts[i] for i in order)),
+            **{
+                name: array.array("d", (getattr(self, name)[i] for i in order))
+                for name in self.COLUMNS[1:]
+            },
+        )
+
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+
+    def column(self, name: str) -> memoryview:
+        """Zero-copy view of a column."""
+        if name not in self.COLUMNS:
+            raise KeyError(name)
+        return memoryview(getattr(self, name))
+
+
+    @property
+    def dates(self) -> t.List[dt.datetime]:
+        return [epoch_to_datetime(ts) for ts in self.timestamp]
+
+
+    def tail(self, n: int) -> OHLCVFrame:
+        """The last `n` rows, sharing memory with this frame."""
+        start = max(0, len(self) - n)
+        return OHLCVFrame(**{name: memoryview(getattr(self, name))[start:] for name in self.COLUMNS})
+
+
+    def row(self, index: int) -> OHLCV:
+        return OHLCV(
+            open=self.open[index],
+            high=self.high[index],
+            low=self.low[index],
+            close=self.close[index],
+            volume=self.volume[index],
+            value=self.value[index],
+        )
+
+
+    def as_dict(self) -> Mapping[dt.datetime, OHLCV]:
+        """Read-only `OHLCVData`-style mapping; rows are materialized on access."""
+        return _OHLCVFrameMapping(self)
+
+
+def as_frame(ohlcv_data: OHLCVData | OHLCVFrame) -> OHLCVFrame:
+    """Accept either representation in analyzers written against `OHLCVData`."""
+    if isinstance(ohlcv_data, OHLCVFrame):
+        return ohlcv_data
+    return OHLCVFrame.from_ohlcv_data(ohlcv_data)
+
+
+class _OHLCVFrameMapping(Mapping[dt.datetime, OHLCV]):
+
+    def __init__(self, frame: OHLCVFrame) -> None:
+        self._frame = frame
+
+    def __getitem__(self, key: dt.datetime) -> OHLCV:
+        timestamp = datetime_to_epoch(key)
+        index = bisect.bisect_left(self._frame.timestamp, timestamp)
+        if index == len(self._frame) or self._frame.timestamp[index] != timestamp:
+            raise KeyError(key)
+        return self._frame.row(index)
+
+    def __iter__(self) -> t.Iterator[dt.datetime]:
+        return (epoch_to_datetime(ts) for ts in self._frame.timestamp)
+
+    def __len__(self) -> int:
+        return len(self._frame)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import time
+import typing as t
+from concurrent import futures
+
+from src.base import BaseModel
+
+from ...pipeline import Pipeline
+
+
+class FetchTiming(BaseModel):
+
+    name: str
+    """The name of the fetch step."""
+
+    started_at: float
+    """Seconds between the start of the plan and the start of this step."""
+
+    elapsed: float
+    """Seconds spent waiting on this step."""
+
+
+class FetchTimings(BaseModel):
+
+    wall_clock: float
+    """Seconds between the start of the plan and the end of its last step."""
+
+    steps: t.List[FetchTiming]
+    """Per-step timings, in completion order."""
+
+    @property
+    def sequential(self) -> float:
+        """Seconds the same steps would have taken if run one after another."""
+        return sum(step.elapsed for step in self.steps)
+
+    @property
+    def speedup(self) -> float:
+        return self.sequential / self.wall_clock if self.wall_clock > 0 else 1.0
+
+
+class FetchPlan:
+    """A small dependency graph of fetch steps, run as a `Pipeline`.
+
+    Every step starts as soon as the steps it depends on have finished, so the
+    wall-clock time of `run` is bounded by the longest dependency chain rather
+    than by the sum of all steps. Results of dependencies are passed to the
+    dependent step as keyword arguments named after the dependency.
+    """
+
+    def __init__(self) -> None:
+        self._pipeline = Pipeline()
+
+
+    def add(
+        self,
+        name: str,
+        fn: t.Callable[..., t.Any],
+        *,
+        depends_on: t.Sequence[str] = (),
+    ) -> None:
+        for dependency in depends_on:
+            if dependency not in self._pipeline.outputs:
+                raise ValueError(f"Fetch step '{name}' depends on unknown step '{dependency}'.")
+        self._pipeline.add(name, fn, inputs=depends_on, output=name)
+
+
+    def run(
+        self,
+        executor: futures.Executor,
+    ) -> t.Tuple[dict[str, t.Any], FetchTimings]:
+        origin = time.perf_counter()
+        stream = self._pipeline.stream(executor)
+        timings: t.List[FetchTiming] = []
+        while True:
+            try:
+                result = next(stream)
+            except StopIteration as stop:
+                results: dict[str, t.Any] = stop.value
+                break
+            timings.append(
+                FetchTiming(
+                    name=result.stage,
+                    started_at=result.timing.started_at,
+                    elapsed=result.timing.elapsed,
+                )
+            )
+
+        return results, FetchTimings(
+            wall_clock=time.perf_counter() - origin,
+            steps=timings,
+        )
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import typing as t
+from multiprocessing import shared_memory
+
+from .ohlcv import OHLCVFrame
+
+
+class FrameHandle(t.NamedTuple):
+    """Where one market's frame lives inside a `SharedFrames` block; cheap to pickle."""
+
+    segment: str
+    """Name of the shared memory segment."""
+
+    offset: int
+    """Byte offset of the market's first column."""
+
+    length: int
+    """Rows in the frame."""
+
+
+class SharedFrames:
+    """Many OHLCV frames packed into one shared memory segment.
+
+    Each market's columns are laid out back to back (`timestamp` as int64,
+    the rest as float64), so worker processes rebuild a frame from a
+    `FrameHandle` as typed `memoryview`s over the segment instead of
+    unpickling a copy of the candles.
+
+    The creating process owns the segment and unlinks it on `close`.
+    """
+
+    def __init__(self, frames: t.Mapping[str, OHLCVFrame]) -> None:
+        width = len(OHLCVFrame.COLUMNS) * 8
+        size = sum(len(frame) * width for frame in frames.values())
+        self._segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self.handles: dict[str, FrameHandle] = {}
+
+        offset = 0
+        for market, frame in frames.items():
+            length = len(frame)
+            self.handles[market] = FrameHandle(self._segment.name, offset, length)
+            for name in OHLCVFrame.COLUMNS:
+                column = memoryview(getattr(frame, name)).cast("B")
+                self._segment.buf[offset:offset + length * 8] = column
+                offset += length * 8
+
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.close()
+
+
+    def close(self) -> None:
+        self._segment.close()
+        self._segment.unlink()
+
+
+_attached: dict[str, shared_memory.SharedMemory] = {}
+"""Segments attached by this (worker) process, by name."""
+
+
+def attach_frame(handle: FrameHandle) -> OHLCVFrame:
+    """Zero-copy frame over a `SharedFrames` segment.
+
+    Call `detach_frame` once done with it; the segment of the previous scan
+    is closed when a new one is first attached.
+    """
+    segment = _attached.get(handle.segment)
+    if segment is None:
+        for name in list(_attached):
+            _attached.pop(name).close()
+        segment = _attached[handle.segment] = shared_memory.SharedMemory(name=handle.segment)
+
+    columns: dict[str, memoryview] = {}
+    offset, size = handle.offset, handle.length * 8
+    for name in OHLCVFrame.COLUMNS:
+        columns[name] = segment.buf[offset:offset + size].cast("q" if name == "timestamp" else "d")
+        offset += size
+    return OHLCVFrame(**columns)
+
+
+def detach_frame(frame: OHLCVFrame) -> None:
+    """Release the views of a frame from `attach_frame`."""
+    for name in OHLCVFrame.COLUMNS:
+        t.cast(memoryview, getattr(frame, name)).release()
@@ -0,0 +1,345 @@
+from __future__ import annotations
+
+import array
+import datetime as dt
+import math
+import mmap
+import os
+import pathlib
+import threading
+import typing as t
+
+from src.client import UpbitClient
+from src.client.upbit.resources.candles import (
+    CandleUnit,
+    MinuteInterval,
+    MAX_PAGE_SIZE,
+)
+from src.client.upbit.types import Candle
+
+from .ohlcv import candle_epoch
+
+
+COLUMNS: t.Tuple[str, ...] = (
+    "timestamp", "open", "high", "low", "close", "volume", "value",
+    "trade_timestamp", "prev_close", "change_price", "change_rate",
+)
+"""Stored columns. `timestamp` is int64 epoch seconds of the candle start (UTC) and
+`trade_timestamp` the API's int64 `timestamp` in milliseconds; the rest are float64,
+with NaN for the day-candle fields other units leave out.
+"""
+
+_TYPECODES: dict[str, str] = {
+    column: ("q" if column in ("timestamp", "trade_timestamp") else "d")
+    for column in COLUMNS
+}
+
+_UNIT_SECONDS: dict[str, int] = {
+    "days": 86_400,
+    "weeks": 7 * 86_400,
+    "months": 31 * 86_400,
+}
+
+_KST = dt.timezone(dt.timedelta(hours=9))
+
+
+def _candle_row(candle: Candle) -> t.Tuple[float, ...]:
+    return (
+        candle_epoch(candle),
+        candle.opening_price,
+        candle.high_price,
+        candle.low_price,
+        candle.trade_price,
+        candle.candle_acc_trade_volume,
+        candle.candle_acc_trade_price,
+        candle.timestamp,
+        math.nan if candle.prev_closing_price is None else candle.prev_closing_price,
+        math.nan if candle.change_price is None else candle.change_price,
+        math.nan if candle.change_rate is None else candle.change_rate,
+    )
+
+
+def _optional(value: float) -> float | None:
+    return None if math.isnan(value) else value
+
+
+def _unit_key(unit: CandleUnit, minutes: MinuteInterval | None) -> str:
+    return f"minutes-{minutes}" if unit == "minutes" else unit
+
+
+def _unit_seconds(unit: CandleUnit, minutes: MinuteInterval | None) -> int:
+    return (minutes or 1) * 60 if unit == "minutes" else _UNIT_SECONDS[unit]
+
+
+class CandleColumns:
+    """Read-only, memory-mapped view of one stored candle series.
+
+    Columns are exposed as typed `memoryview`s over the files, so reading
+    does not copy. Views are only valid until `close` is called.
+    """
+
+    def __init__(self, directory: pathlib.Path) -> None:
+        self._maps: t.List[mmap.mmap] = []
+        self._views: dict[str, memoryview] = {}
+
+        lengths = [
+            (directory / f"{column}.bin").stat().st_size // 8
+            if (directory / f"{column}.bin").exists() else 0
+            for column in COLUMNS
+        ]
+        self._length = min(lengths)
+
+        for column in COLUMNS:
+            if self._length == 0:
+                self._views[column] = memoryview(array.array(_TYPECODES[column]))
+                continue
+            with (directory / f"{column}.bin").open("rb") as f:
+                mapped = mmap.mmap(f.fileno(), self._length * 8, access=mmap.ACCESS_READ)
+            self._maps.append(mapped)
+            self._views[column] = memoryview(mapped).cast(_TYPECODES[column])
+
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, column: str) -> memoryview:
+        return self._views[column]
+
+    def __enter__(self) -> t.Self:
+        return self
+
+    def __exit__(self, *exc_info: t.Any) -> None:
+        self.close()
+
+
+    def close(self) -> None:
+        for view in self._views.values():
+            view.release()
+        for mapped in self._maps:
+            mapped.close()
+        self._views.clear()
+        self._maps.clear()
+
+
+class CandleStore:
+    """Append-only columnar candle store keyed by market and unit.
+
+    Each series lives in `<root>/<market>/<unit>/` as one raw native-endian
+    file per column. Rows are only ever appended, except the last one, which
+    is overwritten while its candle is still open. Older history is added
+    only on an explicit `backfill`, which rewrites the series once.
+    """
+
+    def __init__(self, root: str | os.PathLike[str]) -> None:
+        self.root = pathlib.Path(root)
+        self._locks: dict[pathlib.Path, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+
+    def _directory(self, market: str, unit: CandleUnit, minutes: MinuteInterval | None) -> pathlib.Path:
+        return self.root / market / _unit_key(unit, minutes)
+
+
+    def _lock(self, directory: pathlib.Path) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(directory, threading.Lock())
+
+
+    def read(
+        self,
+        market: str,
+        unit: CandleUnit = "days",
+        minutes: MinuteInterval | None = None,
+    ) -> CandleColumns:
+        return CandleColumns(self._directory(market, unit, minutes))
+
+
+    def last_timestamp(
+        self,
+        market: str,
+        unit: CandleUnit = "days",
+        minutes: MinuteInterval | None = None,
+    ) -> int | None:
+        with self.read(market, unit, minutes) as columns:
+            return columns["timestamp"][-1] if len(columns) else None
+
+
+    def write(
+        self,
+        market: str,
+        candles: t.Iterable[Candle],
+        unit: CandleUnit = "days",
+        minutes: MinuteInterval | None = None,
+    ) -> int:
+        """Upsert candles at the end of the series and return the rows written.
+
+        A candle with the same timestamp as the last stored row replaces it;
+        newer candles are appended in time order; older ones are ignored.
+        """
+        rows = sorted((_candle_row(candle) for candle in candles), key=lambda row: row[0])
+        return self._write_rows(self._directory(market, unit, minutes), rows)
+
+
+    def _write_rows(
+        self,
+        directory: pathlib.Path,
+        rows: t.Sequence[t.Tuple[float, ...]],
+    ) -> int:
+        with self._lock(directory):
+            directory.mkdir(parents=True, exist_ok=True)
+            with CandleColumns(directory) as columns:
+                length = len(columns)
+                last = columns["timestamp"][-1] if length else None
+
+            replace_last = last is not None and any(row[0] == last for row in rows)
+            new_rows = [
+                row for row in rows
+                if last is None or row[0] > last or (replace_last and row[0] == last)
+            ]
+            if not new_rows:
+                return 0
+
+            offset = (length - 1 if replace_last else length) * 8
+            for index, column in enumerate(COLUMNS):
+                data = array.array(_TYPECODES[column], (row[index] for row in new_rows))
+                path = directory / f"{column}.bin"
+                with path.open("r+b" if path.exists() else "w+b") as f:
+                    # Drop rows left behind by an interrupted write of another column.
+                    f.truncate(offset)
+                    f.seek(offset)
+                    f.write(data.tobytes())
+            return len(new_rows)
+
+
+    def _prepend_rows(
+        self,
+        directory: pathlib.Path,
+        rows: t.Sequence[t.Tuple[float, ...]],
+    ) -> int:
+        with self._lock(directory):
+            with CandleColumns(directory) as columns:
+                first = columns["timestamp"][0] if len(columns) else None
+                older = [row for row in rows if first is None or row[0] < first]
+                if not older:
+                    return 0
+                for index, column in enumerate(COLUMNS):
+                    data = array.array(_TYPECODES[column], (row[index] for row in older))
+                    data.extend(columns[column])
+                    (directory / f"{column}.bin.tmp").write_bytes(data.tobytes())
+            # Swap only once every column is written, so a failed backfill leaves the series intact.
+            for column in COLUMNS:
+                (directory / f"{column}.bin.tmp").replace(directory / f"{column}.bin")
+            return len(older)
+
+
+    def sync(
+        self,
+        client: UpbitClient,
+        market: str,
+        unit: CandleUnit = "days",
+        minutes: MinuteInterval | None = None,
+        *,
+        start: dt.datetime | None = None,
+    ) -> int:
+        """Bring the stored series up to date and return the rows written.
+
+        An empty series is filled from `start` (or the beginning of the
+        market's history); afterwards only candles at or after the last
+        stored one are requested, in a single small page when possible.
+        Pass a recent `start` to keep the first sync to one small request
+        and `backfill` the older history when it is needed.
+        """
+        last = self.last_timestamp(market, unit, minutes)
+        page_size = MAX_PAGE_SIZE
+        if last is not None:
+            elapsed = dt.datetime.now(dt.timezone.utc).timestamp() - last
+            page_size = max(1, min(MAX_PAGE_SIZE, int(elapsed // _unit_seconds(unit, minutes)) + 1))
+            start = dt.datetime.fromtimestamp(last, dt.timezone.utc)
+
+        # Pages come newest first; write them oldest first in one go so
+        # a sync more than a page behind does not drop the older pages.
+        rows: t.List[t.Tuple[float, ...]] = []
+        for page in client.v1.candles.iter_history(
+            market=market,
+            unit=unit,
+            minutes=minutes,
+            start=start,
+            page_size=page_size,
+        ):
+            rows.extend(_candle_row(candle) for candle in page)
+        rows.reverse()
+        return self._write_rows(self._directory(market, unit, minutes), rows)
+
+
+    def backfill(
+        self,
+        client: UpbitClient,
+        market: str,
+        unit: CandleUnit = "days",
+        minutes: MinuteInterval | None = None,
+        *,
+        start: dt.datetime | None = None,
+    ) -> int:
+        """Extend the stored series back to `start` (the beginning of the
+        market's history when None) and return the rows added.
+
+        Only candles older than the first stored one are requested. An empty
+        series is synced instead.
+        """
+        with self.read(market, unit, minutes) as columns:
+            first = columns["timestamp"][0] if len(columns) else None
+        if first is None:
+            return self.sync(client, market, unit, minutes, start=start)
+
+        rows: t.List[t.Tuple[float, ...]] = []
+        for page in client.v1.candles.iter_history(
+            market=market,
+            unit=unit,
+            minutes=minutes,
+            start=start,
+            end=dt.datetime.fromtimestamp(first, dt.timezone.utc),
+        ):
+            rows.extend(_candle_row(candle) for candle in page)
+        rows.reverse()
+        return self._prepend_rows(self._directory(market, unit, minutes), rows)
+
+
+    def candles(
+        self,
+        market: str,
+        unit: CandleUnit = "days",
+        minutes: MinuteInterval | None = None,
+        *,
+        count: int | None = None,
+    ) -> t.List[Candle]:
+        """Rebuild the newest `count` stored candles, newest first like the API,
+        with every field the API returned for them.
+        """
+        with self.read(market, unit, minutes) as columns:
+            length = len(columns)
+            first = max(0, length - count) if count is not None else 0
+            candles: t.List[Candle] = []
+            for i in range(length - 1, first - 1, -1):
+                start = dt.datetime.fromtimestamp(columns["timestamp"][i], dt.timezone.utc)
+                candles.append(
+                    Candle(
+                        market=market,
+                        candle_date_time_utc=start.strftime("%Y-%m-%dT%H:%M:%S"),
+                        candle_date_time_kst=start.astimezone(_KST).strftime("%Y-%m-%dT%H:%M:%S"),
+                        opening_price=columns["open"][i],
+                        high_price=columns["high"][i],
+                        low_price=columns["low"][i],
+                        trade_price=columns["close"][i],
+                        timestamp=columns["trade_timestamp"][i],
+                        candle_acc_trade_price=columns["value"][i],
+                        candle_acc_trade_volume=columns["volume"][i],
+                        prev_closing_price=_optional(columns["prev_close"][i]),
+                        change_price=_optional(columns["change_price"][i]),
+                        change_rate=_optional(columns["change_rate"][i]),
+                        unit=minutes if unit == "minutes" else None,
+                        first_day_of_period=(
+                            start.strftime("%Y-%m-%d") if unit in ("weeks", "months") else None
+                        ),
+                    )
+                )
+            return candles
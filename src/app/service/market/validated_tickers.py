@@ -1,9 +1,9 @@
 from src.base import BaseModel
-from src.client.upbit.types import Ticker
+from src.client.upbit.types import Ticker, LeanTicker
 
 
 class ValidatedTickers(BaseModel):
-    ticker: Ticker
+    ticker: Ticker | LeanTicker
     """The ticker information."""
 
     volume: float
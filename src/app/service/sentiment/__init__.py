@@ -1,4 +1,5 @@
 from .api import SentimentAnalyzer
-from .artifact import SentimentArtifact
+from .artifact import SentimentArtifact, SentimentSeries
+from .classifier import FearAndGreedClassifier
 
-__all__ = ['SentimentAnalyzer', 'SentimentArtifact']
\ No newline at end of file
+__all__ = ['SentimentAnalyzer', 'SentimentArtifact', 'SentimentSeries', 'FearAndGreedClassifier']
\ No newline at end of file
@@ -1,11 +1,17 @@
+import array
 import datetime as dt
-import collections
+import math
+import typing as t
 
 from .artifact import (
+    RegimeChange,
     SentimentArtifact, 
-    FearAndGreedClassification
+    SentimentSeries,
+    SentimentState,
 )
-from ..market import MarketData
+from .classifier import LEVELS, FearAndGreedClassifier
+from ..market import FearAndGreedData, MarketData
+from ..technical.columns import rolling_mean
 from ...config import AppConfig
 
 
@@ -14,36 +20,7 @@ class SentimentAnalyzer:
 
     def __init__(self, config: AppConfig) -> None:
         self.config = config
-        
-        fng_map: dict[int, FearAndGreedClassification] = collections.defaultdict(dict) # type: ignore
-        
-        for score in range(self.config.thresholds.sentiment.extreme_greed):
-            if score < self.config.thresholds.sentiment.extreme_fear:
-                fng_map[score] = FearAndGreedClassification(
-                    state="Extreme Fear",
-                    interpretation="The market is in extreme fear. Caution is advised.",
-                    strategy_hint="Consider buying opportunities with caution."
-                )
-            elif score < self.config.thresholds.sentiment.fear:
-                fng_map[score] = FearAndGreedClassification(
-                    state="Fear",
-                    interpretation="The market is fearful. Be cautious.",
-                    strategy_hint="Consider defensive strategies."
-                )
-            elif score < self.config.thresholds.sentiment.greed:
-                fng_map[score] = FearAndGreedClassification(
-                    state="Greed",
-                    interpretation="The market is greedy.",
-                    strategy_hint="Enjoy the gains but stay vigilant. Get ready for profit-taking."
-                )
-            else:
-                fng_map[score] = FearAndGreedClassification(
-                    state="Extreme Greed",
-                    interpretation="The market is in extreme greed. Caution is advised.",
-                    strategy_hint="Consider taking profits or hedging."
-                )
-        
-        self.fng_map = fng_map
+        self.classifier = FearAndGreedClassifier(config.thresholds.sentiment)
         
 
     def analyze(self, data: MarketData) -> SentimentArtifact:
@@ -51,15 +28,57 @@ class SentimentAnalyzer:
         if not data.fear_and_greed.entries:
             return SentimentArtifact.failed()
         
-        today_index = data.fear_and_greed.get_entry(dt.datetime.today().strftime("%Y%m%d"))
+        today_index = data.fear_and_greed.get_entry_for(dt.datetime.now(dt.timezone.utc).date())
         if today_index is None:
-            today_index = data.fear_and_greed.entries[-1]
+            today_index = max(data.fear_and_greed.entries, key=lambda entry: entry.timestamp)
         
-        sentiment_level = self.fng_map.get(today_index.value, FearAndGreedClassification(state="N/A", interpretation="N/A", strategy_hint="N/A"))
+        sentiment_level = self.classifier.classify(today_index.value)
         return SentimentArtifact(
             sentiment_index=today_index.value,
             original_classfication=str(today_index.value),
             state=sentiment_level["state"],
             interpretation=sentiment_level["interpretation"],
             hint=sentiment_level["strategy_hint"],
-        )
\ No newline at end of file
+        )
+
+
+    def analyze_history(
+        self,
+        fear_and_greed: FearAndGreedData,
+        *,
+        regime_window: int = 7,
+    ) -> SentimentSeries:
+        """Classify every day of `fear_and_greed` at once.
+
+        Each day gets the state of its own value and a regime: the state of
+        the mean over the last `regime_window` days, which filters out
+        single-day swings. `changes` lists the days the regime switched.
+        """
+        entries = sorted(fear_and_greed.entries, key=lambda entry: entry.timestamp)
+        timestamps = [entry.timestamp for entry in entries]
+        values = [entry.value for entry in entries]
+
+        states = [LEVELS[level]["state"] for level in self.classifier.levels(values)]
+        means = rolling_mean(array.array("d", values), regime_window)
+        regimes: t.List[SentimentState | None] = [
+            None if math.isnan(mean) else LEVELS[self.classifier.level(mean)]["state"]
+            for mean in means
+        ]
+
+        changes: t.List[RegimeChange] = []
+        previous: SentimentState | None = None
+        for timestamp, regime in zip(timestamps, regimes):
+            if regime is None:
+                continue
+            if previous is not None and regime != previous:
+                changes.append(RegimeChange(timestamp=timestamp, previous=previous, current=regime))
+            previous = regime
+
+        return SentimentSeries(
+            timestamps=timestamps,
+            values=values,
+            states=states,
+            regime_window=regime_window,
+            regimes=regimes,
+            changes=changes,
+        )
@@ -38,4 +38,40 @@ class SentimentArtifact(BaseModel):
             state="N/A",
             interpretation="N/A",
             hint="No data available to analyze sentiment."
-        )
\ No newline at end of file
+        )
+
+
+SentimentState = t.Literal["Extreme Fear", "Fear", "Neutral", "Greed", "Extreme Greed"]
+
+
+class RegimeChange(BaseModel):
+
+    timestamp: int
+    """Epoch seconds (UTC) of the day the new regime starts."""
+
+    previous: SentimentState
+    """The regime before the change."""
+
+    current: SentimentState
+    """The regime from `timestamp` on."""
+
+
+class SentimentSeries(BaseModel):
+
+    timestamps: t.List[int]
+    """Epoch seconds (UTC) of each daily entry, ascending."""
+
+    values: t.List[int]
+    """The Fear & Greed index of each day."""
+
+    states: t.List[SentimentState]
+    """The classification of each day's value."""
+
+    regime_window: int
+    """Days averaged into the regime."""
+
+    regimes: t.List[SentimentState | None]
+    """The classification of the rolling mean of `values`; None during warm-up."""
+
+    changes: t.List[RegimeChange]
+    """The days the regime switched, oldest first."""
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import array
+import bisect
+import functools
+import typing as t
+
+from .artifact import FearAndGreedClassification
+from ...config import SentimentThresholds
+
+LEVELS: t.Tuple[FearAndGreedClassification, ...] = (
+    FearAndGreedClassification(
+        state="Extreme Fear",
+        interpretation="The market is in extreme fear. Caution is advised.",
+        strategy_hint="Consider buying opportunities with caution."
+    ),
+    FearAndGreedClassification(
+        state="Fear",
+        interpretation="The market is fearful. Be cautious.",
+        strategy_hint="Consider defensive strategies."
+    ),
+    FearAndGreedClassification(
+        state="Greed",
+        interpretation="The market is greedy.",
+        strategy_hint="Enjoy the gains but stay vigilant. Get ready for profit-taking."
+    ),
+    FearAndGreedClassification(
+        state="Extreme Greed",
+        interpretation="The market is in extreme greed. Caution is advised.",
+        strategy_hint="Consider taking profits or hedging."
+    ),
+)
+"""Sentiment levels from the most fearful to the most greedy."""
+
+
+class FearAndGreedClassifier:
+    """Maps index values to `LEVELS` by bisecting the configured breakpoints.
+
+    A value below `extreme_fear` is Extreme Fear, below `fear` Fear, below
+    `greed` Greed, and anything from `greed` up (100 included) Extreme Greed.
+    `extreme_greed` only has to be at or above `greed`; it does not cap the
+    top level, so every index from 0 to 100 is classified.
+    """
+
+    def __init__(self, thresholds: SentimentThresholds) -> None:
+        self.breakpoints: t.Tuple[float, ...] = (
+            thresholds.extreme_fear,
+            thresholds.fear,
+            thresholds.greed,
+        )
+        if list(self.breakpoints) != sorted(self.breakpoints) or thresholds.extreme_greed < thresholds.greed:
+            raise ValueError("Sentiment thresholds must be ascending.")
+        self._level = functools.partial(bisect.bisect_right, self.breakpoints)
+
+
+    def level(self, value: float) -> int:
+        """Index into `LEVELS` of `value`."""
+        return self._level(value)
+
+
+    def classify(self, value: float) -> FearAndGreedClassification:
+        return LEVELS[self._level(value)]
+
+
+    def levels(self, values: t.Iterable[float]) -> "array.array[int]":
+        """`level` of every value in one pass."""
+        return array.array("b", map(self._level, values))
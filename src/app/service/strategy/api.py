@@ -1,10 +1,27 @@
+import typing as t
+
 from .artifact import StrategyArtifact
 from ..sentiment import SentimentArtifact
 from ..technical import TechnicalArtifact
+from ..technical.indicators import (
+    BollingerSpec,
+    IndicatorSpec,
+    MACDSpec,
+    OBVSpec,
+    RSISpec,
+)
 from ...config import AppConfig
 
 class StrategyExecutor: 
 
+    indicators: t.ClassVar[t.List[IndicatorSpec]] = [
+        RSISpec(period=14),
+        MACDSpec(fast=12, slow=26, signal=9),
+        BollingerSpec(period=20, width=2.0),
+        OBVSpec(),
+    ]
+    """Indicators the strategy reads from `TechnicalArtifact.metrix.indicators`."""
+
     def __init__(self, config: AppConfig) -> None:
         self.config = config
         
@@ -1,5 +1,6 @@
 from .api import TechnicalAnalyzer
-from .artifact import TechnicalArtifact
+from .artifact import TechnicalArtifact, TechnicalScanArtifact
+from .scan import TechnicalScanner
 
 
-__all__ = ['TechnicalAnalyzer', 'TechnicalArtifact']
\ No newline at end of file
+__all__ = ['TechnicalAnalyzer', 'TechnicalArtifact', 'TechnicalScanArtifact', 'TechnicalScanner']
\ No newline at end of file
@@ -1,16 +1,32 @@
+import typing as t
+
 from .artifact import (
     Metrix,
     TechnicalArtifact,
 )
 from .sma import (
+    MovingAverages,
     SMAFn, 
+    compute_smas,
     default_sma_fn
 )
+from .context import FrameContext
+from .indicators import (
+    IndicatorSet,
+    IndicatorSpec,
+    compute_indicators,
+)
+from .streaming import (
+    StreamingIndicators,
+    StreamingIndicatorsState,
+)
 from .volatile import (
+    Volatility,
     VolatilityFn,
+    compute_atr,
     default_volatility_fn
 )
-from ..market import MarketData
+from ..market import MarketData, OHLCVFrame
 from ...config import AppConfig
 
 class TechnicalAnalyzer: 
@@ -22,24 +38,134 @@ class TechnicalAnalyzer:
         *,
         sma_fn: SMAFn | None = None,
         volatility_fn: VolatilityFn | None = None,
+        indicators: t.Iterable[IndicatorSpec] = (),
+        streaming: bool = False,
     ) -> None:
+        """
+        With `streaming=True` the analyzer is meant for long-running loops:
+        the first `analyze` seeds incremental indicator state from the whole
+        history, and later calls only apply the revised last candle and any
+        newer ones, in O(1) each. The artifact's series then hold just the
+        candles touched by that call. Custom `sma_fn` / `volatility_fn` are
+        not used in this mode; `indicators` have no incremental state and
+        are recomputed over the frame, then cut to the touched candles.
+
+        `indicators` are computed on top of the ones listed in the config's
+        `thresholds.technical.indicators`, sharing intermediates with the
+        SMAs and the ATR.
+        """
         self.config = config
         self.sma_fn: SMAFn = sma_fn or default_sma_fn
         self.volatility_fn: VolatilityFn = volatility_fn or default_volatility_fn
+        self.indicators: t.List[IndicatorSpec] = [
+            *config.thresholds.technical.indicators,
+            *indicators,
+        ]
+        self.streaming = streaming
+        self._indicators: StreamingIndicators | None = None
 
 
     def analyze(
         self, 
         data: MarketData,
     ) -> TechnicalArtifact:
-        ohlcv_data = data.get_ohlcv_data()
+        return self.analyze_frame(data.get_ohlcv_frame())
+
+
+    def analyze_frame(self, frame: OHLCVFrame) -> TechnicalArtifact:
+        """Analyze one market's candles directly, e.g. frames of a universe scan."""
+        if self.streaming:
+            return self._analyze_incremental(frame)
 
-        sma = self.sma_fn(ohlcv_data)
-        volatility = self.volatility_fn(ohlcv_data)
+        context = FrameContext(frame)
+        thresholds = self.config.thresholds.technical
+
+        moving_averages = compute_smas(
+            frame, 
+            [thresholds.ma_period, *thresholds.ma_periods], 
+            context=context,
+        )
+        sma = (
+            moving_averages[thresholds.ma_period]
+            if self.sma_fn is default_sma_fn
+            else self.sma_fn(frame, period=thresholds.ma_period)
+        )
+        volatility = (
+            compute_atr(
+                frame,
+                period=thresholds.volatility_window,
+                smoothing=thresholds.volatility_smoothing,
+                context=context,
+            )
+            if self.volatility_fn is default_volatility_fn
+            else self.volatility_fn(frame, period=thresholds.volatility_window)
+        )
         
         return TechnicalArtifact(
             metrix=Metrix(
                 sma=sma,
-                volatility=volatility
+                moving_averages=moving_averages,
+                volatility=volatility,
+                indicators=(
+                    compute_indicators(frame, self.indicators, context=context)
+                    if self.indicators
+                    else None
+                ),
             ),
         )
+
+
+    def _analyze_incremental(self, frame: OHLCVFrame) -> TechnicalArtifact:
+        thresholds = self.config.thresholds.technical
+        if self._indicators is None:
+            self._indicators = StreamingIndicators(
+                sma_periods=thresholds.ma_periods,
+                slope_period=thresholds.ma_period,
+                atr_period=thresholds.volatility_window,
+                atr_smoothing=thresholds.volatility_smoothing,
+            )
+        points = self._indicators.feed(frame)
+        indicators = (
+            IndicatorSet(
+                results={
+                    key: series.tail(len(points))
+                    for key, series in compute_indicators(frame, self.indicators).results.items()
+                }
+            )
+            if self.indicators
+            else None
+        )
+
+        timestamps = [point.timestamp for point in points]
+        moving_averages = MovingAverages(
+            timestamps=timestamps,
+            series={
+                period: [point.smas[period] for point in points]
+                for period in self._indicators.smas
+            },
+        )
+        return TechnicalArtifact(
+            metrix=Metrix(
+                sma=moving_averages[thresholds.ma_period],
+                moving_averages=moving_averages,
+                volatility=Volatility(
+                    period=thresholds.volatility_window,
+                    smoothing=thresholds.volatility_smoothing,
+                    timestamps=timestamps,
+                    series=[point.atr for point in points],
+                ),
+                indicators=indicators,
+                latest=points[-1] if points else None,
+            ),
+        )
+
+
+    def snapshot(self) -> StreamingIndicatorsState | None:
+        """The incremental state in streaming mode, or None before the first `analyze`."""
+        return self._indicators.snapshot() if self._indicators is not None else None
+
+
+    def restore(self, state: StreamingIndicatorsState) -> None:
+        """Resume streaming from a `snapshot` instead of re-seeding from history."""
+        self.streaming = True
+        self._indicators = StreamingIndicators.restore(state)
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import typing as t
+
 from src.base import BaseModel
 
 from .sma import (
     SMA,
+    MovingAverages,
 )
+from .indicators import IndicatorSet
+from .streaming import IndicatorPoint
 from .volatile import (
     Volatility,
 )
@@ -13,13 +18,34 @@ from .volatile import (
 class Metrix(BaseModel):
 
     sma: SMA
-    """The Simple Moving Average (SMA) data."""
+    """The Simple Moving Average (SMA) data for the configured `ma_period`."""
+
+    moving_averages: MovingAverages | None = None
+    """The SMA ribbon for every configured period, computed in one pass."""
 
     volatility: Volatility
     """The Volatility data."""
 
+    indicators: IndicatorSet | None = None
+    """The indicators declared by the strategy and the config, keyed by spec."""
+
+    latest: IndicatorPoint | None = None
+    """Values at the last candle, including the slope of `sma`; set by the streaming analyzer."""
+
 
 class TechnicalArtifact(BaseModel): 
 
     metrix: Metrix
     """The computed technical metrix."""
+
+
+class TechnicalScanArtifact(BaseModel):
+
+    artifacts: t.Dict[str, TechnicalArtifact]
+    """The technical artifact of every scanned market, by market code."""
+
+    workers: int
+    """Processes the scan was spread over."""
+
+    elapsed: float
+    """Seconds spent computing, excluding the candle fetch."""
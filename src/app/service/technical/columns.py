@@ -0,0 +1,141 @@
+"""Whole-column arithmetic over contiguous float64 buffers.
+
+Each helper walks its inputs with C-level iterators (`itertools`, `map`,
+`operator`) instead of Python-level index loops, and marks undefined
+positions (warm-up, missing input) with NaN.
+"""
+from __future__ import annotations
+
+import array
+import itertools
+import math
+import operator
+import typing as t
+
+from ..market.ohlcv import Column
+
+NAN = math.nan
+
+
+def nans(n: int) -> "array.array[float]":
+    return array.array("d", [NAN]) * n
+
+
+def has_nan(values: Column) -> bool:
+    return any(map(math.isnan, values))
+
+
+def cumsum(values: Column) -> "array.array[float]":
+    """Running sums with a leading zero, so `sum(values[i:j]) == c[j] - c[i]`."""
+    return array.array("d", itertools.accumulate(values, initial=0.0))
+
+
+def rolling_mean(
+    values: Column,
+    period: int,
+    *,
+    sums: "array.array[float] | None" = None,
+) -> "array.array[float]":
+    """Trailing mean over `period` values; NaN during warm-up.
+
+    Pass precomputed `sums` (see `cumsum`) to share them between periods.
+    A window that contains a NaN input yields NaN without poisoning the
+    windows after it.
+    """
+    if period < 1:
+        raise ValueError("period must be at least 1.")
+    n = len(values)
+    out = nans(min(period - 1, n))
+    if n < period:
+        return out
+
+    if has_nan(values):
+        finite = array.array("d", (0.0 if math.isnan(v) else v for v in values))
+        sums = cumsum(finite)
+        missing = array.array("q", itertools.accumulate(map(math.isnan, values), initial=0))
+        means = map(operator.truediv, map(operator.sub, sums[period:], sums), itertools.repeat(float(period)))
+        gaps = map(operator.sub, missing[period:], missing)
+        out.extend(NAN if gap else mean for mean, gap in zip(means, gaps))
+        return out
+
+    sums = sums if sums is not None else cumsum(values)
+    out.extend(map(operator.truediv, map(operator.sub, sums[period:], sums), itertools.repeat(float(period))))
+    return out
+
+
+def diff(values: Column) -> "array.array[float]":
+    """`values[i] - values[i - 1]`, NaN at position 0."""
+    out = nans(min(1, len(values)))
+    out.extend(map(operator.sub, itertools.islice(values, 1, None), values))
+    return out
+
+
+def true_range(high: Column, low: Column, close: Column) -> "array.array[float]":
+    """`max(high - low, |high - prev_close|, |low - prev_close|)`; `high - low` for the first row."""
+    spread = array.array("d", map(operator.sub, high, low))
+    if len(spread) < 2:
+        return spread
+
+    out = spread[:1]
+    out.extend(
+        map(
+            max,
+            itertools.islice(spread, 1, None),
+            map(abs, map(operator.sub, itertools.islice(high, 1, None), close)),
+            map(abs, map(operator.sub, itertools.islice(low, 1, None), close)),
+        )
+    )
+    return out
+
+
+def smooth(
+    values: Column,
+    period: int,
+    *,
+    alpha: float,
+) -> "array.array[float]":
+    """Exponential smoothing seeded with the mean of the first `period` values.
+
+    `alpha = 2 / (period + 1)` gives the classic EMA, `alpha = 1 / period`
+    Wilder's smoothing. NaN during warm-up.
+    """
+    if period < 1:
+        raise ValueError("period must be at least 1.")
+    n = len(values)
+    out = nans(min(period - 1, n))
+    if n < period:
+        return out
+
+    seed = math.fsum(itertools.islice(values, period)) / period
+    decay = 1.0 - alpha
+    out.extend(
+        itertools.accumulate(
+            itertools.islice(values, period, None),
+            lambda prev, value: decay * prev + alpha * value,
+            initial=seed,
+        )
+    )
+    return out
+
+
+def leading_nans(values: Column) -> int:
+    """Length of the warm-up prefix of a derived column."""
+    return sum(1 for _ in itertools.takewhile(math.isnan, values))
+
+
+def smooth_defined(
+    values: Column,
+    period: int,
+    *,
+    alpha: float,
+) -> "array.array[float]":
+    """`smooth` over the part of `values` after its NaN warm-up, e.g. an EMA of an EMA."""
+    skip = leading_nans(values)
+    out = nans(skip)
+    out.extend(smooth(memoryview(values)[skip:] if skip else values, period, alpha=alpha))
+    return out
+
+
+def to_optional(values: Column) -> t.List[float | None]:
+    """NaN -> None, for JSON-friendly artifacts."""
+    return [None if math.isnan(v) else v for v in values]
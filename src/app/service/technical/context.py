@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import array
+import typing as t
+
+from .columns import cumsum, diff, smooth, true_range
+from ..market.ohlcv import OHLCVData, OHLCVFrame, as_frame
+
+T = t.TypeVar("T")
+
+
+class FrameContext:
+    """Derived columns of one OHLCV frame, each computed at most once.
+
+    Create one per analysis run and pass it to every indicator, so
+    intermediates such as the true range or the running close sum are
+    shared instead of recomputed by each indicator.
+    """
+
+    def __init__(self, ohlcv_data: OHLCVData | OHLCVFrame) -> None:
+        self.frame = as_frame(ohlcv_data)
+        self._cache: dict[t.Hashable, t.Any] = {}
+
+
+    def cached(self, key: t.Hashable, compute: t.Callable[[], T]) -> T:
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+
+    @property
+    def true_range(self) -> "array.array[float]":
+        return self.cached(
+            "true_range",
+            lambda: true_range(self.frame.high, self.frame.low, self.frame.close),
+        )
+
+
+    @property
+    def close_sums(self) -> "array.array[float]":
+        return self.cached("close_sums", lambda: cumsum(self.frame.close))
+
+
+    @property
+    def close_sq(self) -> "array.array[float]":
+        """`(close - close[0]) ** 2`.
+
+        Shifting by the first close keeps the squares small, so rolling
+        variances taken from their sums do not lose precision at KRW prices.
+        """
+        def compute() -> "array.array[float]":
+            close = self.frame.close
+            base = close[0] if len(close) else 0.0
+            return array.array("d", ((c - base) ** 2 for c in close))
+
+        return self.cached("close_sq", compute)
+
+
+    @property
+    def close_sq_sums(self) -> "array.array[float]":
+        return self.cached("close_sq_sums", lambda: cumsum(self.close_sq))
+
+
+    @property
+    def close_change(self) -> "array.array[float]":
+        """`close[i] - close[i - 1]`; the basis of returns, RSI and OBV."""
+        return self.cached("close_change", lambda: diff(self.frame.close))
+
+
+    def ema(self, period: int) -> "array.array[float]":
+        """EMA of the close, shared by every indicator that needs this period."""
+        return self.cached(
+            ("ema", period),
+            lambda: smooth(self.frame.close, period, alpha=2.0 / (period + 1)),
+        )
+
+
+def context_for(
+    ohlcv_data: OHLCVData | OHLCVFrame,
+    context: FrameContext | None,
+) -> FrameContext:
+    if context is not None:
+        return context
+    return FrameContext(ohlcv_data)
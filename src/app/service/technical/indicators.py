@@ -0,0 +1,285 @@
+"""Declarative indicators computed together over one frame.
+
+Callers (strategies, the config) declare `IndicatorSpec`s; `compute_indicators`
+evaluates them against a shared `FrameContext`, so intermediates such as the
+close change, the true range, running sums and EMAs are derived once per run
+no matter how many indicators use them. New kinds are added with
+`register_indicator`.
+"""
+from __future__ import annotations
+
+import array
+import itertools
+import math
+import operator
+import typing as t
+
+import pydantic
+
+from src.base import BaseModel
+
+from .columns import (
+    NAN,
+    nans,
+    rolling_mean,
+    smooth,
+    smooth_defined,
+    to_optional,
+)
+from .context import FrameContext, context_for
+from .series import TimeSeries
+from ..market.ohlcv import OHLCVData, OHLCVFrame
+
+
+class IndicatorSpec(BaseModel):
+    """Base of every indicator declaration."""
+
+    kind: str
+    """The registered indicator kind."""
+
+    name: str | None = None
+    """Key of the result in `IndicatorSet.results`; derived from the parameters when omitted."""
+
+    @property
+    def key(self) -> str:
+        return self.name or self.default_key()
+
+    def default_key(self) -> str:
+        return self.kind
+
+
+class EMASpec(IndicatorSpec):
+    kind: t.Literal["ema"] = "ema"
+
+    period: int = 20
+    """The EMA period; alpha = 2 / (period + 1)."""
+
+    def default_key(self) -> str:
+        return f"ema_{self.period}"
+
+
+class RSISpec(IndicatorSpec):
+    kind: t.Literal["rsi"] = "rsi"
+
+    period: int = 14
+    """The period of Wilder's smoothing of gains and losses."""
+
+    def default_key(self) -> str:
+        return f"rsi_{self.period}"
+
+
+class MACDSpec(IndicatorSpec):
+    kind: t.Literal["macd"] = "macd"
+
+    fast: int = 12
+    """The fast EMA period."""
+
+    slow: int = 26
+    """The slow EMA period."""
+
+    signal: int = 9
+    """The EMA period of the signal line."""
+
+    def default_key(self) -> str:
+        return f"macd_{self.fast}_{self.slow}_{self.signal}"
+
+
+class BollingerSpec(IndicatorSpec):
+    kind: t.Literal["bollinger"] = "bollinger"
+
+    period: int = 20
+    """The window of the middle band (SMA) and the standard deviation."""
+
+    width: float = 2.0
+    """Distance of the upper and lower bands in standard deviations."""
+
+    def default_key(self) -> str:
+        return f"bollinger_{self.period}_{self.width:g}"
+
+
+class OBVSpec(IndicatorSpec):
+    kind: t.Literal["obv"] = "obv"
+
+
+AnyIndicatorSpec = t.Annotated[
+    t.Union[EMASpec, RSISpec, MACDSpec, BollingerSpec, OBVSpec],
+    pydantic.Field(discriminator="kind"),
+]
+"""The built-in specs, as parsed from configuration."""
+
+
+class EMA(TimeSeries):
+    kind: t.Literal["ema"] = "ema"
+    period: int
+
+
+class RSI(TimeSeries):
+    kind: t.Literal["rsi"] = "rsi"
+    period: int
+
+
+class MACD(TimeSeries):
+    """`series` is the MACD line (fast EMA - slow EMA)."""
+
+    kind: t.Literal["macd"] = "macd"
+    fast: int
+    slow: int
+
+    signal_period: int
+    signal: t.List[float | None]
+    """EMA of the MACD line."""
+
+    histogram: t.List[float | None]
+    """MACD line - signal line."""
+
+
+class BollingerBands(TimeSeries):
+    """`series` is the middle band (SMA of the close)."""
+
+    kind: t.Literal["bollinger"] = "bollinger"
+    period: int
+    width: float
+
+    upper: t.List[float | None]
+    lower: t.List[float | None]
+
+
+class OBV(TimeSeries):
+    kind: t.Literal["obv"] = "obv"
+
+
+Indicator = t.Annotated[
+    t.Union[EMA, RSI, MACD, BollingerBands, OBV],
+    pydantic.Field(discriminator="kind"),
+]
+
+
+class IndicatorSet(BaseModel):
+
+    results: t.Dict[str, Indicator]
+    """Each declared indicator, keyed by `IndicatorSpec.key`."""
+
+    def __getitem__(self, key: str) -> Indicator:
+        return self.results[key]
+
+
+IndicatorFn = t.Callable[[t.Any, FrameContext], TimeSeries]
+"""Computes one indicator from its spec and the run's shared context."""
+
+F = t.TypeVar("F", bound=IndicatorFn)
+
+INDICATORS: dict[str, IndicatorFn] = {}
+"""Compute functions by indicator kind."""
+
+
+def register_indicator(kind: str) -> t.Callable[[F], F]:
+    def decorator(fn: F) -> F:
+        INDICATORS[kind] = fn
+        return fn
+    return decorator
+
+
+def compute_indicators(
+    ohlcv_data: OHLCVData | OHLCVFrame,
+    specs: t.Iterable[IndicatorSpec],
+    *,
+    context: FrameContext | None = None,
+) -> IndicatorSet:
+    """Evaluate every spec against one shared context; duplicate keys are computed once."""
+    context = context_for(ohlcv_data, context)
+    results: dict[str, TimeSeries] = {}
+    for spec in specs:
+        if spec.key in results:
+            continue
+        fn = INDICATORS.get(spec.kind)
+        if fn is None:
+            raise ValueError(f"Unknown indicator kind '{spec.kind}'.")
+        results[spec.key] = fn(spec, context)
+    return IndicatorSet(results=results)
+
+
+def _timestamps(context: FrameContext) -> t.List[int]:
+    return context.cached("timestamps", lambda: list(context.frame.timestamp))
+
+
+@register_indicator("ema")
+def _ema(spec: EMASpec, context: FrameContext) -> EMA:
+    return EMA(
+        period=spec.period,
+        timestamps=_timestamps(context),
+        series=to_optional(context.ema(spec.period)),
+    )
+
+
+@register_indicator("rsi")
+def _rsi(spec: RSISpec, context: FrameContext) -> RSI:
+    changes = memoryview(context.close_change)[1:]
+    alpha = 1.0 / spec.period
+    gains = smooth(array.array("d", (max(c, 0.0) for c in changes)), spec.period, alpha=alpha)
+    losses = smooth(array.array("d", (max(-c, 0.0) for c in changes)), spec.period, alpha=alpha)
+
+    def rsi(gain: float, loss: float) -> float:
+        if math.isnan(gain):
+            return NAN
+        if loss == 0.0:
+            return 100.0 if gain > 0.0 else 50.0
+        return 100.0 - 100.0 / (1.0 + gain / loss)
+
+    out = nans(min(1, len(context.frame)))
+    out.extend(map(rsi, gains, losses))
+    return RSI(period=spec.period, timestamps=_timestamps(context), series=to_optional(out))
+
+
+@register_indicator("macd")
+def _macd(spec: MACDSpec, context: FrameContext) -> MACD:
+    line = array.array("d", map(operator.sub, context.ema(spec.fast), context.ema(spec.slow)))
+    signal = smooth_defined(line, spec.signal, alpha=2.0 / (spec.signal + 1))
+    return MACD(
+        fast=spec.fast,
+        slow=spec.slow,
+        signal_period=spec.signal,
+        timestamps=_timestamps(context),
+        series=to_optional(line),
+        signal=to_optional(signal),
+        histogram=to_optional(array.array("d", map(operator.sub, line, signal))),
+    )
+
+
+@register_indicator("bollinger")
+def _bollinger(spec: BollingerSpec, context: FrameContext) -> BollingerBands:
+    close = context.frame.close
+    base = close[0] if len(close) else 0.0
+    middle = rolling_mean(close, spec.period, sums=context.close_sums)
+    mean_sq = rolling_mean(context.close_sq, spec.period, sums=context.close_sq_sums)
+
+    # Var = E[(c - base)^2] - (E[c] - base)^2; see `FrameContext.close_sq`.
+    stddev = array.array(
+        "d",
+        (math.sqrt(max(sq - (m - base) ** 2, 0.0)) for m, sq in zip(middle, mean_sq)),
+    )
+    offset = array.array("d", map(operator.mul, stddev, itertools.repeat(spec.width)))
+    return BollingerBands(
+        period=spec.period,
+        width=spec.width,
+        timestamps=_timestamps(context),
+        series=to_optional(middle),
+        upper=to_optional(array.array("d", map(operator.add, middle, offset))),
+        lower=to_optional(array.array("d", map(operator.sub, middle, offset))),
+    )
+
+
+@register_indicator("obv")
+def _obv(spec: OBVSpec, context: FrameContext) -> OBV:
+    def signed(change: float, volume: float) -> float:
+        return volume if change > 0 else -volume if change < 0 else 0.0
+
+    frame = context.frame
+    out = array.array("d")
+    if len(frame):
+        out.extend(
+            itertools.accumulate(
+                map(signed, itertools.islice(context.close_change, 1, None), itertools.islice(frame.volume, 1, None)),
+                initial=0.0,
+            )
+        )
+    return OBV(timestamps=_timestamps(context), series=to_optional(out))
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import time
+import typing as t
+from concurrent import futures
+
+from .api import TechnicalAnalyzer
+from .artifact import TechnicalArtifact, TechnicalScanArtifact
+from .indicators import IndicatorSpec
+from ..market.ohlcv import OHLCVFrame
+from ..market.shared import (
+    FrameHandle,
+    SharedFrames,
+    attach_frame,
+    detach_frame,
+)
+from ...config import AppConfig
+
+
+_worker_analyzer: TechnicalAnalyzer | None = None
+"""The analyzer of a scan worker process, built once by `_init_worker`."""
+
+
+def _init_worker(config: AppConfig, indicators: t.List[IndicatorSpec]) -> None:
+    global _worker_analyzer
+    _worker_analyzer = TechnicalAnalyzer(config, indicators=indicators)
+
+
+def _analyze_handle(handle: FrameHandle) -> TechnicalArtifact:
+    frame = attach_frame(handle)
+    try:
+        return t.cast(TechnicalAnalyzer, _worker_analyzer).analyze_frame(frame)
+    finally:
+        detach_frame(frame)
+
+
+class TechnicalScanner:
+    """Runs the technical analysis over many markets on a process pool.
+
+    Frames are packed into one shared memory segment per scan; workers get
+    only a small `FrameHandle` per market and read the columns in place.
+    The config and the indicator specs are sent once per worker, when the
+    pool starts. Scans with fewer markets than `min_parallel` run inline,
+    where starting the pool would cost more than it saves.
+    """
+
+    def __init__(
+        self,
+        config: AppConfig,
+        *,
+        indicators: t.Iterable[IndicatorSpec] = (),
+        max_workers: int | None = None,
+        min_parallel: int = 8,
+    ) -> None:
+        self.config = config
+        self.indicators = list(indicators)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.min_parallel = min_parallel
+        self._pool: futures.ProcessPoolExecutor | None = None
+
+
+    def _get_pool(self) -> futures.ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = futures.ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.config, self.indicators),
+            )
+        return self._pool
+
+
+    def scan(self, frames: t.Mapping[str, OHLCVFrame]) -> TechnicalScanArtifact:
+        started = time.perf_counter()
+        if self.max_workers == 1 or len(frames) < self.min_parallel:
+            analyzer = TechnicalAnalyzer(self.config, indicators=self.indicators)
+            artifacts = {market: analyzer.analyze_frame(frame) for market, frame in frames.items()}
+            workers = 1
+        else:
+            with SharedFrames(frames) as shared:
+                markets = list(shared.handles)
+                # A few chunks per worker balances load without one IPC round trip per market.
+                chunksize = max(1, len(markets) // (self.max_workers * 4))
+                results = self._get_pool().map(
+                    _analyze_handle,
+                    [shared.handles[market] for market in markets],
+                    chunksize=chunksize,
+                )
+                artifacts = dict(zip(markets, results))
+            workers = self.max_workers
+
+        return TechnicalScanArtifact(
+            artifacts=artifacts,
+            workers=workers,
+            elapsed=time.perf_counter() - started,
+        )
+
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import datetime as dt
+import typing as t
+
+import pydantic
+
+from src.base import BaseModel
+
+from ..market.ohlcv import datetime_to_epoch, epoch_to_datetime
+
+
+class TimeSeries(BaseModel):
+    """A compact indicator series aligned to candle timestamps."""
+
+    timestamps: t.List[int]
+    """Epoch seconds (UTC) of each candle, ascending."""
+
+    series: t.List[float | None]
+    """The indicator value at each timestamp; None where it is undefined (e.g. warm-up)."""
+
+    @pydantic.model_validator(mode="before")
+    @classmethod
+    def _from_values(cls, data: t.Any) -> t.Any:
+        """Accept the older `values={datetime: value}` layout."""
+        if isinstance(data, dict) and "values" in data and "series" not in data:
+            data = dict(data)
+            values: dict[dt.datetime, float | None] = data.pop("values")
+            dates = sorted(values.keys())
+            data["timestamps"] = [datetime_to_epoch(d) for d in dates]
+            data["series"] = [values[d] for d in dates]
+        return data
+
+    @property
+    def values(self) -> dict[dt.datetime, float | None]:
+        return dict(zip(map(epoch_to_datetime, self.timestamps), self.series))
+
+    def tail(self, count: int) -> t.Self:
+        """The last `count` points; every list aligned to `timestamps` is cut alike."""
+        size = len(self.timestamps)
+        start = max(0, size - count)
+        return self.model_copy(
+            update={
+                name: value[start:]
+                for name, value in self
+                if isinstance(value, list) and len(value) == size
+            }
+        )
@@ -5,58 +5,84 @@ import typing as t
 
 from src.base import BaseModel
 
-from ..market.ohlcv import OHLCVData
+from .columns import rolling_mean, to_optional
+from .context import FrameContext, context_for
+from .series import TimeSeries
+from ..market.ohlcv import (
+    OHLCVData, 
+    OHLCVFrame, 
+    epoch_to_datetime,
+)
 
 
 class SMAFn(t.Protocol):
     def __call__(
         self, 
-        ohlcv_data: OHLCVData,
+        ohlcv_data: OHLCVData | OHLCVFrame,
         *,
         period: int = 20
     ) -> SMA: ...
 
 
-class SMA(BaseModel):
+class SMA(TimeSeries):
 
-    values: t.Dict[dt.datetime, float | None]
+    period: int | None = None
+    """The moving average period."""
 
     @property
     def slope(self) -> dict[dt.datetime, float | None]:
-        sorted_dates = sorted(self.values.keys())
         slopes: dict[dt.datetime, float | None] = {}
 
-        for i in range(1, len(sorted_dates)):
-            date = sorted_dates[i]
-            prev_date = sorted_dates[i - 1]
-
-            v = self.values[date]
-            pv = self.values[prev_date]
+        for i in range(1, len(self.timestamps)):
+            v = self.series[i]
+            pv = self.series[i - 1]
 
             if v is None or pv is None:
-                slopes[date] = None
+                slopes[epoch_to_datetime(self.timestamps[i])] = None
             else:
-                slopes[date] = v - pv
+                slopes[epoch_to_datetime(self.timestamps[i])] = v - pv
 
         return slopes
-    
 
-def default_sma_fn(
-    ohlcv_data: OHLCVData,
-    *,
-    period: int = 20
-) -> SMA:
-    dates = sorted(ohlcv_data.keys())
-    values: dict[dt.datetime, float | None] = {}
 
-    closes = [ohlcv_data[d].close for d in dates]
+class MovingAverages(BaseModel):
+
+    timestamps: t.List[int]
+    """Epoch seconds (UTC) of each candle, ascending; shared by every period."""
+
+    series: t.Dict[int, t.List[float | None]]
+    """The average for each period; None during warm-up."""
 
-    for i, d in enumerate(dates):
-        if i + 1 < period:
-            values[d] = None
-            continue
+    def __getitem__(self, period: int) -> SMA:
+        return SMA(period=period, timestamps=self.timestamps, series=self.series[period])
 
-        window = closes[i + 1 - period : i + 1]
-        values[d] = sum(window) / period
 
-    return SMA(values=values)
\ No newline at end of file
+def compute_smas(
+    ohlcv_data: OHLCVData | OHLCVFrame,
+    periods: t.Iterable[int],
+    *,
+    context: FrameContext | None = None,
+) -> MovingAverages:
+    """Simple moving averages of the close for every period in one pass.
+
+    The running sum of the close column is computed once and every period
+    is a single subtraction over it, so the cost is O(n) per period instead
+    of O(n * period).
+    """
+    context = context_for(ohlcv_data, context)
+    frame = context.frame
+    return MovingAverages(
+        timestamps=list(frame.timestamp),
+        series={
+            period: to_optional(rolling_mean(frame.close, period, sums=context.close_sums))
+            for period in sorted(set(periods))
+        },
+    )
+
+
+def default_sma_fn(
+    ohlcv_data: OHLCVData | OHLCVFrame,
+    *,
+    period: int = 20
+) -> SMA:
+    return compute_smas(ohlcv_data, [period])[period]
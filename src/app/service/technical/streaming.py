@@ -0,0 +1,347 @@
+"""Incremental indicators for live loops.
+
+Every indicator keeps its state *committed* up to the previous candle plus
+the inputs of the last, possibly still-open candle. A revision of the last
+candle recomputes only its contribution from the committed state; a new
+candle commits the last one first. Both are O(1), so the cost of a tick does
+not depend on how much history has been seen.
+"""
+from __future__ import annotations
+
+import collections
+import math
+import typing as t
+
+from src.base import BaseModel
+
+from .volatile import Smoothing
+from ..market.ohlcv import OHLCVFrame
+
+_RESUM_EVERY = 10_000
+"""Updates between exact re-summations of a running window sum, to cancel float drift."""
+
+
+class _Window:
+    """Fixed-size window with a running sum; the sum is periodically recomputed exactly."""
+
+    def __init__(self, size: int, values: t.Iterable[float] = ()) -> None:
+        self.size = size
+        self.values: collections.deque[float] = collections.deque(values, maxlen=size or None)
+        if size == 0:
+            self.values.clear()
+        self.total = math.fsum(self.values)
+        self._updates = 0
+
+    @property
+    def full(self) -> bool:
+        return len(self.values) == self.size
+
+    def push(self, value: float) -> None:
+        if self.size == 0:
+            return
+        if self.full:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+
+        self._updates += 1
+        if self._updates >= _RESUM_EVERY:
+            self.total = math.fsum(self.values)
+            self._updates = 0
+
+
+class StreamingSMAState(BaseModel):
+    period: int
+    window: t.List[float]
+    last_timestamp: int | None = None
+    last_close: float | None = None
+
+
+class StreamingSMA:
+    """Simple moving average of the close, updated one candle at a time."""
+
+    def __init__(self, period: int) -> None:
+        if period < 1:
+            raise ValueError("period must be at least 1.")
+        self.period = period
+        self._committed = _Window(period - 1)
+        self.last_timestamp: int | None = None
+        self._last_close: float | None = None
+
+
+    @property
+    def value(self) -> float | None:
+        if self._last_close is None or not self._committed.full:
+            return None
+        return (self._committed.total + self._last_close) / self.period
+
+
+    def update(self, timestamp: int, close: float) -> float | None:
+        """Feed a new candle, or a revision of the last one, and return the new value."""
+        if self.last_timestamp is not None and timestamp < self.last_timestamp:
+            raise ValueError("Candles must be fed in time order.")
+        if self.last_timestamp is not None and timestamp > self.last_timestamp:
+            self._committed.push(t.cast(float, self._last_close))
+
+        self.last_timestamp = timestamp
+        self._last_close = close
+        return self.value
+
+
+    def snapshot(self) -> StreamingSMAState:
+        return StreamingSMAState(
+            period=self.period,
+            window=list(self._committed.values),
+            last_timestamp=self.last_timestamp,
+            last_close=self._last_close,
+        )
+
+
+    @classmethod
+    def restore(cls, state: StreamingSMAState) -> StreamingSMA:
+        sma = cls(state.period)
+        sma._committed = _Window(state.period - 1, state.window)
+        sma.last_timestamp = state.last_timestamp
+        sma._last_close = state.last_close
+        return sma
+
+
+class StreamingATRState(BaseModel):
+    period: int
+    smoothing: Smoothing
+    window: t.List[float]
+    committed_atr: float | None = None
+    prev_close: float | None = None
+    last_timestamp: int | None = None
+    last_candle: t.Tuple[float, float, float] | None = None
+
+
+class StreamingATR:
+    """Average true range, updated one candle at a time.
+
+    Matches `compute_atr` for the same period and smoothing: the simple mode
+    keeps a window of true ranges, the exponential modes keep the ATR as of
+    the previous candle (and a warm-up window until the first seed).
+    """
+
+    def __init__(self, period: int, smoothing: Smoothing = "simple") -> None:
+        if period < 1:
+            raise ValueError("period must be at least 1.")
+        self.period = period
+        self.smoothing: Smoothing = smoothing
+        self._alpha = {"simple": 0.0, "exponential": 2.0 / (period + 1), "wilder": 1.0 / period}[smoothing]
+        self._committed = _Window(period - 1)
+        self._committed_atr: float | None = None
+        self._prev_close: float | None = None
+        self.last_timestamp: int | None = None
+        self._last: t.Tuple[float, float, float] | None = None
+
+
+    def _true_range(self) -> float | None:
+        if self._last is None:
+            return None
+        high, low, _ = self._last
+        if self._prev_close is None:
+            return high - low
+        return max(high - low, abs(high - self._prev_close), abs(low - self._prev_close))
+
+
+    @property
+    def value(self) -> float | None:
+        tr = self._true_range()
+        if tr is None:
+            return None
+        if self.smoothing != "simple" and self._committed_atr is not None:
+            return (1.0 - self._alpha) * self._committed_atr + self._alpha * tr
+        if not self._committed.full:
+            return None
+        return (self._committed.total + tr) / self.period
+
+
+    def update(self, timestamp: int, high: float, low: float, close: float) -> float | None:
+        if self.last_timestamp is not None and timestamp < self.last_timestamp:
+            raise ValueError("Candles must be fed in time order.")
+        if self.last_timestamp is not None and timestamp > self.last_timestamp:
+            self._commit()
+
+        self.last_timestamp = timestamp
+        self._last = (high, low, close)
+        return self.value
+
+
+    def _commit(self) -> None:
+        value, tr = self.value, t.cast(float, self._true_range())
+        if self.smoothing == "simple" or value is None:
+            self._committed.push(tr)
+        else:
+            self._committed_atr = value
+        self._prev_close = t.cast(t.Tuple[float, float, float], self._last)[2]
+
+
+    def snapshot(self) -> StreamingATRState:
+        return StreamingATRState(
+            period=self.period,
+            smoothing=self.smoothing,
+            window=list(self._committed.values),
+            committed_atr=self._committed_atr,
+            prev_close=self._prev_close,
+            last_timestamp=self.last_timestamp,
+            last_candle=self._last,
+        )
+
+
+    @classmethod
+    def restore(cls, state: StreamingATRState) -> StreamingATR:
+        atr = cls(state.period, state.smoothing)
+        atr._committed = _Window(state.period - 1, state.window)
+        atr._committed_atr = state.committed_atr
+        atr._prev_close = state.prev_close
+        atr.last_timestamp = state.last_timestamp
+        atr._last = state.last_candle
+        return atr
+
+
+class StreamingSlopeState(BaseModel):
+    previous: float | None = None
+    current: float | None = None
+    last_timestamp: int | None = None
+
+
+class StreamingSlope:
+    """Change of a series between the previous candle and the last one."""
+
+    def __init__(self) -> None:
+        self._previous: float | None = None
+        self._current: float | None = None
+        self.last_timestamp: int | None = None
+
+
+    @property
+    def value(self) -> float | None:
+        if self._previous is None or self._current is None:
+            return None
+        return self._current - self._previous
+
+
+    def update(self, timestamp: int, value: float | None) -> float | None:
+        if self.last_timestamp is not None and timestamp < self.last_timestamp:
+            raise ValueError("Values must be fed in time order.")
+        if self.last_timestamp is not None and timestamp > self.last_timestamp:
+            self._previous = self._current
+
+        self.last_timestamp = timestamp
+        self._current = value
+        return self.value
+
+
+    def snapshot(self) -> StreamingSlopeState:
+        return StreamingSlopeState(
+            previous=self._previous,
+            current=self._current,
+            last_timestamp=self.last_timestamp,
+        )
+
+
+    @classmethod
+    def restore(cls, state: StreamingSlopeState) -> StreamingSlope:
+        slope = cls()
+        slope._previous = state.previous
+        slope._current = state.current
+        slope.last_timestamp = state.last_timestamp
+        return slope
+
+
+class StreamingIndicatorsState(BaseModel):
+    smas: t.Dict[int, StreamingSMAState]
+    atr: StreamingATRState
+    slope_period: int
+    slope: StreamingSlopeState
+
+
+class IndicatorPoint(BaseModel):
+    """Indicator values after one candle update."""
+
+    timestamp: int
+    smas: t.Dict[int, float | None]
+    slope: float | None
+    atr: float | None
+
+
+class StreamingIndicators:
+    """The SMA ribbon, the slope of the primary SMA and the ATR, kept live together."""
+
+    def __init__(
+        self,
+        *,
+        sma_periods: t.Iterable[int],
+        slope_period: int,
+        atr_period: int,
+        atr_smoothing: Smoothing = "simple",
+    ) -> None:
+        self.smas = {period: StreamingSMA(period) for period in sorted({slope_period, *sma_periods})}
+        self.slope_period = slope_period
+        self.slope = StreamingSlope()
+        self.atr = StreamingATR(atr_period, atr_smoothing)
+
+
+    @property
+    def last_timestamp(self) -> int | None:
+        return self.atr.last_timestamp
+
+
+    def update(
+        self,
+        timestamp: int,
+        high: float,
+        low: float,
+        close: float,
+    ) -> IndicatorPoint:
+        values = {period: sma.update(timestamp, close) for period, sma in self.smas.items()}
+        return IndicatorPoint(
+            timestamp=timestamp,
+            smas=values,
+            slope=self.slope.update(timestamp, values[self.slope_period]),
+            atr=self.atr.update(timestamp, high, low, close),
+        )
+
+
+    def feed(self, frame: OHLCVFrame) -> t.List[IndicatorPoint]:
+        """Feed every candle of `frame` at or after the last one seen.
+
+        The first call seeds the state from the whole history; later calls
+        only touch the revised last candle and any newer ones.
+        """
+        start = 0
+        last = self.last_timestamp
+        if last is not None:
+            # Walk back from the end; live frames only ever add a few candles.
+            start = len(frame)
+            while start > 0 and frame.timestamp[start - 1] >= last:
+                start -= 1
+        return [
+            self.update(frame.timestamp[i], frame.high[i], frame.low[i], frame.close[i])
+            for i in range(start, len(frame))
+        ]
+
+
+    def snapshot(self) -> StreamingIndicatorsState:
+        return StreamingIndicatorsState(
+            smas={period: sma.snapshot() for period, sma in self.smas.items()},
+            atr=self.atr.snapshot(),
+            slope_period=self.slope_period,
+            slope=self.slope.snapshot(),
+        )
+
+
+    @classmethod
+    def restore(cls, state: StreamingIndicatorsState) -> StreamingIndicators:
+        indicators = cls(
+            sma_periods=state.smas.keys(),
+            slope_period=state.slope_period,
+            atr_period=state.atr.period,
+            atr_smoothing=state.atr.smoothing,
+        )
+        indicators.smas = {period: StreamingSMA.restore(s) for period, s in state.smas.items()}
+        indicators.atr = StreamingATR.restore(state.atr)
+        indicators.slope = StreamingSlope.restore(state.slope)
+        return indicators
@@ -1,55 +1,73 @@
 from __future__ import annotations
 
-import datetime as dt
 import typing as t
 
-from src.base import BaseModel
+from .columns import rolling_mean, smooth, to_optional
+from .context import FrameContext, context_for
+from .series import TimeSeries
+from ..market.ohlcv import OHLCVData, OHLCVFrame
 
-from .ohlcv import OHLCVData
+Smoothing = t.Literal["simple", "exponential", "wilder"]
+"""How true ranges are averaged into the ATR.
+- simple: trailing mean over `period`
+- exponential: EMA with alpha = 2 / (period + 1)
+- wilder: Wilder's smoothing, alpha = 1 / period
+"""
 
 
 class VolatilityFn(t.Protocol):
     def __call__(
         self,
-        ohlcv_data: OHLCVData,
+        ohlcv_data: OHLCVData | OHLCVFrame,
         *,
         period: int = ...
     ) -> Volatility: ...
 
     
-class Volatility(BaseModel):
+class Volatility(TimeSeries):
 
-    values: t.Dict[dt.datetime, float | None]
+    period: int | None = None
+    """The ATR period."""
 
+    smoothing: Smoothing = "simple"
+    """The smoothing used to average true ranges."""
 
-def default_volatility_fn(
-    ohlcv_data: OHLCVData,
+
+def compute_atr(
+    ohlcv_data: OHLCVData | OHLCVFrame,
     *,
-    period: int = 14
+    period: int = 14,
+    smoothing: Smoothing = "simple",
+    context: FrameContext | None = None,
 ) -> Volatility:
-    dates = sorted(ohlcv_data.keys())
-    values: dict[dt.datetime, float | None] = {}
-
-    trs: list[float] = []
+    """Average true range over whole columns.
 
-    for i, d in enumerate(dates):
-        o = ohlcv_data[d]
+    The true range comes from `context`, so other range-based indicators in
+    the same run reuse it instead of recomputing it.
+    """
+    context = context_for(ohlcv_data, context)
+    trs = context.true_range
 
-        if i == 0:
-            tr = o.high - o.low
-        else:
-            prev_close = ohlcv_data[dates[i - 1]].close
-            tr = max(
-                o.high - o.low,
-                abs(o.high - prev_close),
-                abs(o.low - prev_close),
-            )
+    if smoothing == "simple":
+        atr = rolling_mean(trs, period)
+    elif smoothing == "exponential":
+        atr = smooth(trs, period, alpha=2.0 / (period + 1))
+    elif smoothing == "wilder":
+        atr = smooth(trs, period, alpha=1.0 / period)
+    else:
+        raise ValueError(f"Unknown smoothing '{smoothing}'.")
 
-        trs.append(tr)
+    return Volatility(
+        period=period,
+        smoothing=smoothing,
+        timestamps=list(context.frame.timestamp),
+        series=to_optional(atr),
+    )
 
-        if i + 1 < period:
-            values[d] = None
-        else:
-            values[d] = sum(trs[i + 1 - period : i + 1]) / period
 
-    return Volatility(values=values)
\ No newline at end of file
+def default_volatility_fn(
+    ohlcv_data: OHLCVData | OHLCVFrame,
+    *,
+    period: int = 14
+) -> Volatility:
+    return compute_atr(ohlcv_data, period=period)
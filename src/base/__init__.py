@@ -1,11 +1,34 @@
 from .types import JSONValue, SerdeCapable
 from .model import BaseModel
-from .http_client import HTTPClientBase
+from .transport import TransportConfig
+from .retry import RetryPolicy, CircuitBreakerPolicy, CircuitBreakers, CircuitOpenError
+from .cache import (
+    CachePolicy,
+    ResponseCache,
+    MemoryCacheBackend,
+    DiskCacheBackend,
+    CacheStats,
+)
+from .lean import LeanDecoder, lean_record
+from .http_client import HTTPClientBase, AsyncHTTPClientBase
 
 
 __all__ = [
     "JSONValue",
     "SerdeCapable",
     "BaseModel",
+    "TransportConfig",
+    "RetryPolicy",
+    "CircuitBreakerPolicy",
+    "CircuitBreakers",
+    "CircuitOpenError",
+    "CachePolicy",
+    "ResponseCache",
+    "MemoryCacheBackend",
+    "DiskCacheBackend",
+    "CacheStats",
+    "LeanDecoder",
+    "lean_record",
     "HTTPClientBase",
+    "AsyncHTTPClientBase",
 ]
\ No newline at end of file
@@ -0,0 +1,324 @@
+import collections
+import hashlib
+import json
+import os
+import pathlib
+import threading
+import time
+import typing as t
+from urllib.parse import urlencode
+
+import httpx
+import pydantic
+
+from .model import BaseModel
+
+
+class CacheEntry(BaseModel):
+
+    content: bytes
+    """The raw response body."""
+
+    headers: dict[str, str]
+    """Response headers needed to rebuild the response and revalidate it."""
+
+    stored_at: float
+    """Wall-clock time (epoch seconds) the entry was stored or last revalidated."""
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+
+class CacheStats(BaseModel):
+
+    hits: int = 0
+    """Requests served from a fresh entry without touching the network."""
+
+    misses: int = 0
+    """Cacheable requests that had to go to the network."""
+
+    revalidated: int = 0
+    """Stale entries confirmed unchanged by a 304 response."""
+
+    stores: int = 0
+    """Responses written to the backend."""
+
+    evictions: int = 0
+    """Entries dropped to keep the backend within its size bound."""
+
+
+class CacheBackend(t.Protocol):
+
+    stats: CacheStats
+
+    def get(self, key: str) -> CacheEntry | None: ...
+
+    def set(self, key: str, entry: CacheEntry) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU bounded by the total size of cached bodies."""
+
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: collections.OrderedDict[str, CacheEntry] = collections.OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.content)
+            self._entries[key] = entry
+            self._size += len(entry.content)
+            self.stats.stores += 1
+
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.content)
+                self.stats.evictions += 1
+
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class DiskCacheBackend:
+    """On-disk LRU, one file per entry, bounded by the total size of the files.
+
+    Each file holds a JSON metadata line followed by the raw body. Recency is
+    tracked with file modification times so it survives restarts.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.directory = pathlib.Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+        files = sorted(self.directory.glob("*.entry"), key=lambda path: path.stat().st_mtime)
+        self._sizes: collections.OrderedDict[str, int] = collections.OrderedDict(
+            (path.stem, path.stat().st_size) for path in files
+        )
+        self._size = sum(self._sizes.values())
+
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.directory / f"{key}.entry"
+
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            if key not in self._sizes:
+                return None
+            path = self._path(key)
+            try:
+                with path.open("rb") as f:
+                    meta = json.loads(f.readline())
+                    content = f.read()
+                os.utime(path)
+            except (OSError, ValueError):
+                self._size -= self._sizes.pop(key)
+                return None
+            self._sizes.move_to_end(key)
+
+        return CacheEntry(content=content, headers=meta["headers"], stored_at=meta["stored_at"])
+
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        meta = json.dumps({"headers": entry.headers, "stored_at": entry.stored_at}).encode()
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        with self._lock:
+            tmp.write_bytes(meta + b"\n" + entry.content)
+            os.replace(tmp, path)
+
+            self._size -= self._sizes.pop(key, 0)
+            self._sizes[key] = path.stat().st_size
+            self._size += self._sizes[key]
+            self.stats.stores += 1
+
+            while self._size > self.max_bytes and len(self._sizes) > 1:
+                evicted, size = self._sizes.popitem(last=False)
+                self._path(evicted).unlink(missing_ok=True)
+                self._size -= size
+                self.stats.evictions += 1
+
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in self._sizes:
+                self._path(key).unlink(missing_ok=True)
+            self._sizes.clear()
+            self._size = 0
+
+
+class CachePolicy(BaseModel):
+    """Settings for the response cache of slow-changing endpoints."""
+
+    enabled: bool = True
+    """Whether responses are cached at all."""
+
+    backend: t.Literal["memory", "disk"] = "memory"
+    """Where cached responses are kept."""
+
+    directory: str = ".cache/http"
+    """Directory of the disk backend."""
+
+    max_bytes: int = 32 * 1024 * 1024
+    """Upper bound on the total size of cached bodies before LRU eviction."""
+
+    ttls: dict[str, float] = pydantic.Field(
+        default_factory=lambda: {
+            "https://api.upbit.com/v1/market/all": 3600.0,
+            "https://api.alternative.me/fng/": 1800.0,
+        }
+    )
+    """Seconds a response stays fresh, keyed by URL prefix. Unlisted URLs are not cached."""
+
+
+    def build(self) -> "ResponseCache | None":
+        if not self.enabled:
+            return None
+        backend: CacheBackend = (
+            DiskCacheBackend(self.directory, self.max_bytes)
+            if self.backend == "disk"
+            else MemoryCacheBackend(self.max_bytes)
+        )
+        return ResponseCache(backend, ttls=self.ttls)
+
+
+class ResponseCache:
+    """TTL cache with conditional revalidation for GET responses.
+
+    Fresh entries are served without a request. Stale entries that carry an
+    ETag or Last-Modified are revalidated with If-None-Match /
+    If-Modified-Since, and a 304 refreshes them in place.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        *,
+        ttls: dict[str, float],
+    ) -> None:
+        self.backend: CacheBackend = backend or MemoryCacheBackend()
+        # Longest prefix first, so specific rules win over general ones.
+        self._ttls = sorted(ttls.items(), key=lambda item: len(item[0]), reverse=True)
+
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.backend.stats
+
+
+    def ttl_for(self, url: str) -> float | None:
+        for prefix, ttl in self._ttls:
+            if url.startswith(prefix):
+                return ttl
+        return None
+
+
+    @staticmethod
+    def key_for(url: str, params: dict[str, t.Any] | None) -> str:
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return hashlib.sha256(f"{url}?{query}".encode()).hexdigest()
+
+
+    def lookup(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, t.Any] | None,
+        headers: dict[str, str] | None,
+    ) -> t.Tuple[str | None, CacheEntry | None, httpx.Response | None, dict[str, str] | None]:
+        """Return `(key, entry, fresh_response, headers_to_send)` for a request.
+
+        `key` is None when the request is not cacheable. `fresh_response` is
+        set when the request can be answered without the network.
+        """
+        ttl = self.ttl_for(url) if method == "GET" else None
+        if ttl is None:
+            return None, None, None, headers
+
+        key = self.key_for(url, params)
+        entry = self.backend.get(key)
+        if entry is not None and time.time() - entry.stored_at < ttl:
+            self.stats.hits += 1
+            return key, entry, self._to_response(method, url, entry), headers
+
+        self.stats.misses += 1
+        if entry is None or (entry.etag is None and entry.last_modified is None):
+            return key, None, None, headers
+
+        conditional = dict(headers or {})
+        if entry.etag is not None:
+            conditional["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            conditional["If-Modified-Since"] = entry.last_modified
+        return key, entry, None, conditional
+
+
+    def complete(
+        self,
+        key: str,
+        entry: CacheEntry | None,
+        response: httpx.Response | None,
+        error: Exception | None,
+    ) -> t.Tuple[httpx.Response | None, Exception | None]:
+        if isinstance(error, httpx.HTTPStatusError) and error.response.status_code == 304 and entry is not None:
+            refreshed = entry.model_copy(update={"stored_at": time.time()})
+            self.backend.set(key, refreshed)
+            self.stats.revalidated += 1
+            request = error.request
+            return self._to_response(request.method, str(request.url), refreshed), None
+
+        if response is not None and error is None and response.status_code == 200:
+            self.backend.set(
+                key,
+                CacheEntry(
+                    content=response.content,
+                    headers={
+                        name: value
+                        for name, value in response.headers.items()
+                        if name in ("content-type", "etag", "last-modified")
+                    },
+                    stored_at=time.time(),
+                ),
+            )
+        return response, error
+
+
+    @staticmethod
+    def _to_response(method: str, url: str, entry: CacheEntry) -> httpx.Response:
+        return httpx.Response(
+            200,
+            headers=entry.headers,
+            content=entry.content,
+            request=httpx.Request(method, url),
+        )
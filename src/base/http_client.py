@@ -1,47 +1,219 @@
+import asyncio
+import functools
+import time
 import typing as t
 
 import httpx
 import pydantic
 
+from .cache import ResponseCache
+from .lean import LeanDecoder, lean_record
+from .retry import CircuitBreakers, RetryPolicy
+from .transport import TransportConfig
+
 ModelT = t.TypeVar("ModelT", bound=pydantic.BaseModel)
 
+
+def _received(
+    response: httpx.Response | None,
+    error: Exception | None,
+) -> httpx.Response | None:
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response
+    return response
+
+
+@functools.cache
+def _list_adapter(fmt: t.Type[ModelT]) -> pydantic.TypeAdapter[t.List[ModelT]]:
+    """One adapter per model; building its validator is far costlier than using it."""
+    return pydantic.TypeAdapter(t.List[fmt])  # type: ignore[valid-type]
+
+
+def _validate_one(
+    fmt: t.Type[ModelT],
+    response: httpx.Response,
+) -> t.Tuple[ModelT | None, Exception | None]:
+    try:
+        return fmt.model_validate_json(response.content), None
+    except Exception as e:
+        return None, e
+
+
+def _validate_list(
+    fmt: t.Type[ModelT],
+    response: httpx.Response,
+) -> t.Tuple[t.List[ModelT] | None, Exception | None]:
+    """Validate the raw body in one pass, without building intermediate dicts."""
+    try:
+        return _list_adapter(fmt).validate_json(response.content), None
+    except Exception as e:
+        return None, e
+
+
+def _decode_lean(
+    decoder: LeanDecoder[t.Any],
+    response: httpx.Response,
+) -> t.Tuple[t.List[t.Any] | None, Exception | None]:
+    try:
+        return decoder.decode(response.content), None
+    except Exception as e:
+        return None, e
+
+
 class HTTPClientBase:
 
     def __init__(
         self,
         *,
         client: httpx.Client | None = None,
+        transport: TransportConfig | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        cache: ResponseCache | None = None,
     ) -> None:
-        self._http_client = client or httpx.Client()
+        """Pass a shared `client` to reuse its connection pool across API clients;
+        otherwise a private one is built from `transport`.
+        """
+        self._owns_http_client = client is None
+        self._http_client = client or (transport or TransportConfig()).build_client()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._circuit_breakers = circuit_breakers or CircuitBreakers()
+        self._cache = cache
+        self._lean_decoders: dict[type, LeanDecoder[t.Any]] = {}
 
 
-    def _get_one(
+    def _lean_decoder(self, fmt: t.Type[ModelT]) -> LeanDecoder[ModelT]:
+        """One decoder per model and client, so each client checks the schema once."""
+        decoder = self._lean_decoders.get(fmt)
+        if decoder is None:
+            decoder = self._lean_decoders[fmt] = LeanDecoder(lean_record(fmt))
+        return decoder
+
+
+    def close(self) -> None:
+        """Close the underlying connection pool, unless it was shared with us."""
+        if self._owns_http_client:
+            self._http_client.close()
+
+
+    def _before_request(self, method: str, url: str) -> None:
+        """Hook called before every request is sent, e.g. to throttle it."""
+
+
+    def _attempt_headers(
         self,
-        fmt: t.Type[ModelT],
+        method: str,
+        url: str,
+        params: dict[str, t.Any] | None,
+        json: dict[str, t.Any] | None,
+        headers: dict[str, str] | None,
+    ) -> dict[str, str] | None:
+        """Hook returning the headers of each attempt, e.g. to sign it afresh for every retry."""
+        return headers
+
+
+    def _after_response(self, method: str, url: str, response: httpx.Response) -> None:
+        """Hook called with every response, before its status is checked."""
+
+
+    def _request(
+        self,
+        method: str,
         *,
         url: str,
         params: dict[str, t.Any] | None = None,
+        json: dict[str, t.Any] | None = None,
         headers: dict[str, str] | None = None,
-    ) -> t.Tuple[ModelT | None, Exception | None]:
+    ) -> t.Tuple[httpx.Response | None, Exception | None]:
+        """Send a request, serving it from the response cache when possible and
+        retrying transient failures per the retry policy.
+        """
+        if self._cache is None:
+            return self._send_with_retry(method, url=url, params=params, json=json, headers=headers)
+
+        key, entry, cached, headers = self._cache.lookup(method, url, params, headers)
+        if cached is not None:
+            return cached, None
+        response, error = self._send_with_retry(method, url=url, params=params, json=json, headers=headers)
+        if key is None:
+            return response, error
+        return self._cache.complete(key, entry, response, error)
+
+
+    def _send_with_retry(
+        self,
+        method: str,
+        *,
+        url: str,
+        params: dict[str, t.Any] | None = None,
+        json: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> t.Tuple[httpx.Response | None, Exception | None]:
+        breaker = self._circuit_breakers.for_url(url)
+        attempt = 0
+        while True:
+            attempt += 1
+            open_error = breaker.check()
+            if open_error is not None:
+                return None, open_error
+
+            response, error = self._send(method, url=url, params=params, json=json, headers=headers)
+            breaker.record(_received(response, error), error)
+
+            delay = self._retry_policy.next_delay(method, attempt, _received(response, error), error)
+            if delay is None:
+                return response, error
+            time.sleep(delay)
+
+
+    def _send(
+        self,
+        method: str,
+        *,
+        url: str,
+        params: dict[str, t.Any] | None = None,
+        json: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> t.Tuple[httpx.Response | None, Exception | None]:
         try:
-            response = self._http_client.get(
+            headers = self._attempt_headers(method, url, params, json, headers)
+        except Exception as e:
+            return None, e
+
+        self._before_request(method, url)
+        try:
+            response = self._http_client.request(
+                method,
                 url,
                 params=params,
+                json=json,
                 headers=headers,
             )
         except Exception as e:
             return None, e
-        
+
+        self._after_response(method, url, response)
         try:
             response.raise_for_status()
         except Exception as e:
             return None, e
-        
-        try:
-            return fmt.model_validate(response.json()), None
-        except Exception as e:
-            return None, e
-        
+
+        return response, None
+
+
+    def _get_one(
+        self,
+        fmt: t.Type[ModelT],
+        *,
+        url: str,
+        params: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> t.Tuple[ModelT | None, Exception | None]:
+        response, error = self._request("GET", url=url, params=params, headers=headers)
+        if response is None:
+            return None, error
+        return _validate_one(fmt, response)
+
 
     def _get_list(
         self,
@@ -50,27 +222,16 @@ class HTTPClientBase:
         url: str,
         params: dict[str, t.Any] | None = None,
         headers: dict[str, str] | None = None,
+        lean: bool = False,
     ) -> t.Tuple[t.List[ModelT] | None, Exception | None]:
-        try:
-            response = self._http_client.get(
-                url,
-                params=params,
-                headers=headers,
-            )
-        except Exception as e:
-            return None, e
-        
-        try:
-            response.raise_for_status()
-        except Exception as e:
-            return None, e
-        
-        try:
-            data = response.json()
-            return [fmt.model_validate(item) for item in data], None
-        except Exception as e:
-            return None, e
-    
+        """With `lean=True` the items are `lean_record(fmt)` records instead of models."""
+        response, error = self._request("GET", url=url, params=params, headers=headers)
+        if response is None:
+            return None, error
+        if lean:
+            return _decode_lean(self._lean_decoder(fmt), response)
+        return _validate_list(fmt, response)
+
 
     def _post(
         self,
@@ -80,25 +241,11 @@ class HTTPClientBase:
         json: dict[str, t.Any] | None = None,
         headers: dict[str, str] | None = None,
     ) -> t.Tuple[ModelT | None, Exception | None]:
-        try:
-            response = self._http_client.post(
-                url,
-                json=json,
-                headers=headers,
-            )
-        except Exception as e:
-            return None, e
-        
-        try:
-            response.raise_for_status()
-        except Exception as e:
-            return None, e
-        
-        try:
-            return fmt.model_validate(response.json()), None
-        except Exception as e:
-            return None, e
-    
+        response, error = self._request("POST", url=url, json=json, headers=headers)
+        if response is None:
+            return None, error
+        return _validate_one(fmt, response)
+
 
     def _delete(
         self,
@@ -107,23 +254,213 @@ class HTTPClientBase:
         url: str,
         headers: dict[str, str] | None = None,
     ) -> t.Tuple[ModelT | None, Exception | None]:
+        response, error = self._request("DELETE", url=url, headers=headers)
+        if response is None:
+            return None, error
+        return _validate_one(fmt, response)
+
+
+class AsyncHTTPClientBase:
+    """Asynchronous counterpart of `HTTPClientBase` built on `httpx.AsyncClient`.
+
+    Every method keeps the `(result, error)` contract of the blocking client,
+    so resources can be ported by awaiting the same calls.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: httpx.AsyncClient | None = None,
+        transport: TransportConfig | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        self._owns_http_client = client is None
+        self._http_client = client or (transport or TransportConfig()).build_async_client()
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._circuit_breakers = circuit_breakers or CircuitBreakers()
+        self._cache = cache
+        self._lean_decoders: dict[type, LeanDecoder[t.Any]] = {}
+
+
+    def _lean_decoder(self, fmt: t.Type[ModelT]) -> LeanDecoder[ModelT]:
+        """One decoder per model and client, so each client checks the schema once."""
+        decoder = self._lean_decoders.get(fmt)
+        if decoder is None:
+            decoder = self._lean_decoders[fmt] = LeanDecoder(lean_record(fmt))
+        return decoder
+
+
+    async def aclose(self) -> None:
+        if self._owns_http_client:
+            await self._http_client.aclose()
+
+
+    async def __aenter__(self) -> t.Self:
+        return self
+
+
+    async def __aexit__(self, *exc_info: t.Any) -> None:
+        await self.aclose()
+
+
+    async def _before_request(self, method: str, url: str) -> None:
+        """Hook awaited before every request is sent, e.g. to throttle it."""
+
+
+    def _attempt_headers(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, t.Any] | None,
+        json: dict[str, t.Any] | None,
+        headers: dict[str, str] | None,
+    ) -> dict[str, str] | None:
+        """Hook returning the headers of each attempt, e.g. to sign it afresh for every retry."""
+        return headers
+
+
+    def _after_response(self, method: str, url: str, response: httpx.Response) -> None:
+        """Hook called with every response, before its status is checked."""
+
+
+    async def _request(
+        self,
+        method: str,
+        *,
+        url: str,
+        params: dict[str, t.Any] | None = None,
+        json: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> t.Tuple[httpx.Response | None, Exception | None]:
+        if self._cache is None:
+            return await self._send_with_retry(method, url=url, params=params, json=json, headers=headers)
+
+        key, entry, cached, headers = self._cache.lookup(method, url, params, headers)
+        if cached is not None:
+            return cached, None
+        response, error = await self._send_with_retry(method, url=url, params=params, json=json, headers=headers)
+        if key is None:
+            return response, error
+        return self._cache.complete(key, entry, response, error)
+
+
+    async def _send_with_retry(
+        self,
+        method: str,
+        *,
+        url: str,
+        params: dict[str, t.Any] | None = None,
+        json: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> t.Tuple[httpx.Response | None, Exception | None]:
+        breaker = self._circuit_breakers.for_url(url)
+        attempt = 0
+        while True:
+            attempt += 1
+            open_error = breaker.check()
+            if open_error is not None:
+                return None, open_error
+
+            response, error = await self._send(method, url=url, params=params, json=json, headers=headers)
+            breaker.record(_received(response, error), error)
+
+            delay = self._retry_policy.next_delay(method, attempt, _received(response, error), error)
+            if delay is None:
+                return response, error
+            await asyncio.sleep(delay)
+
+
+    async def _send(
+        self,
+        method: str,
+        *,
+        url: str,
+        params: dict[str, t.Any] | None = None,
+        json: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> t.Tuple[httpx.Response | None, Exception | None]:
+        try:
+            headers = self._attempt_headers(method, url, params, json, headers)
+        except Exception as e:
+            return None, e
+
+        await self._before_request(method, url)
         try:
-            response = self._http_client.delete(
+            response = await self._http_client.request(
+                method,
                 url,
+                params=params,
+                json=json,
                 headers=headers,
             )
         except Exception as e:
             return None, e
-        
+
+        self._after_response(method, url, response)
         try:
             response.raise_for_status()
         except Exception as e:
             return None, e
-        
-        try:
-            return fmt.model_validate(response.json()), None
-        except Exception as e:
-            return None, e
 
-    
-    
\ No newline at end of file
+        return response, None
+
+
+    async def _get_one(
+        self,
+        fmt: t.Type[ModelT],
+        *,
+        url: str,
+        params: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> t.Tuple[ModelT | None, Exception | None]:
+        response, error = await self._request("GET", url=url, params=params, headers=headers)
+        if response is None:
+            return None, error
+        return _validate_one(fmt, response)
+
+
+    async def _get_list(
+        self,
+        fmt: t.Type[ModelT],
+        *,
+        url: str,
+        params: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+        lean: bool = False,
+    ) -> t.Tuple[t.List[ModelT] | None, Exception | None]:
+        """With `lean=True` the items are `lean_record(fmt)` records instead of models."""
+        response, error = await self._request("GET", url=url, params=params, headers=headers)
+        if response is None:
+            return None, error
+        if lean:
+            return _decode_lean(self._lean_decoder(fmt), response)
+        return _validate_list(fmt, response)
+
+
+    async def _post(
+        self,
+        fmt: t.Type[ModelT],
+        *,
+        url: str,
+        json: dict[str, t.Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> t.Tuple[ModelT | None, Exception | None]:
+        response, error = await self._request("POST", url=url, json=json, headers=headers)
+        if response is None:
+            return None, error
+        return _validate_one(fmt, response)
+
+
+    async def _delete(
+        self,
+        fmt: t.Type[ModelT],
+        *,
+        url: str,
+        headers: dict[str, str] | None = None,
+    ) -> t.Tuple[ModelT | None, Exception | None]:
+        response, error = await self._request("DELETE", url=url, headers=headers)
+        if response is None:
+            return None, error
+        return _validate_one(fmt, response)
@@ -0,0 +1,97 @@
+"""Validation-free records for hot-path API responses.
+
+A lean record is a `namedtuple` with the fields of a pydantic model: no
+per-instance `__dict__`, no field validation, and the model's properties.
+`LeanDecoder` validates the first payload it sees against the model (the
+one-time schema check) and afterwards only parses the JSON and packs each
+object into a record. `to_model()` converts back to the full model.
+"""
+from __future__ import annotations
+
+import collections
+import functools
+import operator
+import typing as t
+
+import pydantic
+import pydantic_core
+from pydantic_core import core_schema
+
+ModelT = t.TypeVar("ModelT", bound=pydantic.BaseModel)
+
+
+def _to_model(self: t.Any) -> pydantic.BaseModel:
+    return self.model.model_validate(self._asdict())
+
+
+def _to_dict(self: t.Any) -> dict[str, t.Any]:
+    return self._asdict()
+
+
+def _core_schema(cls: type, source: t.Any, handler: pydantic.GetCoreSchemaHandler) -> core_schema.CoreSchema:
+    # Records pass through models that hold them as-is and dump as dicts.
+    return core_schema.is_instance_schema(
+        cls,
+        serialization=core_schema.plain_serializer_function_ser_schema(_to_dict),
+    )
+
+
+@functools.cache
+def lean_record(model: t.Type[ModelT]) -> t.Type[t.Any]:
+    """The lean record class of `model`, e.g. `LeanTicker` for `Ticker`; built once per model."""
+    name = f"Lean{model.__name__}"
+    namespace: dict[str, t.Any] = {
+        "__slots__": (),
+        "__module__": model.__module__,
+        "model": model,
+        "to_model": _to_model,
+        "to_dict": _to_dict,
+        "__get_pydantic_core_schema__": classmethod(_core_schema),
+    }
+    for klass in reversed(model.__mro__):
+        if klass in (pydantic.BaseModel, object) or issubclass(pydantic.BaseModel, klass):
+            continue
+        namespace.update(
+            (attr, value) for attr, value in vars(klass).items() if isinstance(value, property)
+        )
+    return type(name, (collections.namedtuple(name, model.model_fields),), namespace)
+
+
+class LeanDecoder(t.Generic[ModelT]):
+    """Decodes JSON arrays of `record.model` objects into lean records."""
+
+    def __init__(self, record: t.Type[t.Any]) -> None:
+        self.record = record
+        model: t.Type[pydantic.BaseModel] = record.model
+        self._adapter = pydantic.TypeAdapter(t.List[model])  # type: ignore[valid-type]
+        self._fields = tuple(model.model_fields)
+        self._keys = tuple(field.alias or name for name, field in model.model_fields.items())
+        self._defaults = {
+            field.alias or name: field.get_default(call_default_factory=True)
+            for name, field in model.model_fields.items()
+            if not field.is_required()
+        }
+        self._getter = operator.itemgetter(*self._keys)
+        self._make = functools.partial(tuple.__new__, record)
+        self.checked = False
+
+
+    def decode(self, content: bytes) -> t.List[t.Any]:
+        if not self.checked:
+            models = self._adapter.validate_json(content)
+            self.checked = True
+            return [self._make(tuple(getattr(m, name) for name in self._fields)) for m in models]
+
+        data = pydantic_core.from_json(content)
+        try:
+            return list(map(self._make, map(self._getter, data)))
+        except KeyError:
+            # Optional fields left out of some objects.
+            return [self._make(self._row(item)) for item in data]
+
+
+    def _row(self, item: dict[str, t.Any]) -> t.Tuple[t.Any, ...]:
+        return tuple(
+            item[key] if key in item or key not in self._defaults else self._defaults[key]
+            for key in self._keys
+        )
@@ -0,0 +1,211 @@
+import datetime as dt
+import email.utils
+import random
+import threading
+import time
+import typing as t
+from urllib.parse import urlsplit
+
+import httpx
+import pydantic
+
+from .model import BaseModel
+
+
+_UNSENT_ERRORS: t.Tuple[t.Type[Exception], ...] = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+"""Errors raised before the request reached the server; retrying them is always safe."""
+
+_TRANSIENT_ERRORS: t.Tuple[t.Type[Exception], ...] = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while the host's circuit is open."""
+
+    def __init__(self, host: str, retry_in: float) -> None:
+        super().__init__(f"Circuit for '{host}' is open; retry in {retry_in:.1f}s.")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class RetryPolicy(BaseModel):
+    """When and how long to wait before re-sending a failed request."""
+
+    max_attempts: int = 3
+    """Total attempts per request, including the first one."""
+
+    backoff_base: float = 0.2
+    """Delay in seconds before the first retry; doubled on every further retry."""
+
+    backoff_max: float = 5.0
+    """Upper bound of the exponential backoff in seconds."""
+
+    jitter: t.Literal["full", "equal", "none"] = "full"
+    """Randomization of the backoff.
+    - full: uniform between 0 and the backoff
+    - equal: half the backoff plus uniform up to the other half
+    - none: the backoff itself
+    """
+
+    retry_statuses: t.List[int] = pydantic.Field(default_factory=lambda: [429, 500, 502, 503, 504])
+    """HTTP status codes treated as transient."""
+
+    idempotent_methods: t.List[str] = pydantic.Field(
+        default_factory=lambda: ["GET", "HEAD", "OPTIONS", "PUT", "DELETE"]
+    )
+    """Methods that may be retried after the server may have seen them.
+    Other methods (e.g. POST orders) are only retried when the request never
+    left the client, or when the server rejected it with 429.
+    """
+
+    respect_retry_after: bool = True
+    """Wait for the `Retry-After` header when the server sends one."""
+
+    max_retry_after: float = 30.0
+    """Give up instead of honoring a `Retry-After` longer than this many seconds."""
+
+
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter == "full":
+            return random.uniform(0, ceiling)
+        if self.jitter == "equal":
+            return ceiling / 2 + random.uniform(0, ceiling / 2)
+        return ceiling
+
+
+    def _is_retryable(
+        self,
+        method: str,
+        response: httpx.Response | None,
+        error: Exception | None,
+    ) -> bool:
+        if response is not None and response.status_code == 429:
+            return True
+        if isinstance(error, _UNSENT_ERRORS):
+            return True
+        if method.upper() not in self.idempotent_methods:
+            return False
+        if response is not None:
+            return response.status_code in self.retry_statuses
+        return isinstance(error, _TRANSIENT_ERRORS)
+
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: httpx.Response | None,
+        error: Exception | None,
+    ) -> float | None:
+        """Seconds to wait before the next attempt, or None to stop retrying."""
+        if error is None or attempt >= self.max_attempts:
+            return None
+        if not self._is_retryable(method, response, error):
+            return None
+
+        if self.respect_retry_after and response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+        return self.backoff(attempt)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return float(value.strip())
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=dt.timezone.utc)
+    return max(0.0, (when - dt.datetime.now(dt.timezone.utc)).total_seconds())
+
+
+class CircuitBreakerPolicy(BaseModel):
+
+    failure_threshold: int = 5
+    """Consecutive failures that open the circuit."""
+
+    reset_timeout: float = 30.0
+    """Seconds the circuit stays open before a single trial request is let through."""
+
+
+class CircuitBreaker:
+    """Fails fast while an upstream host keeps failing.
+
+    closed -> open after `failure_threshold` consecutive failures;
+    open -> half-open after `reset_timeout`, letting one trial request through;
+    half-open -> closed on success, or back to open on failure.
+    """
+
+    def __init__(self, host: str, policy: CircuitBreakerPolicy) -> None:
+        self.host = host
+        self.policy = policy
+        self.state: t.Literal["closed", "open", "half_open"] = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+
+    def check(self) -> CircuitOpenError | None:
+        with self._lock:
+            if self.state == "closed":
+                return None
+
+            retry_in = self._opened_at + self.policy.reset_timeout - time.monotonic()
+            if self.state == "open" and retry_in <= 0:
+                self.state = "half_open"
+                return None
+            return CircuitOpenError(self.host, max(retry_in, 0.0))
+
+
+    def record(self, response: httpx.Response | None, error: Exception | None) -> None:
+        failed = (
+            response.status_code >= 500
+            if response is not None
+            else isinstance(error, _TRANSIENT_ERRORS)
+        )
+        with self._lock:
+            if not failed:
+                self.state = "closed"
+                self._failures = 0
+                return
+
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.policy.failure_threshold:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+class CircuitBreakers:
+    """Per-host circuit breakers; share one instance between clients of the same hosts."""
+
+    def __init__(self, policy: CircuitBreakerPolicy | None = None) -> None:
+        self.policy = policy or CircuitBreakerPolicy()
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+
+    def for_url(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker(host, self.policy)
+            return breaker
+
+
+    def states(self) -> dict[str, str]:
+        with self._lock:
+            return {host: breaker.state for host, breaker in self._breakers.items()}
@@ -0,0 +1,120 @@
+import importlib.util
+import typing as t
+import warnings
+
+import httpx
+import pydantic
+
+from .model import BaseModel
+
+
+_ENCODING_DECODERS: dict[str, t.Tuple[str, ...]] = {
+    "gzip": (),
+    "deflate": (),
+    "br": ("brotli", "brotlicffi"),
+    "zstd": ("zstandard",),
+}
+"""Content encodings httpx can decode, with the optional packages each one needs."""
+
+
+def _is_installed(*modules: str) -> bool:
+    return any(importlib.util.find_spec(module) is not None for module in modules)
+
+
+class TransportConfig(BaseModel):
+    """Connection pool, timeout and protocol settings for the HTTP clients.
+
+    Build one `httpx.Client` (or `httpx.AsyncClient`) from it and hand the
+    same instance to every API client, so they share one bounded pool of
+    warm keep-alive connections.
+    """
+
+    max_connections: int = 20
+    """Upper bound on open connections across all hosts."""
+
+    max_keepalive_connections: int = 10
+    """Idle connections kept open for reuse."""
+
+    keepalive_expiry: float = 30.0
+    """Seconds an idle connection is kept before it is closed."""
+
+    connect_timeout: float = 5.0
+    """Seconds to wait for a connection (including TLS handshake)."""
+
+    read_timeout: float = 10.0
+    """Seconds to wait for a chunk of the response body."""
+
+    write_timeout: float = 10.0
+    """Seconds to wait while sending the request body."""
+
+    pool_timeout: float = 5.0
+    """Seconds to wait for a free connection from the pool."""
+
+    http2: bool = False
+    """Negotiate HTTP/2 when the server supports it.
+    Requires the optional `h2` package (`httpx[http2]`); falls back to HTTP/1.1 otherwise.
+    """
+
+    accept_encoding: t.List[str] = pydantic.Field(
+        default_factory=lambda: ["gzip", "deflate", "br", "zstd"]
+    )
+    """Content encodings to offer, in order of preference.
+    Encodings whose decoder package is not installed are not offered.
+    """
+
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    @property
+    def headers(self) -> dict[str, str]:
+        encodings = [
+            encoding
+            for encoding in self.accept_encoding
+            if encoding in _ENCODING_DECODERS
+            and (not _ENCODING_DECODERS[encoding] or _is_installed(*_ENCODING_DECODERS[encoding]))
+        ]
+        return {"Accept-Encoding": ", ".join(encodings)} if encodings else {}
+
+    @property
+    def use_http2(self) -> bool:
+        if self.http2 and not _is_installed("h2"):
+            warnings.warn(
+                "HTTP/2 was requested but the 'h2' package is not installed; falling back to HTTP/1.1.",
+                RuntimeWarning,
+                stacklevel=3,
+            )
+            return False
+        return self.http2
+
+
+    def build_client(self) -> httpx.Client:
+        return httpx.Client(
+            limits=self.limits,
+            timeout=self.timeout,
+            headers=self.headers,
+            http2=self.use_http2,
+        )
+
+
+    def build_async_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=self.limits,
+            timeout=self.timeout,
+            headers=self.headers,
+            http2=self.use_http2,
+        )
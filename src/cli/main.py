@@ -1,8 +1,11 @@
 import argparse
 import os
+import signal
+import threading
 import yaml
 
 import src.app as app
+from src.base import CircuitBreakers
 from src.client import (
     UpbitClient,
     AlternativeClient,
@@ -26,16 +29,50 @@ def main():
         default="config.yaml",
         help="Path to config yaml"
     )
+    parser.add_argument(
+        "--scan",
+        action="store_true",
+        help="Run the technical analysis over the validated ticker universe"
+    )
+    parser.add_argument(
+        "--backtest",
+        action="store_true",
+        help="Backtest the strategy over the stored candle and Fear & Greed history"
+    )
+    parser.add_argument(
+        "--top-n",
+        type=int,
+        default=None,
+        help="Markets to scan or backtest with --scan / --backtest, by ranking (default: all)"
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Keep running, refreshing each source on the cadence in the config's schedule"
+    )
     args = parser.parse_args()
 
     raw_config = load_yaml(args.config)
     config = app.AppConfig(**raw_config)
 
+    http_client = config.http.build_client()
+    circuit_breakers = CircuitBreakers(config.circuit_breaker)
+    cache = config.cache.build()
     upbit_client = UpbitClient(
         access_key=os.environ.get("UPBIT_ACCESS_KEY", None),
         secret_key=os.environ.get("UPBIT_SECRET_KEY", None),
+        client=http_client,
+        retry_policy=config.retry,
+        circuit_breakers=circuit_breakers,
+        cache=cache,
+        lean=config.lean_models,
+    )
+    alternative_client = AlternativeClient(
+        client=http_client,
+        retry_policy=config.retry,
+        circuit_breakers=circuit_breakers,
+        cache=cache,
     )
-    alternative_client = AlternativeClient()
 
     runner = app.Runner(
         config=config,
@@ -43,8 +80,30 @@ def main():
         alternative_client=alternative_client,
     )
 
-    for event in runner.run():
-        print(event)
+    sink = config.events.build()
+    stop = threading.Event()
+    if args.daemon:
+        # Only `serve` polls `stop`; other modes keep the default SIGTERM handling.
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+
+    try:
+        if args.daemon:
+            events = runner.serve(stop=stop)
+        elif args.backtest:
+            events = runner.backtest(top_n=args.top_n)
+        elif args.scan:
+            events = runner.scan(top_n=args.top_n)
+        else:
+            events = runner.run()
+        for event in events:
+            sink.emit(event)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sink.close()
+        runner.close()
+        upbit_client.close()
+        http_client.close()
 
 
 if __name__ == "__main__":
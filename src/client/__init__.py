@@ -1,7 +1,9 @@
-from .upbit import UpbitClient
-from .alternative import AlternativeClient
+from .upbit import UpbitClient, AsyncUpbitClient
+from .alternative import AlternativeClient, AsyncAlternativeClient
 
 __all__ = [
     "UpbitClient",
+    "AsyncUpbitClient",
     "AlternativeClient",
-]
\ No newline at end of file
+    "AsyncAlternativeClient",
+]
@@ -1,6 +1,7 @@
-from .client import AlternativeClient
+from .client import AlternativeClient, AsyncAlternativeClient
 
 
 __all__ = [
     "AlternativeClient",
-]
\ No newline at end of file
+    "AsyncAlternativeClient",
+]
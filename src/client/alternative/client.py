@@ -1,12 +1,55 @@
-from src.base import HTTPClientBase
+import httpx
 
-from .resources.fng import FNGResource
+from src.base import (
+    HTTPClientBase,
+    AsyncHTTPClientBase,
+    TransportConfig,
+    RetryPolicy,
+    CircuitBreakers,
+    ResponseCache,
+)
+
+from .resources.fng import FNGResource, AsyncFNGResource
 
 class AlternativeClient(HTTPClientBase):
 
     def __init__(
-        self
+        self,
+        *,
+        client: httpx.Client | None = None,
+        transport: TransportConfig | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        cache: ResponseCache | None = None,
     ):
-        super().__init__()
+        super().__init__(
+            client=client,
+            transport=transport,
+            retry_policy=retry_policy,
+            circuit_breakers=circuit_breakers,
+            cache=cache,
+        )
         
-        self.fng = FNGResource(self)
\ No newline at end of file
+        self.fng = FNGResource(self)
+
+
+class AsyncAlternativeClient(AsyncHTTPClientBase):
+
+    def __init__(
+        self,
+        *,
+        client: httpx.AsyncClient | None = None,
+        transport: TransportConfig | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        cache: ResponseCache | None = None,
+    ):
+        super().__init__(
+            client=client,
+            transport=transport,
+            retry_policy=retry_policy,
+            circuit_breakers=circuit_breakers,
+            cache=cache,
+        )
+
+        self.fng = AsyncFNGResource(self)
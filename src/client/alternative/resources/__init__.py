@@ -1,5 +1,6 @@
-from .fng import FNGResource
+from .fng import FNGResource, AsyncFNGResource
 
 __all__ = [
     "FNGResource",
-]
\ No newline at end of file
+    "AsyncFNGResource",
+]
@@ -2,7 +2,7 @@ from __future__ import annotations
 import typing as t
 
 if t.TYPE_CHECKING:
-    from ..client import AlternativeClient
+    from ..client import AlternativeClient, AsyncAlternativeClient
 
 from ..types import (
     FNGResponse,
@@ -14,16 +14,39 @@ class FNGResource:
         self._client = client
 
 
-    def get(self) -> FNGResponse:
+    def get(self, limit: int = 10) -> FNGResponse:
+        """The latest `limit` daily entries, newest first; `limit=0` returns the full history."""
         url = "https://api.alternative.me/fng/"
         response = self._client._get_one(
             FNGResponse, 
             url=url, 
-            params={"limit": 10}
+            params={"limit": limit}
         )
         fng_index, error = response
         if error:
             raise error
         if fng_index is None:
             raise ValueError("Failed to fetch Fear and Greed Index: No data returned.")
-        return fng_index
\ No newline at end of file
+        return fng_index
+
+
+class AsyncFNGResource:
+
+    def __init__(self, client: "AsyncAlternativeClient") -> None:
+        self._client = client
+
+
+    async def get(self, limit: int = 10) -> FNGResponse:
+        """The latest `limit` daily entries, newest first; `limit=0` returns the full history."""
+        url = "https://api.alternative.me/fng/"
+        response = await self._client._get_one(
+            FNGResponse, 
+            url=url, 
+            params={"limit": limit}
+        )
+        fng_index, error = response
+        if error:
+            raise error
+        if fng_index is None:
+            raise ValueError("Failed to fetch Fear and Greed Index: No data returned.")
+        return fng_index
@@ -1,6 +1,12 @@
-from .client import UpbitClient
+from .client import UpbitClient, AsyncUpbitClient
+from .ratelimit import UpbitRateLimiter, RateLimitMetrics
+from .utils import SigningMetrics
 
 
 __all__ = [
     "UpbitClient",
-]
\ No newline at end of file
+    "AsyncUpbitClient",
+    "UpbitRateLimiter",
+    "RateLimitMetrics",
+    "SigningMetrics",
+]
@@ -1,10 +1,55 @@
 import os
+import typing as t
 
-from .resources import V1
+import httpx
+
+from .endpoints import is_public
+from .ratelimit import UpbitRateLimiter
+from .resources import V1, AsyncV1
 from .types import UpbitConfig
-from .utils import UpbitUtils
+from .utils import SigningMetrics, UpbitUtils
+
+from src.base import (
+    HTTPClientBase,
+    AsyncHTTPClientBase,
+    TransportConfig,
+    RetryPolicy,
+    CircuitBreakers,
+    ResponseCache,
+)
+
+
+def _sign(
+    utils: UpbitUtils,
+    url: str,
+    params: dict[str, t.Any] | None,
+    json: dict[str, t.Any] | None,
+    headers: dict[str, str] | None,
+) -> dict[str, str] | None:
+    """Add the JWT for exchange endpoints; public quotation endpoints go out unsigned."""
+    if is_public(url):
+        utils._skip_signing()
+        return headers
+    return {**(headers or {}), **utils._build_headers(json if json is not None else params)}
+
+
+def _resolve_config(
+    access_key: str | None,
+    secret_key: str | None,
+) -> UpbitConfig | None:
+    """Credentials from the arguments or the environment; None for a public-only client."""
+    access_key = access_key or os.getenv("UPBIT_ACCESS_KEY")
+    secret_key = secret_key or os.getenv("UPBIT_SECRET_KEY")
+    if access_key is None and secret_key is None:
+        return None
+    if access_key is None or secret_key is None:
+        raise ValueError("Both access_key and secret_key must be provided.")
+
+    return UpbitConfig(
+        access_key=access_key,
+        secret_key=secret_key,
+    )
 
-from src.base import HTTPClientBase
 
 class UpbitClient(HTTPClientBase):
 
@@ -13,20 +58,115 @@ class UpbitClient(HTTPClientBase):
         *,
         access_key: str | None = None,
         secret_key: str | None = None,
+        client: httpx.Client | None = None,
+        transport: TransportConfig | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: UpbitRateLimiter | None = None,
+        lean: bool = False,
     ) -> None:
         
-        super().__init__()
+        super().__init__(
+            client=client,
+            transport=transport,
+            retry_policy=retry_policy,
+            circuit_breakers=circuit_breakers,
+            cache=cache,
+        )
+
+        self._utils = UpbitUtils(_resolve_config(access_key, secret_key))
+        self.rate_limiter = rate_limiter or UpbitRateLimiter()
+        # Tickers and candles come back as `LeanTicker` / `LeanCandle` records,
+        # validated only on the first response, instead of full models.
+        self.lean = lean
+        self.v1 = V1(self)
+
+
+    @property
+    def signing_metrics(self) -> SigningMetrics:
+        """How many requests were signed and what signing cost, per call."""
+        return self._utils.metrics()
+
+
+    def close(self) -> None:
+        self.v1.close()
+        super().close()
+
+
+    def _attempt_headers(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, t.Any] | None,
+        json: dict[str, t.Any] | None,
+        headers: dict[str, str] | None,
+    ) -> dict[str, str] | None:
+        # Signed per attempt: Upbit rejects a retry that reuses the nonce.
+        return _sign(self._utils, url, params, json, headers)
+
+
+    def _before_request(self, method: str, url: str) -> None:
+        self.rate_limiter.acquire(method, url)
+
 
-        access_key = access_key or os.getenv("UPBIT_ACCESS_KEY")
-        secret_key = secret_key or os.getenv("UPBIT_SECRET_KEY")
-        if access_key is None or secret_key is None:
-            raise ValueError("Both access_key and secret_key must be provided.")
+    def _after_response(self, method: str, url: str, response: httpx.Response) -> None:
+        self.rate_limiter.observe(method, url, response.status_code, response.headers)
+
+
+class AsyncUpbitClient(AsyncHTTPClientBase):
+
+    def __init__(
+        self,
+        *,
+        access_key: str | None = None,
+        secret_key: str | None = None,
+        client: httpx.AsyncClient | None = None,
+        transport: TransportConfig | None = None,
+        retry_policy: RetryPolicy | None = None,
+        circuit_breakers: CircuitBreakers | None = None,
+        cache: ResponseCache | None = None,
+        rate_limiter: UpbitRateLimiter | None = None,
+        lean: bool = False,
+    ) -> None:
         
-        self._utils = UpbitUtils(
-            UpbitConfig(
-                access_key=access_key,
-                secret_key=secret_key,
-            )
+        super().__init__(
+            client=client,
+            transport=transport,
+            retry_policy=retry_policy,
+            circuit_breakers=circuit_breakers,
+            cache=cache,
         )
-        self.v1 = V1(self)
-        
\ No newline at end of file
+
+        self._utils = UpbitUtils(_resolve_config(access_key, secret_key))
+        self.rate_limiter = rate_limiter or UpbitRateLimiter()
+        # Tickers and candles come back as `LeanTicker` / `LeanCandle` records,
+        # validated only on the first response, instead of full models.
+        self.lean = lean
+        self.v1 = AsyncV1(self)
+
+
+    @property
+    def signing_metrics(self) -> SigningMetrics:
+        """How many requests were signed and what signing cost, per call."""
+        return self._utils.metrics()
+
+
+    def _attempt_headers(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, t.Any] | None,
+        json: dict[str, t.Any] | None,
+        headers: dict[str, str] | None,
+    ) -> dict[str, str] | None:
+        # Signed per attempt: Upbit rejects a retry that reuses the nonce.
+        return _sign(self._utils, url, params, json, headers)
+
+
+    async def _before_request(self, method: str, url: str) -> None:
+        await self.rate_limiter.acquire_async(method, url)
+
+
+    def _after_response(self, method: str, url: str, response: httpx.Response) -> None:
+        self.rate_limiter.observe(method, url, response.status_code, response.headers)
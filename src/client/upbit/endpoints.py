@@ -0,0 +1,34 @@
+import typing as t
+from urllib.parse import urlsplit
+
+
+class Endpoint(t.NamedTuple):
+    prefix: str
+    """Path prefix of the endpoint."""
+
+    group: str
+    """The `Remaining-Req` group its requests count against."""
+
+    public: bool
+    """Quotation endpoints take no credentials, so requests to them are never signed."""
+
+
+ENDPOINTS: tuple[Endpoint, ...] = (
+    Endpoint("/v1/market/", "market", public=True),
+    Endpoint("/v1/candles/", "candles", public=True),
+    Endpoint("/v1/ticker", "ticker", public=True),
+    Endpoint("/v1/trades/", "trade", public=True),
+    Endpoint("/v1/orderbook", "orderbook", public=True),
+    Endpoint("/v1/orders/test", "order-test", public=False),
+    Endpoint("/v1/orders/open", "default", public=False),
+    Endpoint("/v1/orders/closed", "default", public=False),
+)
+"""Known Upbit endpoints by path prefix, first match wins."""
+
+PUBLIC_PATH_PREFIXES: tuple[str, ...] = tuple(endpoint.prefix for endpoint in ENDPOINTS if endpoint.public)
+"""Quotation endpoints; they take no credentials, so requests to them are never signed."""
+
+
+def is_public(url: str) -> bool:
+    """Whether `url` is a public quotation endpoint; everything else is an exchange endpoint and is signed."""
+    return urlsplit(url).path.startswith(PUBLIC_PATH_PREFIXES)
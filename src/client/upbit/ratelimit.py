@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import typing as t
+from urllib.parse import urlsplit
+
+from src.base import BaseModel
+
+from .endpoints import ENDPOINTS
+
+
+DEFAULT_GROUP_LIMITS: dict[str, float] = {
+    "market": 10,
+    "candles": 10,
+    "ticker": 10,
+    "trade": 10,
+    "orderbook": 10,
+    "default": 30,
+    "order": 8,
+    "order-test": 8,
+    "order-cancel-all": 0.5,
+}
+"""Requests per second allowed for each Upbit `Remaining-Req` group."""
+
+_GROUP_BY_PATH_PREFIX: t.Tuple[t.Tuple[str, str], ...] = tuple(
+    (endpoint.prefix, endpoint.group) for endpoint in ENDPOINTS
+)
+"""Best-guess endpoint groups, used until a response reports the real group."""
+
+
+def parse_remaining_req(value: str) -> t.Tuple[str, int] | None:
+    """Parse a `Remaining-Req` header such as `group=market; min=1800; sec=9`.
+
+    Returns the group name and the requests left in the current second.
+    """
+    fields: dict[str, str] = {}
+    for part in value.split(";"):
+        key, sep, val = part.strip().partition("=")
+        if sep:
+            fields[key.strip()] = val.strip()
+
+    group, remaining = fields.get("group"), fields.get("sec")
+    if group is None or remaining is None or not remaining.isdigit():
+        return None
+    return group, int(remaining)
+
+
+class RateLimitMetrics(BaseModel):
+
+    requests: int = 0
+    """Number of requests admitted through the group."""
+
+    throttled: int = 0
+    """Number of requests that had to wait for a token."""
+
+    total_wait: float = 0.0
+    """Total seconds spent waiting for tokens."""
+
+    max_wait: float = 0.0
+    """Longest single wait in seconds."""
+
+    rejected: int = 0
+    """Number of 429 responses received despite throttling."""
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.requests if self.requests else 0.0
+
+
+class TokenBucket:
+    """A token bucket that hands out reservations instead of blocking.
+
+    `reserve` always takes a token and returns how long the caller must wait
+    before using it, which lets threads (`time.sleep`) and asyncio tasks
+    (`asyncio.sleep`) share the same bucket. The lock is only held for the
+    bookkeeping, never while waiting.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+    def reserve(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+    def observe(self, remaining: int) -> None:
+        """Clamp the local estimate to what the server reports as remaining.
+
+        Other processes sharing our IP consume the same budget, so the server
+        count wins whenever it is lower than ours.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, float(remaining))
+
+
+    def drain(self) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens = min(self._tokens, 0.0)
+
+
+class UpbitRateLimiter:
+    """Per-group token buckets tuned by Upbit's `Remaining-Req` header.
+
+    One limiter may be shared by several clients, blocking or asyncio, as
+    long as they talk to Upbit from the same IP.
+    """
+
+    def __init__(self, limits: dict[str, float] | None = None) -> None:
+        self._limits = {**DEFAULT_GROUP_LIMITS, **(limits or {})}
+        self._buckets: dict[str, TokenBucket] = {}
+        self._metrics: dict[str, RateLimitMetrics] = {}
+        self._learned_groups: dict[t.Tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+
+    def group_for(self, method: str, url: str) -> str:
+        path = urlsplit(url).path
+        learned = self._learned_groups.get((method, path))
+        if learned is not None:
+            return learned
+
+        for prefix, group in _GROUP_BY_PATH_PREFIX:
+            if path.startswith(prefix):
+                return group
+        if path == "/v1/orders" and method in ("POST", "DELETE"):
+            return "order"
+        return "default"
+
+
+    def _bucket(self, group: str) -> t.Tuple[TokenBucket, RateLimitMetrics]:
+        with self._lock:
+            bucket = self._buckets.get(group)
+            if bucket is None:
+                bucket = TokenBucket(self._limits.get(group, self._limits["default"]))
+                self._buckets[group] = bucket
+                self._metrics[group] = RateLimitMetrics()
+            return bucket, self._metrics[group]
+
+
+    def _reserve(self, group: str) -> float:
+        bucket, metrics = self._bucket(group)
+        delay = bucket.reserve()
+        with self._lock:
+            metrics.requests += 1
+            if delay > 0:
+                metrics.throttled += 1
+                metrics.total_wait += delay
+                metrics.max_wait = max(metrics.max_wait, delay)
+        return delay
+
+
+    def acquire(self, method: str, url: str) -> float:
+        """Block the calling thread until the request may be sent."""
+        delay = self._reserve(self.group_for(method, url))
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+    async def acquire_async(self, method: str, url: str) -> float:
+        """Suspend the calling task until the request may be sent."""
+        delay = self._reserve(self.group_for(method, url))
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+    def observe(
+        self,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: t.Mapping[str, str],
+    ) -> None:
+        value = headers.get("Remaining-Req")
+        parsed = parse_remaining_req(value) if value else None
+        if parsed is not None:
+            group, remaining = parsed
+            self._learned_groups[(method, urlsplit(url).path)] = group
+            self._bucket(group)[0].observe(remaining)
+        else:
+            group = self.group_for(method, url)
+
+        if status_code == 429:
+            bucket, metrics = self._bucket(group)
+            bucket.drain()
+            with self._lock:
+                metrics.rejected += 1
+
+
+    def metrics(self) -> dict[str, RateLimitMetrics]:
+        with self._lock:
+            return {group: metrics.model_copy() for group, metrics in self._metrics.items()}
@@ -2,15 +2,15 @@ from __future__ import annotations
 import typing as t
 
 if t.TYPE_CHECKING:
-    from ..client import UpbitClient
+    from ..client import UpbitClient, AsyncUpbitClient
 
 from functools import cached_property
 
-from .accounts import AccountsResource as Accounts
-from .orders import OrdersResource as Orders
-from .market import MarketResource as Market
-from .ticker import TickerResource as Ticker
-from .candles import CandlesResource as Candles
+from .accounts import AccountsResource as Accounts, AsyncAccountsResource as AsyncAccounts
+from .orders import OrdersResource as Orders, AsyncOrdersResource as AsyncOrders
+from .market import MarketResource as Market, AsyncMarketResource as AsyncMarket
+from .ticker import TickerResource as Ticker, AsyncTickerResource as AsyncTicker
+from .candles import CandlesResource as Candles, AsyncCandlesResource as AsyncCandles
 
 class V1:
     def __init__(self, client: "UpbitClient"):
@@ -36,8 +36,41 @@ class V1:
     @cached_property
     def candles(self) -> Candles:
         return Candles(self._client)
+
+
+    def close(self) -> None:
+        """Stop the worker threads of the resources that keep any."""
+        if "ticker" in self.__dict__:
+            self.ticker.close()
+
+
+class AsyncV1:
+    def __init__(self, client: "AsyncUpbitClient"):
+        self._client = client
+
+
+    @cached_property
+    def accounts(self) -> AsyncAccounts:
+        return AsyncAccounts(self._client)
+
+    @cached_property
+    def orders(self) -> AsyncOrders:
+        return AsyncOrders(self._client)
+
+    @cached_property
+    def market(self) -> AsyncMarket:
+        return AsyncMarket(self._client)
+
+    @cached_property
+    def ticker(self) -> AsyncTicker:
+        return AsyncTicker(self._client)
+
+    @cached_property
+    def candles(self) -> AsyncCandles:
+        return AsyncCandles(self._client)
     
 
 __all__ = [
     "V1",
-]
\ No newline at end of file
+    "AsyncV1",
+]
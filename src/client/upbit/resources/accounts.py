@@ -2,7 +2,7 @@ from __future__ import annotations
 import typing as t
 
 if t.TYPE_CHECKING:
-    from ..client import UpbitClient
+    from ..client import UpbitClient, AsyncUpbitClient
 
 from ..types import (
     Account,
@@ -18,11 +18,27 @@ class AccountsResource:
         accounts, error = self._client._get_list(
             Account, 
             url=url, 
-            headers=self._client._utils._build_headers() #type: ignore
         )
         if error:
             raise error
         if accounts is None:
             raise ValueError("Failed to fetch accounts: No account data returned.")
         return accounts
-        
\ No newline at end of file
+
+
+class AsyncAccountsResource:
+
+    def __init__(self, client: "AsyncUpbitClient") -> None:
+        self._client = client
+
+    async def get(self) -> t.List[Account]:
+        url = "https://api.upbit.com/v1/accounts"
+        accounts, error = await self._client._get_list(
+            Account, 
+            url=url, 
+        )
+        if error:
+            raise error
+        if accounts is None:
+            raise ValueError("Failed to fetch accounts: No account data returned.")
+        return accounts
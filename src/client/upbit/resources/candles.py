@@ -1,33 +1,188 @@
 from __future__ import annotations
+import asyncio
 import datetime as dt
 import typing as t
+from concurrent import futures
 
 if t.TYPE_CHECKING:
-    from ..client import UpbitClient
+    from ..client import UpbitClient, AsyncUpbitClient
 
 from ..types import (
     Candle,
 )
 
+CandleUnit = t.Literal["minutes", "days", "weeks", "months"]
+"""Candle periods served by the Upbit candle endpoints."""
+
+MinuteInterval = t.Literal[1, 3, 5, 10, 15, 30, 60, 240]
+"""Intervals supported by the minute candle endpoint."""
+
+MAX_PAGE_SIZE = 200
+"""Upbit returns at most 200 candles per request."""
+
+
+def _candles_url(unit: CandleUnit, minutes: MinuteInterval | None) -> str:
+    if unit == "minutes":
+        if minutes is None:
+            raise ValueError("minutes must be provided for minute candles.")
+        return f"https://api.upbit.com/v1/candles/minutes/{minutes}"
+    return f"https://api.upbit.com/v1/candles/{unit}"
+
+
+def _format_to(to: dt.datetime | None) -> str:
+    to = to or dt.datetime.now(dt.timezone.utc)
+    if to.tzinfo is not None:
+        to = to.astimezone(dt.timezone.utc)
+    return to.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _next_cursor(
+    page: t.List[Candle],
+    page_size: int,
+    start: dt.datetime | None,
+) -> t.Tuple[t.List[Candle], dt.datetime | None]:
+    """Trim `page` to candles at or after `start` and return the cursor of the next page.
+
+    Pages come newest first, so the cursor is the oldest candle in the page;
+    Upbit's `to` is exclusive, so that candle is not returned twice.
+    """
+    if not page:
+        return page, None
+
+    if start is not None:
+        start = start.astimezone(dt.timezone.utc).replace(tzinfo=None) if start.tzinfo else start
+        trimmed = [
+            candle for candle in page
+            if dt.datetime.fromisoformat(candle.candle_date_time_utc) >= start
+        ]
+        if dt.datetime.fromisoformat(page[-1].candle_date_time_utc) <= start:
+            return trimmed, None
+
+    if len(page) < page_size:
+        return page, None
+    oldest = dt.datetime.fromisoformat(page[-1].candle_date_time_utc)
+    return page, oldest.replace(tzinfo=dt.timezone.utc)
+
+
 class CandlesResource:
     
     def __init__(self, client: "UpbitClient") -> None:
         self._client = client
 
     def get_by_days(self, *, market: str | None = None, count: int | None = None) -> t.List[Candle]:
-        url = "https://api.upbit.com/v1/candles/days"
+        return self.get(market=market or "KRW-BTC", unit="days", count=count or 200)
+
+    def get(
+        self,
+        *,
+        market: str,
+        unit: CandleUnit = "days",
+        minutes: MinuteInterval | None = None,
+        to: dt.datetime | None = None,
+        count: int = MAX_PAGE_SIZE,
+    ) -> t.List[Candle]:
+        """Fetch one page of candles ending before `to` (default: now), newest first."""
+        url = _candles_url(unit, minutes)
         candles, error = self._client._get_list(
             Candle, 
             params={
-                'market': market or "KRW-BTC", 
-                'to': dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
-                'count': count or 200,
+                'market': market, 
+                'to': _format_to(to),
+                'count': count,
             },
             url=url, 
+            lean=self._client.lean,
         )
         if error:
             raise error
         if candles is None:
             raise ValueError("Failed to fetch candles: No candle data returned.")
         return candles
-        
\ No newline at end of file
+
+    def iter_history(
+        self,
+        *,
+        market: str,
+        unit: CandleUnit = "days",
+        minutes: MinuteInterval | None = None,
+        start: dt.datetime | None = None,
+        end: dt.datetime | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> t.Iterator[t.List[Candle]]:
+        """Yield pages of candles walking backwards from `end` to `start`.
+
+        Pages are yielded newest first, one page at a time, so memory stays
+        flat however long the history is. The next page is requested in the
+        background while the caller processes the current one.
+        """
+        with futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="upbit-candles") as executor:
+            def _fetch(to: dt.datetime | None) -> t.List[Candle]:
+                return self.get(market=market, unit=unit, minutes=minutes, to=to, count=page_size)
+
+            pending = executor.submit(_fetch, end)
+            while pending is not None:
+                page, cursor = _next_cursor(pending.result(), page_size, start)
+                pending = executor.submit(_fetch, cursor) if cursor is not None else None
+                if page:
+                    yield page
+
+
+class AsyncCandlesResource:
+
+    def __init__(self, client: "AsyncUpbitClient") -> None:
+        self._client = client
+
+    async def get_by_days(self, *, market: str | None = None, count: int | None = None) -> t.List[Candle]:
+        return await self.get(market=market or "KRW-BTC", unit="days", count=count or 200)
+
+    async def get(
+        self,
+        *,
+        market: str,
+        unit: CandleUnit = "days",
+        minutes: MinuteInterval | None = None,
+        to: dt.datetime | None = None,
+        count: int = MAX_PAGE_SIZE,
+    ) -> t.List[Candle]:
+        url = _candles_url(unit, minutes)
+        candles, error = await self._client._get_list(
+            Candle, 
+            params={
+                'market': market, 
+                'to': _format_to(to),
+                'count': count,
+            },
+            url=url, 
+            lean=self._client.lean,
+        )
+        if error:
+            raise error
+        if candles is None:
+            raise ValueError("Failed to fetch candles: No candle data returned.")
+        return candles
+
+    async def iter_history(
+        self,
+        *,
+        market: str,
+        unit: CandleUnit = "days",
+        minutes: MinuteInterval | None = None,
+        start: dt.datetime | None = None,
+        end: dt.datetime | None = None,
+        page_size: int = MAX_PAGE_SIZE,
+    ) -> t.AsyncIterator[t.List[Candle]]:
+        def _fetch(to: dt.datetime | None) -> asyncio.Task[t.List[Candle]]:
+            return asyncio.ensure_future(
+                self.get(market=market, unit=unit, minutes=minutes, to=to, count=page_size)
+            )
+
+        pending: asyncio.Task[t.List[Candle]] | None = _fetch(end)
+        try:
+            while pending is not None:
+                page, cursor = _next_cursor(await pending, page_size, start)
+                pending = _fetch(cursor) if cursor is not None else None
+                if page:
+                    yield page
+        finally:
+            if pending is not None:
+                pending.cancel()
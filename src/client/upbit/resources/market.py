@@ -2,7 +2,7 @@ from __future__ import annotations
 import typing as t
 
 if t.TYPE_CHECKING:
-    from ..client import UpbitClient
+    from ..client import UpbitClient, AsyncUpbitClient
 
 from ..types import (
     Market,
@@ -19,7 +19,6 @@ class MarketResource():
             Market, 
             params={"is_details": True},
             url=url, 
-            headers=self._client._utils._build_headers() #type: ignore
         )
         markets, error = response
         if error:
@@ -27,4 +26,23 @@ class MarketResource():
         if markets is None:
             raise ValueError("Failed to fetch markets: No market data returned.")
         return markets
-        
\ No newline at end of file
+
+
+class AsyncMarketResource():
+
+    def __init__(self, client: "AsyncUpbitClient") -> None:
+        self._client = client
+
+    async def get_all(self) -> t.List[Market]:
+        url = "https://api.upbit.com/v1/market/all"
+        response = await self._client._get_list(
+            Market, 
+            params={"is_details": True},
+            url=url, 
+        )
+        markets, error = response
+        if error:
+            raise error
+        if markets is None:
+            raise ValueError("Failed to fetch markets: No market data returned.")
+        return markets
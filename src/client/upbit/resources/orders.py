@@ -2,7 +2,7 @@ from __future__ import annotations
 import typing as t
 
 if t.TYPE_CHECKING:
-    from ..client import UpbitClient
+    from ..client import UpbitClient, AsyncUpbitClient
 
 from ..types import (
     CreateOrderBody,
@@ -34,7 +34,6 @@ class OrdersResource():
                 Order,
                 url=url, 
                 json=body,
-                headers=self._client._utils._build_headers(body) #type: ignore
             )
         )
         order, error = response
@@ -42,4 +41,39 @@ class OrdersResource():
             raise error
         if order is None:
             raise ValueError("Failed to create order: No order data returned.")
-        return order
\ No newline at end of file
+        return order
+
+
+class AsyncOrdersResource():
+
+    def __init__(self, client: "AsyncUpbitClient") -> None:
+        self._client = client
+
+    async def create(
+        self,
+        market: str = "KRW-BTC",
+        price: int = 1000,
+    ) -> Order:
+        url = "https://api.upbit.com/v1/orders"
+        body = CreateOrderBody(
+            market=market,
+            side="bid",
+            ord_type="price",
+            price=str(price),
+        ).model_dump(mode="json", exclude_none=True)
+
+        response = await (
+            self
+            ._client
+            ._post(
+                Order,
+                url=url, 
+                json=body,
+            )
+        )
+        order, error = response
+        if error:
+            raise error
+        if order is None:
+            raise ValueError("Failed to create order: No order data returned.")
+        return order
@@ -1,26 +1,148 @@
 from __future__ import annotations
+import asyncio
+import threading
 import typing as t
+from concurrent import futures
 
 if t.TYPE_CHECKING:
-    from ..client import UpbitClient
+    from ..client import UpbitClient, AsyncUpbitClient
 
 
 from ..types import (
     Ticker,
 )
 
+DEFAULT_BATCH_SIZE = 100
+"""Markets per `/v1/ticker` request; keeps query strings short and responses small."""
+
+DEFAULT_MAX_CONCURRENCY = 4
+"""Batches in flight at once; the client's rate limiter still applies to each."""
+
+
+def _split_markets(
+    markets: str | t.Sequence[str],
+    batch_size: int,
+) -> t.List[str]:
+    if isinstance(markets, str):
+        markets = [market for market in markets.split(",") if market]
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+    return [
+        ",".join(markets[i : i + batch_size])
+        for i in range(0, len(markets), batch_size)
+    ]
+
+
 class TickerResource:
 
     def __init__(self, client: "UpbitClient") -> None:
         self._client = client
+        self._executor: futures.ThreadPoolExecutor | None = None
+        self._executor_workers = 0
+        self._lock = threading.Lock()
     
-    def get_all(self, markets_joined_by_comma: str) -> t.List[Ticker]:
+    def get_all(
+        self,
+        markets: str | t.Sequence[str],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> t.List[Ticker]:
+        """Fetch tickers for `markets` (a sequence or a comma-joined string).
+
+        The markets are split into batches of at most `batch_size` that are
+        fetched concurrently and merged back in request order. Each batch is
+        its own request, so transient failures are retried per batch by the
+        client's retry policy without refetching the others. The worker
+        threads are kept between calls.
+        """
+        batches = _split_markets(markets, batch_size)
+        if len(batches) <= 1:
+            return [ticker for batch in batches for ticker in self._get_batch(batch)]
+
+        workers = min(max_concurrency, len(batches))
+        semaphore = threading.Semaphore(workers)
+
+        def _bounded(batch: str) -> t.List[Ticker]:
+            with semaphore:
+                return self._get_batch(batch)
+
+        results = list(self._map(_bounded, batches, workers))
+        return [ticker for batch in results for ticker in batch]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+                self._executor_workers = 0
+
+    def _map(
+        self,
+        fn: t.Callable[[str], t.List[Ticker]],
+        batches: t.List[str],
+        workers: int,
+    ) -> t.Iterator[t.List[Ticker]]:
+        """Submit `batches` to the shared pool, which is replaced by a larger one
+        when a call asks for more workers. Work already submitted to the old pool
+        still finishes; submitting under the lock keeps calls off a retired pool.
+        """
+        with self._lock:
+            if self._executor is None or self._executor_workers < workers:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                self._executor = futures.ThreadPoolExecutor(
+                    max_workers=workers,
+                    thread_name_prefix="upbit-ticker",
+                )
+                self._executor_workers = workers
+            return self._executor.map(fn, batches)
+
+    def _get_batch(self, markets_joined_by_comma: str) -> t.List[Ticker]:
         url = "https://api.upbit.com/v1/ticker"
         response = self._client._get_list(
             Ticker, 
             params={"markets": markets_joined_by_comma},
             url=url, 
-            headers=self._client._utils._build_headers() #type: ignore
+            lean=self._client.lean,
+        )
+        tickers, error = response
+        if error:
+            raise error
+        if tickers is None:
+            raise ValueError("Failed to fetch tickers: No ticker data returned.")
+        return tickers
+
+
+class AsyncTickerResource:
+
+    def __init__(self, client: "AsyncUpbitClient") -> None:
+        self._client = client
+
+    async def get_all(
+        self,
+        markets: str | t.Sequence[str],
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> t.List[Ticker]:
+        batches = _split_markets(markets, batch_size)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(batch: str) -> t.List[Ticker]:
+            async with semaphore:
+                return await self._get_batch(batch)
+
+        results = await asyncio.gather(*(_bounded(batch) for batch in batches))
+        return [ticker for batch in results for ticker in batch]
+
+    async def _get_batch(self, markets_joined_by_comma: str) -> t.List[Ticker]:
+        url = "https://api.upbit.com/v1/ticker"
+        response = await self._client._get_list(
+            Ticker, 
+            params={"markets": markets_joined_by_comma},
+            url=url, 
+            lean=self._client.lean,
         )
         tickers, error = response
         if error:
@@ -28,4 +150,3 @@ class TickerResource:
         if tickers is None:
             raise ValueError("Failed to fetch tickers: No ticker data returned.")
         return tickers
-        
\ No newline at end of file
@@ -4,7 +4,7 @@ import typing as t
 import pydantic
 from typing_extensions import TypedDict
 
-from src.base import BaseModel
+from src.base import BaseModel, lean_record
 
 class UpbitConfig(TypedDict):
     """Represents the required configuration for Upbit API access."""
@@ -413,22 +413,22 @@ class Candle(BaseModel):
     [Format] yyyy-MM-ddTHH:mm:ss+09:00
     """
 
-    opening_price: int
+    opening_price: float
     """The opening price of the candle,
     representing the first trading price during the candle period.
     """
 
-    high_price: int
+    high_price: float
     """The highest trading price,
     recorded during the candle period.
     """
 
-    low_price: int
+    low_price: float
     """The lowest trading price,
     recorded during the candle period.
     """
 
-    trade_price: int
+    trade_price: float
     """The closing price of the candle,
     representing the last trading price during the candle period.
     """
@@ -442,16 +442,36 @@ class Candle(BaseModel):
     candle_acc_trade_volume: float
     """Accumulated trade volume during the candle period."""
 
-    prev_closing_price: int
-    """Previous day's closing price, based on UTC."""
+    prev_closing_price: float | None = None
+    """Previous day's closing price, based on UTC.
+    Only returned for day candles.
+    """
 
-    change_price: int
+    change_price: float | None = None
     """Absolute value of the price change compared to the previous day's closing price.
     Calculated as "trade_price" - "prev_closing_price".
+    Only returned for day candles.
     """
 
-    change_rate: float
+    change_rate: float | None = None
     """Absolute value of the price change rate compared to the previous day's closing price.
+    Only returned for day candles.
     """
 
+    unit: int | None = None
+    """The candle interval in minutes.
+    Only returned for minute candles.
+    """
+
+    first_day_of_period: str | None = None
+    """The first day of the candle period.
+    [Format] yyyy-MM-dd
+    Only returned for week and month candles.
+    """
+
+
+LeanTicker = lean_record(Ticker)
+"""Slotted, validation-free `Ticker`; see `UpbitClient(lean=True)`."""
 
+LeanCandle = lean_record(Candle)
+"""Slotted, validation-free `Candle`; see `UpbitClient(lean=True)`."""
@@ -1,22 +1,66 @@
 import uuid
 import hashlib
+import threading
+import time
 import jwt
 import typing as t
 from urllib.parse import urlencode
 
+from src.base import BaseModel
+
 from ..upbit.types import (
     UpbitConfig, 
     UpbitHeaders
 )
 
 
+class SigningMetrics(BaseModel):
+
+    signed: int = 0
+    """Requests signed with a JWT."""
+
+    skipped: int = 0
+    """Requests to public endpoints sent without signing."""
+
+    total_seconds: float = 0.0
+    """Total seconds spent building signed headers."""
+
+    max_seconds: float = 0.0
+    """Slowest single signing in seconds."""
+
+    @property
+    def average_seconds(self) -> float:
+        return self.total_seconds / self.signed if self.signed else 0.0
+
+
 class UpbitUtils:
 
 
-    def __init__(self, config: UpbitConfig) -> None:
+    def __init__(self, config: UpbitConfig | None) -> None:
         self._upbit_config = config
+        self._metrics = SigningMetrics()
+        self._lock = threading.Lock()
+
+    @property
+    def has_credentials(self) -> bool:
+        return self._upbit_config is not None
+
+    def metrics(self) -> SigningMetrics:
+        with self._lock:
+            return self._metrics.model_copy()
+
+    def _skip_signing(self) -> None:
+        with self._lock:
+            self._metrics.skipped += 1
 
     def _build_headers(self, data: t.Any | None = None) -> UpbitHeaders:
+        if self._upbit_config is None:
+            raise ValueError(
+                "This endpoint requires authentication; "
+                "provide access_key and secret_key (or UPBIT_ACCESS_KEY / UPBIT_SECRET_KEY)."
+            )
+
+        started = time.perf_counter()
         payload = {
             "access_key": self._upbit_config['access_key'],
             "nonce": str(uuid.uuid4())
@@ -34,4 +78,10 @@ class UpbitUtils:
         headers = UpbitHeaders(
             Authorization=authorization_token
         )
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._metrics.signed += 1
+            self._metrics.total_seconds += elapsed
+            self._metrics.max_seconds = max(self._metrics.max_seconds, elapsed)
         return headers
\ No newline at end of file
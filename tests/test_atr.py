@@ -0,0 +1,117 @@
+import array
+import math
+import random
+
+import pytest
+
+from src.app.service.market import OHLCVFrame
+from src.app.service.technical.columns import smooth, true_range
+from src.app.service.technical.context import FrameContext
+from src.app.service.technical.volatile import compute_atr, default_volatility_fn
+
+
+def _frame(n: int, seed: int = 11) -> OHLCVFrame:
+    rng = random.Random(seed)
+    opens, highs, lows, closes = (array.array("d") for _ in range(4))
+    price = 100.0
+    for _ in range(n):
+        open_ = price * (1 + rng.uniform(-0.03, 0.03))
+        price = open_ * (1 + rng.uniform(-0.05, 0.05))
+        opens.append(open_)
+        closes.append(price)
+        highs.append(max(open_, price) * (1 + rng.uniform(0, 0.02)))
+        lows.append(min(open_, price) * (1 - rng.uniform(0, 0.02)))
+    return OHLCVFrame(
+        timestamp=array.array("q", range(0, n * 86_400, 86_400)),
+        open=opens,
+        high=highs,
+        low=lows,
+        close=closes,
+        volume=array.array("d", [1.0]) * n,
+        value=closes,
+    )
+
+
+def _naive_true_ranges(frame):
+    trs = []
+    for i in range(len(frame)):
+        high, low = frame.high[i], frame.low[i]
+        if i == 0:
+            trs.append(high - low)
+        else:
+            prev_close = frame.close[i - 1]
+            trs.append(max(high - low, abs(high - prev_close), abs(low - prev_close)))
+    return trs
+
+
+def _naive_atr(frame, period):
+    """The former O(n * period) loop."""
+    trs = _naive_true_ranges(frame)
+    return [
+        None if i + 1 < period else sum(trs[i + 1 - period : i + 1]) / period
+        for i in range(len(trs))
+    ]
+
+
+def _naive_smoothed(values, period, alpha):
+    out = [None] * min(period - 1, len(values))
+    if len(values) < period:
+        return out
+    previous = sum(values[:period]) / period
+    out.append(previous)
+    for value in values[period:]:
+        previous = (1 - alpha) * previous + alpha * value
+        out.append(previous)
+    return out
+
+
+def _assert_series_equal(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        if e is None:
+            assert a is None or math.isnan(a)
+        else:
+            assert a == pytest.approx(e, rel=1e-9)
+
+
+def test_true_range_matches_the_former_loop():
+    frame = _frame(200)
+    _assert_series_equal(true_range(frame.high, frame.low, frame.close), _naive_true_ranges(frame))
+
+
+@pytest.mark.parametrize("period", [1, 3, 14, 50])
+def test_simple_atr_matches_the_former_loop(period):
+    frame = _frame(200)
+    atr = compute_atr(frame, period=period)
+
+    assert atr.smoothing == "simple"
+    assert atr.timestamps == list(frame.timestamp)
+    _assert_series_equal(atr.series, _naive_atr(frame, period))
+    assert default_volatility_fn(frame, period=period).series == atr.series
+
+
+@pytest.mark.parametrize(
+    "smoothing, alpha",
+    [("exponential", lambda period: 2 / (period + 1)), ("wilder", lambda period: 1 / period)],
+)
+def test_smoothed_atr_is_seeded_with_the_mean(smoothing, alpha):
+    frame = _frame(200)
+    atr = compute_atr(frame, period=14, smoothing=smoothing)
+    _assert_series_equal(atr.series, _naive_smoothed(_naive_true_ranges(frame), 14, alpha(14)))
+
+
+def test_smooth_is_all_warm_up_on_short_input():
+    assert all(map(math.isnan, smooth(array.array("d", [1.0, 2.0]), 5, alpha=0.5)))
+
+
+def test_atr_reuses_the_context_true_range():
+    frame = _frame(50)
+    context = FrameContext(frame)
+    first = context.true_range
+    compute_atr(frame, period=5, context=context)
+    assert context.true_range is first
+
+
+def test_unknown_smoothing_is_rejected():
+    with pytest.raises(ValueError):
+        compute_atr(_frame(20), smoothing="median")  # type: ignore[arg-type]
@@ -0,0 +1,118 @@
+import array
+import pathlib
+
+import pytest
+import yaml
+
+from src.app.config import AppConfig, BacktestPolicy
+from src.app.service.backtest import Backtester
+from src.app.service.market import FearAndGreedData, OHLCVFrame
+from src.app.service.technical import TechnicalAnalyzer
+from src.client.alternative.types import FearAndGreedEntry
+
+CONFIG = pathlib.Path(__file__).parent.parent / "src" / "config.yaml"
+DAY = 86_400
+COST = 0.001
+
+
+@pytest.fixture
+def config() -> AppConfig:
+    config = AppConfig(**yaml.safe_load(CONFIG.read_text(encoding="utf-8")))
+    return config.model_copy(
+        update={"backtest": BacktestPolicy(initial_capital=1000.0, fee=0.0008, slippage=0.0002)}
+    )
+
+
+def _frame(opens, closes, *, first_day: int = 0) -> OHLCVFrame:
+    n = len(opens)
+    return OHLCVFrame(
+        timestamp=array.array("q", range(first_day * DAY, (first_day + n) * DAY, DAY)),
+        open=array.array("d", opens),
+        high=array.array("d", map(max, opens, closes)),
+        low=array.array("d", map(min, opens, closes)),
+        close=array.array("d", closes),
+        volume=array.array("d", [1.0]) * n,
+        value=array.array("d", closes),
+    )
+
+
+def _fear_and_greed(days: int) -> FearAndGreedData:
+    return FearAndGreedData(
+        entries=[
+            FearAndGreedEntry(value=50, value_classification="Neutral", timestamp=day * DAY)
+            for day in reversed(range(days))
+        ]
+    )
+
+
+def _fixed(*targets):
+    return lambda frame, technical, sentiment: list(targets)
+
+
+def test_targets_fill_at_the_next_open_and_pay_costs(config):
+    frame = _frame(opens=[100, 110, 120, 90], closes=[105, 115, 100, 95])
+    backtester = Backtester(config, signal_fn=_fixed(1, 1, 0, 1))
+
+    result = backtester.run({"KRW-BTC": frame}, _fear_and_greed(4)).portfolio
+
+    # Flat through candle 0; bought at the open of candle 1, sold at the open
+    # of candle 3; the last target has no candle left to fill on.
+    bought = 1000.0 * (1 - COST) * 115 / 110
+    held = bought * 120 / 115 * 100 / 120
+    sold = held * 90 / 100 * (1 - COST)
+    assert result.equity == pytest.approx([1000.0, bought, held, sold])
+    assert result.total_return == pytest.approx(sold / 1000.0 - 1)
+    assert result.trades == 2
+    assert result.fees == pytest.approx(COST * (1000.0 + held * 90 / 100))
+    assert result.max_drawdown == pytest.approx(sold / bought - 1)
+    assert result.drawdown[1] == 0.0
+    assert (result.start, result.end, result.bars) == (0, 3 * DAY, 4)
+
+
+def test_partial_positions_scale_gaps_and_sessions(config):
+    frame = _frame(opens=[100, 200, 100], closes=[100, 100, 100])
+    result = Backtester(config, signal_fn=_fixed(0.5, 0.5, 0)).run({"KRW-BTC": frame}, _fear_and_greed(3))
+
+    # Half the equity rides the gap 100 -> 200 and the session 200 -> 100.
+    first = 1000.0 * (1 - 0.5 * COST) * (1 + 0.5 * (100 / 200 - 1))
+    second = first * (1 + 0.5 * (100 / 100 - 1)) * (1 + 0.5 * (100 / 100 - 1))
+    assert result.portfolio.equity == pytest.approx([1000.0, first, second])
+    assert result.portfolio.trades == 1
+
+
+def test_targets_are_clipped_and_nan_is_flat(config):
+    frame = _frame(opens=[100, 100, 100, 100], closes=[100, 110, 121, 133.1])
+    clipped = Backtester(config, signal_fn=_fixed(5, float("nan"), -1, 0)).run({"KRW-BTC": frame}, _fear_and_greed(4))
+    full = Backtester(config, signal_fn=_fixed(1, 0, 0, 0)).run({"KRW-BTC": frame}, _fear_and_greed(4))
+    assert clipped.portfolio.equity == pytest.approx(full.portfolio.equity)
+
+
+def test_portfolio_sums_sleeves_on_the_union_of_candle_times(config):
+    frames = {
+        "KRW-BTC": _frame(opens=[100, 100, 100], closes=[100, 110, 120]),
+        "KRW-ETH": _frame(opens=[100, 100], closes=[100, 100], first_day=1),
+    }
+    result = Backtester(config, signal_fn=lambda frame, technical, sentiment: [0.0] * len(frame)).run(
+        frames, _fear_and_greed(3)
+    )
+
+    assert result.portfolio.timestamps == [0, DAY, 2 * DAY]
+    assert result.portfolio.equity == pytest.approx([1000.0, 1000.0, 1000.0])
+    assert set(result.markets) == {"KRW-BTC", "KRW-ETH"}
+    assert result.markets["KRW-ETH"].bars == 2
+
+
+def test_signals_must_cover_every_candle(config):
+    frame = _frame(opens=[100, 100, 100], closes=[100, 100, 100])
+    with pytest.raises(ValueError):
+        Backtester(config, signal_fn=_fixed(1, 1)).run({"KRW-BTC": frame}, _fear_and_greed(3))
+
+
+def test_markets_need_two_candles(config):
+    with pytest.raises(ValueError):
+        Backtester(config).run({"KRW-BTC": _frame(opens=[100], closes=[100])}, _fear_and_greed(1))
+
+
+def test_streaming_analyzers_are_rejected(config):
+    with pytest.raises(ValueError):
+        Backtester(config, technical_analyzer=TechnicalAnalyzer(config, streaming=True))
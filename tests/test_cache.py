@@ -0,0 +1,163 @@
+import httpx
+import pytest
+
+from src.base import (
+    CachePolicy,
+    DiskCacheBackend,
+    HTTPClientBase,
+    MemoryCacheBackend,
+    ResponseCache,
+)
+from src.base import cache
+from src.base.cache import CacheEntry
+
+URL = "https://api.example.com/v1/markets"
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(cache.time, "time", clock)
+    return clock
+
+
+class Server:
+    """Serves `body` with an ETag and answers matching If-None-Match with 304."""
+
+    def __init__(self, body: bytes = b'["KRW-BTC"]', etag: str | None = '"v1"') -> None:
+        self.body = body
+        self.etag = etag
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.etag is not None and request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304, headers={"ETag": self.etag})
+        headers = {"Content-Type": "application/json"}
+        if self.etag is not None:
+            headers["ETag"] = self.etag
+        return httpx.Response(200, content=self.body, headers=headers)
+
+
+def _client(server: Server, response_cache: ResponseCache) -> HTTPClientBase:
+    return HTTPClientBase(
+        client=httpx.Client(transport=httpx.MockTransport(server)),
+        cache=response_cache,
+    )
+
+
+def test_fresh_entries_are_served_without_a_request(clock):
+    server = Server()
+    response_cache = ResponseCache(ttls={URL: 60})
+    client = _client(server, response_cache)
+
+    first, _ = client._request("GET", url=URL)
+    clock.now += 59
+    second, error = client._request("GET", url=URL)
+
+    assert error is None
+    assert first is not None and second is not None
+    assert second.content == first.content == server.body
+    assert len(server.requests) == 1
+    assert response_cache.stats.hits == 1
+    assert response_cache.stats.misses == 1
+
+
+def test_stale_entries_are_revalidated_with_their_etag(clock):
+    server = Server()
+    response_cache = ResponseCache(ttls={URL: 60})
+    client = _client(server, response_cache)
+
+    client._request("GET", url=URL)
+    clock.now += 61
+    response, error = client._request("GET", url=URL)
+
+    assert error is None
+    assert response is not None
+    assert response.status_code == 200
+    assert response.content == server.body
+    assert server.requests[-1].headers["If-None-Match"] == '"v1"'
+    assert response_cache.stats.revalidated == 1
+
+    # The 304 renewed the entry, so it is fresh for another TTL.
+    clock.now += 59
+    client._request("GET", url=URL)
+    assert len(server.requests) == 2
+
+
+def test_changed_resources_replace_the_entry(clock):
+    server = Server()
+    client = _client(server, ResponseCache(ttls={URL: 60}))
+    client._request("GET", url=URL)
+
+    server.body, server.etag = b'["KRW-ETH"]', '"v2"'
+    clock.now += 61
+    response, _ = client._request("GET", url=URL)
+    assert response is not None and response.content == b'["KRW-ETH"]'
+
+    clock.now += 1
+    response, _ = client._request("GET", url=URL)
+    assert response is not None and response.content == b'["KRW-ETH"]'
+    assert len(server.requests) == 2
+
+
+def test_entries_without_validators_are_refetched_unconditionally(clock):
+    server = Server(etag=None)
+    client = _client(server, ResponseCache(ttls={URL: 60}))
+    client._request("GET", url=URL)
+    clock.now += 61
+    client._request("GET", url=URL)
+
+    assert len(server.requests) == 2
+    assert "If-None-Match" not in server.requests[-1].headers
+
+
+def test_only_listed_get_requests_are_cached():
+    response_cache = ResponseCache(ttls={"https://api.example.com/v1/": 10, URL: 60})
+    assert response_cache.ttl_for(URL) == 60
+    assert response_cache.ttl_for("https://api.example.com/v1/ticker") == 10
+    assert response_cache.ttl_for("https://other.example.com/") is None
+
+    key, entry, response, headers = response_cache.lookup("POST", URL, None, {"A": "b"})
+    assert (key, entry, response, headers) == (None, None, None, {"A": "b"})
+
+
+def test_keys_ignore_parameter_order():
+    assert ResponseCache.key_for(URL, {"a": 1, "b": 2}) == ResponseCache.key_for(URL, {"b": 2, "a": 1})
+    assert ResponseCache.key_for(URL, {"a": 1}) != ResponseCache.key_for(URL, {"a": 2})
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(max_bytes=10)
+    backend.set("a", CacheEntry(content=b"aaaa", headers={}, stored_at=0))
+    backend.set("b", CacheEntry(content=b"bbbb", headers={}, stored_at=0))
+    backend.get("a")
+    backend.set("c", CacheEntry(content=b"cccc", headers={}, stored_at=0))
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.get("c") is not None
+    assert backend.stats.evictions == 1
+
+
+def test_disk_backend_survives_a_restart(tmp_path):
+    entry = CacheEntry(content=b"\x00body\n", headers={"etag": '"v1"'}, stored_at=12.5)
+    DiskCacheBackend(tmp_path).set("key", entry)
+
+    assert DiskCacheBackend(tmp_path).get("key") == entry
+
+
+def test_policy_builds_the_configured_backend(tmp_path):
+    assert CachePolicy(enabled=False).build() is None
+    built = CachePolicy(backend="disk", directory=str(tmp_path)).build()
+    assert built is not None
+    assert isinstance(built.backend, DiskCacheBackend)
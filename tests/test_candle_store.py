@@ -0,0 +1,143 @@
+import datetime as dt
+import typing as t
+
+import httpx
+import pytest
+
+from src.app.service.market import CandleStore
+from src.client import UpbitClient
+from src.client.upbit.types import Candle
+
+MARKET = "KRW-BTC"
+DAY = dt.timedelta(days=1)
+
+
+def _candle(day: dt.datetime, price: float) -> dict[str, t.Any]:
+    return {
+        "market": MARKET,
+        "candle_date_time_utc": day.strftime("%Y-%m-%dT%H:%M:%S"),
+        "candle_date_time_kst": (day + dt.timedelta(hours=9)).strftime("%Y-%m-%dT%H:%M:%S"),
+        "opening_price": price,
+        "high_price": price + 10,
+        "low_price": price - 10,
+        "trade_price": price + 5,
+        "timestamp": int((day + dt.timedelta(hours=12)).timestamp() * 1000),
+        "candle_acc_trade_price": price * 1000,
+        "candle_acc_trade_volume": 10.0,
+        "prev_closing_price": price - 1,
+        "change_price": 6.0,
+        "change_rate": 0.06,
+    }
+
+
+class Exchange:
+    """Serves `days` daily candles ending with today's still-open one."""
+
+    def __init__(self, days: int) -> None:
+        self.today = dt.datetime.now(dt.timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        today = self.today.replace(tzinfo=None)
+        self.candles = [_candle(today - i * DAY, 100.0 + i) for i in range(days)]
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        to = dt.datetime.fromisoformat(request.url.params["to"])
+        count = int(request.url.params["count"])
+        page = [
+            candle for candle in self.candles
+            if dt.datetime.fromisoformat(candle["candle_date_time_utc"]) < to
+        ]
+        return httpx.Response(200, json=page[:count])
+
+    def client(self) -> UpbitClient:
+        return UpbitClient(client=httpx.Client(transport=httpx.MockTransport(self)))
+
+    def models(self) -> list[Candle]:
+        return [Candle.model_validate(candle) for candle in self.candles]
+
+
+@pytest.fixture
+def store(tmp_path) -> CandleStore:
+    return CandleStore(tmp_path)
+
+
+def _closes(store: CandleStore) -> list[float]:
+    with store.read(MARKET) as columns:
+        return list(columns["close"])
+
+
+def test_write_upserts_the_open_candle(store):
+    candles = Exchange(4).models()
+    assert store.write(MARKET, candles[1:]) == 3
+
+    revised = candles[1].model_copy(update={"trade_price": 999.0})
+    assert store.write(MARKET, [revised]) == 1
+    assert _closes(store)[-1] == 999.0
+    with store.read(MARKET) as columns:
+        assert len(columns) == 3
+
+    assert store.write(MARKET, [candles[0], candles[3]]) == 1
+    assert _closes(store) == [108.0, 107.0, 999.0, 105.0]
+
+
+def test_write_ignores_candles_before_the_last_row(store):
+    candles = Exchange(3).models()
+    store.write(MARKET, candles[:1])
+    assert store.write(MARKET, candles[1:]) == 0
+    with store.read(MARKET) as columns:
+        assert len(columns) == 1
+
+
+def test_candles_round_trip_every_field(store):
+    candles = Exchange(5).models()
+    store.write(MARKET, candles)
+
+    assert store.candles(MARKET) == candles
+    assert store.candles(MARKET, count=2) == candles[:2]
+
+
+def test_first_sync_is_bounded_by_start(store):
+    exchange = Exchange(1000)
+    assert store.sync(exchange.client(), MARKET, start=exchange.today - 9 * DAY) == 10
+    assert len(exchange.requests) == 1
+    assert store.candles(MARKET) == exchange.models()[:10]
+
+
+def test_sync_replaces_the_open_candle_with_one_small_request(store):
+    exchange = Exchange(30)
+    client = exchange.client()
+    store.sync(client, MARKET, start=exchange.today - 29 * DAY)
+
+    exchange.candles[0] = {**exchange.candles[0], "trade_price": 500.0, "timestamp": exchange.candles[0]["timestamp"] + 1}
+    exchange.requests.clear()
+
+    assert store.sync(client, MARKET) == 1
+    assert len(exchange.requests) == 1
+    assert int(exchange.requests[0].url.params["count"]) <= 2
+    assert store.candles(MARKET, count=1) == exchange.models()[:1]
+    with store.read(MARKET) as columns:
+        assert len(columns) == 30
+
+
+def test_backfill_prepends_only_older_history(store):
+    exchange = Exchange(40)
+    client = exchange.client()
+    store.sync(client, MARKET, start=exchange.today - 4 * DAY)
+    exchange.requests.clear()
+
+    assert store.backfill(client, MARKET) == 35
+    first = dt.datetime.fromisoformat(exchange.candles[4]["candle_date_time_utc"])
+    assert dt.datetime.fromisoformat(exchange.requests[0].url.params["to"]) == first
+    assert store.candles(MARKET) == exchange.models()
+    assert store.backfill(client, MARKET) == 0
+
+
+def test_sync_catches_up_across_several_pages(store):
+    exchange = Exchange(600)
+    candles = exchange.models()
+    store.write(MARKET, candles[350:])
+
+    # 350 missing candles plus the stored last one take two pages of 200.
+    assert store.sync(exchange.client(), MARKET) == 351
+    assert len(exchange.requests) == 2
+    assert store.candles(MARKET) == candles
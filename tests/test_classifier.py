@@ -0,0 +1,82 @@
+import pathlib
+
+import pytest
+import yaml
+
+from src.app.config import AppConfig, SentimentThresholds
+from src.app.service.market import FearAndGreedData
+from src.app.service.sentiment import SentimentAnalyzer
+from src.app.service.sentiment.classifier import FearAndGreedClassifier
+from src.client.alternative.types import FearAndGreedEntry
+
+CONFIG = pathlib.Path(__file__).parent.parent / "src" / "config.yaml"
+
+THRESHOLDS = SentimentThresholds(extreme_fear=25, fear=50, greed=75, extreme_greed=100)
+
+
+@pytest.fixture
+def classifier() -> FearAndGreedClassifier:
+    return FearAndGreedClassifier(THRESHOLDS)
+
+
+@pytest.mark.parametrize(
+    "value, state",
+    [
+        (0, "Extreme Fear"),
+        (24, "Extreme Fear"),
+        (25, "Fear"),
+        (49, "Fear"),
+        (50, "Greed"),
+        (74, "Greed"),
+        (75, "Extreme Greed"),
+        (99, "Extreme Greed"),
+        (100, "Extreme Greed"),
+    ],
+)
+def test_breakpoints_are_lower_bounds_of_the_next_level(classifier, value, state):
+    assert classifier.classify(value)["state"] == state
+
+
+def test_fractional_means_fall_between_breakpoints(classifier):
+    assert classifier.classify(24.999)["state"] == "Extreme Fear"
+    assert classifier.classify(74.5)["state"] == "Greed"
+    assert classifier.classify(99.99)["state"] == "Extreme Greed"
+
+
+def test_every_index_from_0_to_100_is_classified(classifier):
+    assert list(classifier.levels(range(101))) == [0] * 25 + [1] * 25 + [2] * 25 + [3] * 26
+
+    # extreme_greed does not cap the top level.
+    lower = FearAndGreedClassifier(THRESHOLDS.model_copy(update={"extreme_greed": 90}))
+    assert lower.classify(100)["state"] == "Extreme Greed"
+
+
+def test_levels_classifies_a_whole_history(classifier):
+    values = [0, 25, 50, 75, 100]
+    assert list(classifier.levels(values)) == [classifier.level(value) for value in values] == [0, 1, 2, 3, 3]
+
+
+@pytest.mark.parametrize(
+    "thresholds",
+    [
+        dict(extreme_fear=50, fear=25, greed=75, extreme_greed=100),
+        dict(extreme_fear=25, fear=50, greed=75, extreme_greed=60),
+    ],
+)
+def test_thresholds_must_ascend(thresholds):
+    with pytest.raises(ValueError):
+        FearAndGreedClassifier(SentimentThresholds(**thresholds))
+
+
+def test_history_classifies_the_top_of_the_index_as_extreme_greed():
+    config = AppConfig(**yaml.safe_load(CONFIG.read_text(encoding="utf-8")))
+    analyzer = SentimentAnalyzer(config)
+    entries = [
+        FearAndGreedEntry(value=value, value_classification="", timestamp=day * 86_400)
+        for day, value in enumerate([10, 30, 100, 80, 60])
+    ]
+    history = analyzer.analyze_history(FearAndGreedData(entries=entries[::-1]), regime_window=2)
+
+    assert history.timestamps == [entry.timestamp for entry in entries]
+    assert history.states == ["Extreme Fear", "Fear", "Extreme Greed", "Extreme Greed", "Greed"]
+    assert history.regimes == [None, "Extreme Fear", "Greed", "Extreme Greed", "Greed"]
@@ -0,0 +1,165 @@
+import datetime as dt
+import json
+import typing as t
+
+import pytest
+
+from src.app.event import Event
+from src.app.service.market import (
+    FearAndGreedData,
+    MarketData,
+    MarketDataDecoder,
+    MarketDataDelta,
+    MarketDataEncoder,
+)
+from src.client.alternative.types import FearAndGreedEntry
+from src.client.upbit.types import Candle, Ticker
+
+START = dt.datetime(2026, 1, 1)
+
+
+def _ticker(market: str, trade_timestamp: int, price: float = 100.0) -> Ticker:
+    return Ticker.model_validate(
+        {
+            "market": market,
+            "trade_date": "20260101",
+            "trade_time": "000000",
+            "trade_date_kst": "20260101",
+            "trade_time_kst": "090000",
+            "trade_timestamp": trade_timestamp,
+            "opening_price": 100.0,
+            "high_price": 110.0,
+            "low_price": 90.0,
+            "trade_price": price,
+            "prev_closing_price": 100.0,
+            "change": "RISE",
+            "change_price": 5.0,
+            "change_rate": 0.05,
+            "signed_change_price": 5.0,
+            "signed_change_rate": 0.05,
+            "trade_volume": 1.0,
+            "acc_trade_price": 1000.0,
+            "acc_trade_price_24h": 2000.0,
+            "acc_trade_volume": 10.0,
+            "acc_trade_volume_24h": 20.0,
+            "highest_52_week_price": 200.0,
+            "highest_52_week_date": "2025-01-01",
+            "lowest_52_week_price": 50.0,
+            "lowest_52_week_date": "2025-06-01",
+            "timestamp": trade_timestamp,
+        }
+    )
+
+
+def _candle(day: int, close: float = 100.0) -> Candle:
+    start = START + dt.timedelta(days=day)
+    return Candle(
+        market="KRW-BTC",
+        candle_date_time_utc=start.strftime("%Y-%m-%dT%H:%M:%S"),
+        candle_date_time_kst=(start + dt.timedelta(hours=9)).strftime("%Y-%m-%dT%H:%M:%S"),
+        opening_price=100.0,
+        high_price=110.0,
+        low_price=90.0,
+        trade_price=close,
+        timestamp=int(start.timestamp() * 1000),
+        candle_acc_trade_price=1e6,
+        candle_acc_trade_volume=10.0,
+    )
+
+
+def _entry(day: int, value: int = 50) -> FearAndGreedEntry:
+    return FearAndGreedEntry(
+        value=value,
+        value_classification="Neutral",
+        timestamp=int((START + dt.timedelta(days=day)).timestamp()),
+    )
+
+
+def _data(
+    tickers: t.Sequence[Ticker],
+    candle_days: range,
+    fng_days: range,
+    *,
+    last_close: float = 100.0,
+) -> MarketData:
+    candles = [_candle(day) for day in reversed(candle_days)]
+    candles[0] = _candle(candle_days[-1], last_close)
+    return MarketData(
+        currency="KRW",
+        tickers=list(tickers),
+        candles=candles,
+        fear_and_greed=FearAndGreedData(entries=[_entry(day) for day in reversed(fng_days)]),
+    )
+
+
+def _snapshots() -> list[MarketData]:
+    btc, eth, xrp = "KRW-BTC", "KRW-ETH", "KRW-XRP"
+    return [
+        _data([_ticker(btc, 1), _ticker(eth, 1)], range(0, 5), range(0, 5)),
+        # A new BTC trade and a revised open candle.
+        _data([_ticker(btc, 2, 101.0), _ticker(eth, 1)], range(0, 5), range(0, 5), last_close=105.0),
+        # A new candle pushes the oldest out of the window; ETH delists, XRP lists.
+        _data([_ticker(btc, 2, 101.0), _ticker(xrp, 3)], range(1, 6), range(0, 6)),
+        # Nothing changed.
+        _data([_ticker(btc, 2, 101.0), _ticker(xrp, 3)], range(1, 6), range(0, 6)),
+    ]
+
+
+def test_decoder_rebuilds_every_snapshot():
+    encoder, decoder = MarketDataEncoder(snapshot_every=60), MarketDataDecoder()
+    for data in _snapshots():
+        assert decoder.apply(encoder.encode(data)) == data
+
+
+def test_deltas_carry_only_what_changed():
+    encoder = MarketDataEncoder()
+    first, second, third, fourth = map(encoder.encode, _snapshots())
+
+    assert first.full and len(first.tickers) == 2 and len(first.candles) == 5
+    assert not second.full
+    assert [ticker.market for ticker in second.tickers] == ["KRW-BTC"]
+    assert [candle.trade_price for candle in second.candles] == [105.0]
+    assert second.fear_and_greed == []
+
+    assert [ticker.market for ticker in third.tickers] == ["KRW-XRP"]
+    assert third.removed_markets == ["KRW-ETH"]
+    assert len(third.candles) == 2
+    assert len(third.fear_and_greed) == 1
+
+    assert (fourth.tickers, fourth.candles, fourth.removed_markets, fourth.fear_and_greed) == ([], [], [], [])
+
+
+def test_round_trip_through_event_json():
+    encoder, decoder = MarketDataEncoder(), MarketDataDecoder()
+    for data in _snapshots():
+        event = Event.MarketDataDelta("run", delta=encoder.encode(data).to_dict())
+        payload = json.loads(event.model_dump_json())
+        assert decoder.apply(payload["data"]) == data
+
+
+def test_snapshots_are_repeated_on_schedule():
+    encoder = MarketDataEncoder(snapshot_every=2)
+    assert [encoder.encode(data).full for data in _snapshots()] == [True, False, True, False]
+
+
+def test_a_gap_waits_for_the_next_snapshot():
+    snapshots = _snapshots()
+    encoder, decoder = MarketDataEncoder(snapshot_every=3), MarketDataDecoder()
+    deltas = [encoder.encode(data) for data in snapshots]
+
+    decoder.apply(deltas[0])
+    with pytest.raises(ValueError):
+        decoder.apply(deltas[2])
+    with pytest.raises(ValueError):
+        decoder.apply(deltas[1])
+    assert decoder.apply(deltas[3]) == snapshots[3]
+
+
+def test_snapshot_every_must_be_positive():
+    with pytest.raises(ValueError):
+        MarketDataEncoder(snapshot_every=0)
+
+
+def test_delta_model_round_trips():
+    delta = MarketDataEncoder().encode(_snapshots()[0])
+    assert MarketDataDelta.from_dict(delta.to_dict()) == delta
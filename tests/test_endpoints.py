@@ -0,0 +1,138 @@
+import httpx
+import jwt
+import pytest
+
+from src.client import UpbitClient
+from src.client.upbit.endpoints import is_public
+
+SECRET = "s" * 32
+
+TICKER = {
+    "market": "KRW-BTC",
+    "trade_date": "20240101",
+    "trade_time": "000000",
+    "trade_date_kst": "20240101",
+    "trade_time_kst": "090000",
+    "trade_timestamp": 1704067200000,
+    "opening_price": 100.0,
+    "high_price": 110.0,
+    "low_price": 90.0,
+    "trade_price": 105.0,
+    "prev_closing_price": 100.0,
+    "change": "RISE",
+    "change_price": 5.0,
+    "change_rate": 0.05,
+    "signed_change_price": 5.0,
+    "signed_change_rate": 0.05,
+    "trade_volume": 1.0,
+    "acc_trade_price": 1000.0,
+    "acc_trade_price_24h": 1000.0,
+    "acc_trade_volume": 10.0,
+    "acc_trade_volume_24h": 10.0,
+    "highest_52_week_price": 120.0,
+    "highest_52_week_date": "2023-12-01",
+    "lowest_52_week_price": 80.0,
+    "lowest_52_week_date": "2023-06-01",
+    "timestamp": 1704067200000,
+}
+
+
+class Exchange:
+    """Answers every request with an empty list and records it."""
+
+    def __init__(self) -> None:
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if request.url.path == "/v1/ticker":
+            return httpx.Response(200, json=[TICKER])
+        return httpx.Response(200, json=[])
+
+    def client(self, **credentials: str) -> UpbitClient:
+        return UpbitClient(client=httpx.Client(transport=httpx.MockTransport(self)), **credentials)
+
+
+@pytest.fixture(autouse=True)
+def no_env_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("UPBIT_ACCESS_KEY", raising=False)
+    monkeypatch.delenv("UPBIT_SECRET_KEY", raising=False)
+
+
+def _claims(request: httpx.Request) -> dict:
+    token = request.headers["Authorization"].removeprefix("Bearer ")
+    return jwt.decode(token, SECRET, algorithms=["HS256"])
+
+
+def _quotations(client: UpbitClient) -> None:
+    client.v1.market.get_all()
+    client.v1.ticker.get_all(["KRW-BTC"])
+    client.v1.candles.get(market="KRW-BTC", unit="days", count=1)
+
+
+@pytest.mark.parametrize(
+    "path, public",
+    [
+        ("/v1/market/all", True),
+        ("/v1/ticker?markets=KRW-BTC", True),
+        ("/v1/candles/days", True),
+        ("/v1/candles/minutes/1", True),
+        ("/v1/trades/ticks", True),
+        ("/v1/orderbook", True),
+        ("/v1/accounts", False),
+        ("/v1/orders", False),
+        ("/v1/orders/open", False),
+        ("/v1/order", False),
+    ],
+)
+def test_only_quotation_endpoints_are_public(path, public):
+    assert is_public(f"https://api.upbit.com{path}") is public
+
+
+def test_quotations_go_out_unsigned_with_credentials():
+    exchange = Exchange()
+    client = exchange.client(access_key="access", secret_key=SECRET)
+    _quotations(client)
+
+    assert [request.url.path for request in exchange.requests] == ["/v1/market/all", "/v1/ticker", "/v1/candles/days"]
+    assert all("Authorization" not in request.headers for request in exchange.requests)
+    assert client.signing_metrics.skipped == 3
+    assert client.signing_metrics.signed == 0
+
+
+def test_quotations_work_without_credentials():
+    exchange = Exchange()
+    _quotations(exchange.client())
+    assert len(exchange.requests) == 3
+
+
+def test_exchange_endpoints_are_signed():
+    exchange = Exchange()
+    client = exchange.client(access_key="access", secret_key=SECRET)
+
+    assert client.v1.accounts.get() == []
+    response, error = client._request(
+        "POST",
+        url="https://api.upbit.com/v1/orders",
+        json={"market": "KRW-BTC", "side": "bid", "ord_type": "price", "price": "1000"},
+    )
+    assert error is None and response is not None
+
+    accounts, orders = (_claims(request) for request in exchange.requests)
+    assert accounts["access_key"] == orders["access_key"] == "access"
+    assert "query_hash" not in accounts
+    assert orders["query_hash_alg"] == "SHA512"
+    assert accounts["nonce"] != orders["nonce"]
+    assert client.signing_metrics.signed == 2
+
+
+def test_exchange_endpoints_need_credentials():
+    exchange = Exchange()
+    client = exchange.client()
+
+    response, error = client._request("GET", url="https://api.upbit.com/v1/accounts")
+    assert response is None
+    assert isinstance(error, ValueError)
+    with pytest.raises(ValueError):
+        client.v1.accounts.get()
+    assert exchange.requests == []
@@ -0,0 +1,195 @@
+import array
+import math
+import random
+import statistics
+
+import pytest
+
+from src.app.service.market import OHLCVFrame
+from src.app.service.technical.indicators import (
+    BollingerSpec,
+    MACDSpec,
+    OBVSpec,
+    RSISpec,
+    compute_indicators,
+)
+
+
+def _frame(closes, volumes=None) -> OHLCVFrame:
+    closes = array.array("d", closes)
+    n = len(closes)
+    return OHLCVFrame(
+        timestamp=array.array("q", range(0, n * 86_400, 86_400)),
+        open=closes,
+        high=closes,
+        low=closes,
+        close=closes,
+        volume=array.array("d", volumes if volumes is not None else [1.0] * n),
+        value=closes,
+    )
+
+
+def _walk(n: int, *, start: float = 100.0, step: float = 0.03, seed: int = 5) -> list[float]:
+    rng = random.Random(seed)
+    closes = [start]
+    for _ in range(n - 1):
+        closes.append(closes[-1] * (1 + rng.uniform(-step, step)))
+    return closes
+
+
+def _naive_smoothed(values, period, alpha):
+    out = [None] * min(period - 1, len(values))
+    if len(values) < period:
+        return out
+    previous = sum(values[:period]) / period
+    out.append(previous)
+    for value in values[period:]:
+        previous = (1 - alpha) * previous + alpha * value
+        out.append(previous)
+    return out
+
+
+def _naive_rsi(closes, period):
+    changes = [b - a for a, b in zip(closes, closes[1:])]
+    gains = _naive_smoothed([max(c, 0.0) for c in changes], period, 1 / period)
+    losses = _naive_smoothed([max(-c, 0.0) for c in changes], period, 1 / period)
+    out = [None] * min(1, len(closes))
+    for gain, loss in zip(gains, losses):
+        if gain is None:
+            out.append(None)
+        elif loss == 0:
+            out.append(100.0 if gain > 0 else 50.0)
+        else:
+            out.append(100 - 100 / (1 + gain / loss))
+    return out
+
+
+def _naive_macd(closes, fast, slow, signal):
+    fast_ema = _naive_smoothed(closes, fast, 2 / (fast + 1))
+    slow_ema = _naive_smoothed(closes, slow, 2 / (slow + 1))
+    line = [None if f is None or s is None else f - s for f, s in zip(fast_ema, slow_ema)]
+    warm_up = sum(1 for value in line if value is None)
+    signal_line = [None] * warm_up + _naive_smoothed(line[warm_up:], signal, 2 / (signal + 1))
+    histogram = [None if s is None else m - s for m, s in zip(line, signal_line)]
+    return line, signal_line, histogram
+
+
+def _naive_bollinger(closes, period, width):
+    middle, upper, lower = [], [], []
+    for i in range(len(closes)):
+        if i + 1 < period:
+            middle.append(None), upper.append(None), lower.append(None)
+            continue
+        window = closes[i + 1 - period : i + 1]
+        mean = statistics.fmean(window)
+        stddev = statistics.pstdev(window)
+        middle.append(mean)
+        upper.append(mean + width * stddev)
+        lower.append(mean - width * stddev)
+    return middle, upper, lower
+
+
+def _naive_obv(closes, volumes):
+    out = [0.0]
+    for i in range(1, len(closes)):
+        change = closes[i] - closes[i - 1]
+        out.append(out[-1] + (volumes[i] if change > 0 else -volumes[i] if change < 0 else 0.0))
+    return out
+
+
+def _assert_series_equal(actual, expected, *, rel=1e-9, abs=1e-9):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        if e is None:
+            assert a is None
+        else:
+            assert a == pytest.approx(e, rel=rel, abs=abs)
+
+
+def _compute(frame, spec):
+    return compute_indicators(frame, [spec])[spec.key]
+
+
+@pytest.mark.parametrize("period", [2, 14])
+def test_rsi_matches_the_reference_loop(period):
+    closes = _walk(120)
+    rsi = _compute(_frame(closes), RSISpec(period=period))
+
+    assert rsi.timestamps == list(range(0, 120 * 86_400, 86_400))
+    _assert_series_equal(rsi.series, _naive_rsi(closes, period))
+
+
+def test_rsi_without_losses_is_100_and_without_moves_50():
+    rising = _compute(_frame([100.0 + i for i in range(20)]), RSISpec(period=5)).series
+    flat = _compute(_frame([100.0] * 20), RSISpec(period=5)).series
+
+    assert rising[:5] == [None] * 5
+    assert rising[5:] == [100.0] * 15
+    assert flat[5:] == [50.0] * 15
+
+
+def test_rsi_on_short_frames_is_all_warm_up():
+    assert _compute(_frame([100.0, 101.0, 99.0]), RSISpec(period=14)).series == [None] * 3
+    assert _compute(_frame([]), RSISpec(period=14)).series == []
+
+
+def test_macd_matches_the_reference_loop():
+    closes = _walk(150)
+    macd = _compute(_frame(closes), MACDSpec(fast=12, slow=26, signal=9))
+    line, signal, histogram = _naive_macd(closes, 12, 26, 9)
+
+    _assert_series_equal(macd.series, line)
+    _assert_series_equal(macd.signal, signal)
+    _assert_series_equal(macd.histogram, histogram)
+    assert macd.series.index(None) == 0 and macd.series[25] is not None
+    assert macd.signal[33] is not None and macd.signal[32] is None
+
+
+@pytest.mark.parametrize("period, width", [(5, 1.5), (20, 2.0)])
+def test_bollinger_matches_the_reference_loop(period, width):
+    closes = _walk(120)
+    bands = _compute(_frame(closes), BollingerSpec(period=period, width=width))
+    middle, upper, lower = _naive_bollinger(closes, period, width)
+
+    _assert_series_equal(bands.series, middle)
+    _assert_series_equal(bands.upper, upper)
+    _assert_series_equal(bands.lower, lower)
+
+
+def test_bollinger_keeps_precision_at_krw_prices():
+    # Moves of a few hundred KRW on a ~100M KRW price: unshifted squares
+    # (~1e16) leave about 1e-4 relative error in the band width.
+    closes = _walk(300, start=100_000_000.0, step=0.00001)
+    bands = _compute(_frame(closes), BollingerSpec(period=20))
+    middle, upper, _ = _naive_bollinger(closes, 20, 2.0)
+
+    widths = [u - m for u, m in zip(bands.upper[19:], bands.series[19:])]
+    expected = [u - m for u, m in zip(upper[19:], middle[19:])]
+    assert widths == pytest.approx(expected, rel=1e-6)
+
+
+def test_bollinger_bands_collapse_on_a_flat_price():
+    bands = _compute(_frame([87_654_321.0] * 30), BollingerSpec(period=10))
+    assert bands.upper[9:] == bands.lower[9:] == bands.series[9:] == [87_654_321.0] * 21
+
+
+def test_obv_matches_the_reference_loop():
+    closes = _walk(80)
+    closes[10] = closes[9]
+    volumes = [float(v) for v in random.Random(3).choices(range(1, 100), k=80)]
+    obv = _compute(_frame(closes, volumes), OBVSpec())
+
+    _assert_series_equal(obv.series, _naive_obv(closes, volumes))
+    assert obv.series[10] == obv.series[9]
+    assert _compute(_frame([]), OBVSpec()).series == []
+
+
+def test_indicators_share_one_context():
+    closes = _walk(60)
+    specs = [MACDSpec(fast=12, slow=26), BollingerSpec(period=20), RSISpec(period=14), RSISpec(period=14)]
+    together = compute_indicators(_frame(closes), specs)
+
+    assert list(together.results) == ["macd_12_26_9", "bollinger_20_2", "rsi_14"]
+    for spec in specs:
+        assert together[spec.key] == _compute(_frame(closes), spec)
+    assert not any(math.isnan(v) for v in together["rsi_14"].series[15:])
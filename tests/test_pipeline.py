@@ -0,0 +1,137 @@
+import threading
+from concurrent import futures
+
+import pytest
+
+from src.app.event import Event
+from src.app.pipeline import Pipeline
+from src.app.service.market import FetchPlan
+
+
+@pytest.fixture
+def executor():
+    with futures.ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+def _drain(generator):
+    """Collect what a generator yields and the value it returns."""
+    items = []
+    while True:
+        try:
+            items.append(next(generator))
+        except StopIteration as stop:
+            return items, stop.value
+
+
+def test_stages_run_after_their_inputs(executor):
+    pipeline = Pipeline()
+    pipeline.add("total", lambda left, right: left + right, inputs=["left", "right"], output="total")
+    pipeline.add("left", lambda x: x + 1, inputs=["x"], output="left")
+    pipeline.add("right", lambda x: x * 10, inputs=["x"], output="right")
+
+    results, values = _drain(pipeline.stream(executor, x=2))
+
+    order = [result.stage for result in results]
+    assert order.index("total") > max(order.index("left"), order.index("right"))
+    assert values == {"x": 2, "left": 3, "right": 20, "total": 23}
+
+
+def test_independent_stages_run_concurrently(executor):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _meet(x):
+        barrier.wait()
+        return x
+
+    pipeline = Pipeline()
+    pipeline.add("a", _meet, inputs=["x"], output="a")
+    pipeline.add("b", _meet, inputs=["x"], output="b")
+
+    _, values = _drain(pipeline.stream(executor, x=1))
+    assert values["a"] == values["b"] == 1
+
+
+def test_run_yields_stage_events_then_timings(executor):
+    pipeline = Pipeline()
+    pipeline.add(
+        "double",
+        lambda x: x * 2,
+        inputs=["x"],
+        output="doubled",
+        event=lambda value: Event.Start(run_id=f"doubled-{value}"),
+    )
+    pipeline.add("noop", lambda doubled: None, inputs=["doubled"])
+
+    events, values = _drain(pipeline.run(executor, "run", x=4))
+
+    assert [event.id for event in events] == ["start", "stage_finished", "stage_finished"]
+    assert events[0].run_id == "doubled-8"
+    assert [event.data["stage"] for event in events[1:]] == ["double", "noop"]
+    assert all(event.data["elapsed"] >= 0 for event in events[1:])
+    assert values == {"x": 4, "doubled": 8}
+
+
+def test_a_failing_stage_propagates_and_cancels_dependents(executor):
+    ran = []
+
+    def _fail(x):
+        raise RuntimeError("boom")
+
+    pipeline = Pipeline()
+    pipeline.add("fail", _fail, inputs=["x"], output="y")
+    pipeline.add("after", lambda y: ran.append(y), inputs=["y"], output="z")
+
+    with pytest.raises(RuntimeError, match="boom"):
+        _drain(pipeline.stream(executor, x=1))
+    assert ran == []
+
+
+@pytest.mark.parametrize(
+    "build, values, message",
+    [
+        (lambda p: p.add("a", lambda missing: 1, inputs=["missing"], output="a"), {}, "neither given nor produced"),
+        (lambda p: p.add("a", lambda: 1, output="a"), {"a": 1}, "cannot be given"),
+        (
+            lambda p: (
+                p.add("a", lambda b: 1, inputs=["b"], output="a"),
+                p.add("b", lambda a: 1, inputs=["a"], output="b"),
+            ),
+            {},
+            "wait on each other",
+        ),
+    ],
+)
+def test_invalid_graphs_are_rejected(executor, build, values, message):
+    pipeline = Pipeline()
+    build(pipeline)
+    with pytest.raises(ValueError, match=message):
+        _drain(pipeline.stream(executor, **values))
+
+
+def test_stage_names_and_outputs_are_unique():
+    pipeline = Pipeline()
+    pipeline.add("a", lambda: 1, output="a")
+    with pytest.raises(ValueError):
+        pipeline.add("a", lambda: 2, output="b")
+    with pytest.raises(ValueError):
+        pipeline.add("b", lambda: 2, output="a")
+
+
+def test_fetch_plan_runs_on_the_pipeline(executor):
+    plan = FetchPlan()
+    plan.add("markets", lambda: ["KRW-BTC", "KRW-ETH"])
+    plan.add("tickers", lambda markets: [market.lower() for market in markets], depends_on=["markets"])
+    plan.add("fng", lambda: 42)
+
+    results, timings = plan.run(executor)
+
+    assert results == {"markets": ["KRW-BTC", "KRW-ETH"], "tickers": ["krw-btc", "krw-eth"], "fng": 42}
+    assert sorted(step.name for step in timings.steps) == ["fng", "markets", "tickers"]
+    assert timings.wall_clock >= max(step.started_at + step.elapsed for step in timings.steps) - 1e-6
+
+
+def test_fetch_plan_rejects_unknown_dependencies():
+    plan = FetchPlan()
+    with pytest.raises(ValueError, match="unknown step"):
+        plan.add("tickers", lambda markets: markets, depends_on=["markets"])
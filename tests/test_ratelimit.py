@@ -0,0 +1,127 @@
+import httpx
+import pytest
+
+from src.client import UpbitClient
+from src.client.upbit import ratelimit
+from src.client.upbit.ratelimit import TokenBucket, UpbitRateLimiter, parse_remaining_req
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(ratelimit.time, "monotonic", clock)
+    monkeypatch.setattr(ratelimit.time, "sleep", lambda seconds: setattr(clock, "now", clock.now + seconds))
+    return clock
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("group=market; min=1800; sec=9", ("market", 9)),
+        ("group=candles;min=600;sec=0", ("candles", 0)),
+        ("  sec=3 ; group=default ", ("default", 3)),
+        ("group=market; min=1800", None),
+        ("min=1800; sec=9", None),
+        ("group=market; sec=-1", None),
+        ("", None),
+    ],
+)
+def test_parse_remaining_req(value, expected):
+    assert parse_remaining_req(value) == expected
+
+
+def test_bucket_spends_its_burst_then_spaces_requests(clock):
+    bucket = TokenBucket(rate=10)
+
+    assert [bucket.reserve() for _ in range(10)] == [0.0] * 10
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+    clock.now += 0.3
+    assert bucket.reserve() == pytest.approx(0.0)
+
+
+def test_bucket_refills_up_to_its_capacity(clock):
+    bucket = TokenBucket(rate=5, capacity=2)
+    bucket.reserve()
+    bucket.reserve()
+
+    clock.now += 60
+    assert [bucket.reserve() for _ in range(2)] == [0.0, 0.0]
+    assert bucket.reserve() == pytest.approx(0.2)
+
+
+def test_bucket_observe_only_lowers_the_estimate(clock):
+    bucket = TokenBucket(rate=10)
+    bucket.observe(1)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.1)
+
+    bucket = TokenBucket(rate=10)
+    bucket.observe(50)
+    assert [bucket.reserve() for _ in range(10)] == [0.0] * 10
+    assert bucket.reserve() > 0
+
+
+def test_bucket_drain_waits_a_full_token(clock):
+    bucket = TokenBucket(rate=4)
+    bucket.drain()
+    assert bucket.reserve() == pytest.approx(0.25)
+
+
+def test_limiter_guesses_groups_from_the_path():
+    limiter = UpbitRateLimiter()
+    assert limiter.group_for("GET", "https://api.upbit.com/v1/candles/days?market=KRW-BTC") == "candles"
+    assert limiter.group_for("GET", "https://api.upbit.com/v1/ticker?markets=KRW-BTC") == "ticker"
+    assert limiter.group_for("POST", "https://api.upbit.com/v1/orders") == "order"
+    assert limiter.group_for("GET", "https://api.upbit.com/v1/orders") == "default"
+    assert limiter.group_for("GET", "https://api.upbit.com/v1/accounts") == "default"
+
+
+def test_limiter_learns_groups_and_counts_waits(clock):
+    limiter = UpbitRateLimiter({"ticker": 2})
+    url = "https://api.upbit.com/v1/ticker?markets=KRW-BTC"
+
+    delays = [limiter.acquire("GET", url) for _ in range(3)]
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.5)
+
+    limiter.observe("GET", url, 200, {"Remaining-Req": "group=quotation; min=600; sec=4"})
+    assert limiter.group_for("GET", url) == "quotation"
+
+    metrics = limiter.metrics()["ticker"]
+    assert metrics.requests == 3
+    assert metrics.throttled == 1
+    assert metrics.max_wait == pytest.approx(0.5)
+
+
+def test_limiter_drains_on_429(clock):
+    limiter = UpbitRateLimiter({"market": 10})
+    url = "https://api.upbit.com/v1/market/all"
+
+    limiter.observe("GET", url, 429, {})
+    assert limiter.acquire("GET", url) == pytest.approx(0.1)
+    assert limiter.metrics()["market"].rejected == 1
+
+
+def test_client_applies_remaining_req_of_responses(clock):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            json=[],
+            headers={"Remaining-Req": "group=market; min=1800; sec=0"},
+        )
+
+    client = UpbitClient(client=httpx.Client(transport=httpx.MockTransport(handler)))
+    assert client.v1.market.get_all() == []
+    # The server says the second's budget is spent, so the next request waits.
+    assert client.rate_limiter.acquire("GET", "https://api.upbit.com/v1/market/all") > 0
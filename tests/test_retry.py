@@ -0,0 +1,192 @@
+import httpx
+import jwt
+import pytest
+
+from src.base import (
+    CircuitBreakerPolicy,
+    CircuitBreakers,
+    CircuitOpenError,
+    HTTPClientBase,
+    RetryPolicy,
+)
+from src.base import http_client, retry
+from src.base.retry import CircuitBreaker
+from src.client import UpbitClient
+
+URL = "https://api.example.com/v1/items"
+
+
+def _response(status: int, headers: dict[str, str] | None = None) -> httpx.Response:
+    return httpx.Response(status, headers=headers, request=httpx.Request("GET", URL))
+
+
+def _status_error(status: int, headers: dict[str, str] | None = None) -> tuple[httpx.Response, Exception]:
+    response = _response(status, headers)
+    return response, httpx.HTTPStatusError("failed", request=response.request, response=response)
+
+
+class FakeClock:
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(retry.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    sleeps: list[float] = []
+    monkeypatch.setattr(http_client.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_backoff_doubles_up_to_the_cap():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0, jitter="none")
+    assert [policy.backoff(attempt) for attempt in range(1, 6)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+
+
+def test_next_delay_stops_after_max_attempts():
+    policy = RetryPolicy(max_attempts=3, jitter="none", backoff_base=0.1)
+    response, error = _status_error(503)
+    assert policy.next_delay("GET", 1, response, error) == 0.1
+    assert policy.next_delay("GET", 2, response, error) == 0.2
+    assert policy.next_delay("GET", 3, response, error) is None
+    assert policy.next_delay("GET", 1, _response(200), None) is None
+
+
+def test_non_idempotent_requests_only_retry_when_safe():
+    policy = RetryPolicy(jitter="none")
+    assert policy.next_delay("POST", 1, *_status_error(503)) is None
+    assert policy.next_delay("POST", 1, *_status_error(429)) is not None
+    assert policy.next_delay("POST", 1, None, httpx.ConnectError("refused")) is not None
+    assert policy.next_delay("POST", 1, None, httpx.ReadTimeout("slow")) is None
+    assert policy.next_delay("GET", 1, None, httpx.ReadTimeout("slow")) is not None
+    assert policy.next_delay("GET", 1, *_status_error(404)) is None
+
+
+def test_retry_after_wins_unless_too_long():
+    policy = RetryPolicy(max_retry_after=10.0)
+    assert policy.next_delay("GET", 1, *_status_error(429, {"Retry-After": "7"})) == 7.0
+    assert policy.next_delay("GET", 1, *_status_error(429, {"Retry-After": "60"})) is None
+    assert RetryPolicy(respect_retry_after=False, jitter="none").next_delay(
+        "GET", 1, *_status_error(429, {"Retry-After": "60"})
+    ) == 0.2
+
+
+def test_breaker_opens_after_consecutive_failures(clock):
+    breaker = CircuitBreaker("api.example.com", CircuitBreakerPolicy(failure_threshold=3, reset_timeout=30))
+
+    for _ in range(2):
+        breaker.record(_response(500), None)
+    assert breaker.state == "closed"
+    breaker.record(_response(200), None)
+    breaker.record(_response(500), None)
+    breaker.record(_response(500), None)
+    assert breaker.state == "closed"
+
+    breaker.record(None, httpx.ConnectTimeout("down"))
+    assert breaker.state == "open"
+    error = breaker.check()
+    assert isinstance(error, CircuitOpenError)
+    assert error.retry_in == pytest.approx(30)
+
+
+def test_breaker_half_opens_for_one_trial(clock):
+    breaker = CircuitBreaker("api.example.com", CircuitBreakerPolicy(failure_threshold=1, reset_timeout=30))
+    breaker.record(_response(502), None)
+
+    clock.now += 29
+    assert breaker.check() is not None
+    clock.now += 1
+    assert breaker.check() is None
+    assert breaker.state == "half_open"
+    assert breaker.check() is not None
+
+    breaker.record(_response(503), None)
+    assert breaker.state == "open"
+
+    clock.now += 30
+    assert breaker.check() is None
+    breaker.record(_response(200), None)
+    assert breaker.state == "closed"
+    assert breaker.check() is None
+
+
+def test_client_errors_do_not_trip_the_breaker(clock):
+    breaker = CircuitBreaker("api.example.com", CircuitBreakerPolicy(failure_threshold=1))
+    breaker.record(_response(404), None)
+    breaker.record(None, ValueError("bad body"))
+    assert breaker.state == "closed"
+
+
+def test_client_retries_transient_statuses(sleeps):
+    statuses = iter([503, 502, 200])
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(next(statuses), json={"ok": True})
+
+    client = HTTPClientBase(
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry_policy=RetryPolicy(max_attempts=3, jitter="none", backoff_base=0.1),
+    )
+    response, error = client._request("GET", url=URL)
+
+    assert error is None
+    assert response is not None and response.json() == {"ok": True}
+    assert len(calls) == 3
+    assert sleeps == [0.1, 0.2]
+
+
+def test_client_fails_fast_while_the_circuit_is_open(clock, sleeps):
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(500)
+
+    breakers = CircuitBreakers(CircuitBreakerPolicy(failure_threshold=2, reset_timeout=10))
+    client = HTTPClientBase(
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry_policy=RetryPolicy(max_attempts=5, jitter="none"),
+        circuit_breakers=breakers,
+    )
+
+    response, error = client._request("GET", url=URL)
+    assert response is None
+    assert isinstance(error, CircuitOpenError)
+    assert len(calls) == 2
+    assert breakers.states() == {"api.example.com": "open"}
+
+    _, error = client._request("GET", url=URL)
+    assert isinstance(error, CircuitOpenError)
+    assert len(calls) == 2
+
+
+def test_retries_of_signed_requests_carry_a_fresh_nonce(sleeps):
+    statuses = iter([503, 502, 200])
+    nonces: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        nonces.append(jwt.decode(token, options={"verify_signature": False})["nonce"])
+        return httpx.Response(next(statuses), json=[])
+
+    client = UpbitClient(
+        access_key="access",
+        secret_key="s" * 32,
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        retry_policy=RetryPolicy(max_attempts=3, jitter="none"),
+    )
+    assert client.v1.accounts.get() == []
+    assert len(nonces) == 3
+    assert len(set(nonces)) == 3
@@ -0,0 +1,132 @@
+import json
+import logging
+import threading
+
+import pytest
+
+from src.app.event import Event
+from src.app.event.sinks import EventSink, RotatingFileSink
+
+
+class GatedSink(EventSink):
+    """Records written run ids; every write waits until `release` is set."""
+
+    def __init__(self, **kwargs) -> None:
+        self.writing = threading.Event()
+        self.release = threading.Event()
+        self.written: list[str] = []
+        super().__init__(**kwargs)
+
+    def _write(self, payload: bytes) -> None:
+        self.writing.set()
+        assert self.release.wait(5)
+        self.written.extend(json.loads(line)["run_id"] for line in payload.splitlines())
+
+
+def _event(i: int) -> Event:
+    return Event.Start(run_id=str(i))
+
+
+def _stall(sink: GatedSink) -> None:
+    """Emit event 0 and wait until the writer is stuck writing it."""
+    sink.emit(_event(0))
+    assert sink.writing.wait(5)
+
+
+def test_events_are_written_in_batches():
+    sink = GatedSink(batch_size=10)
+    sink.release.set()
+    for i in range(25):
+        sink.emit(_event(i))
+    sink.close()
+
+    assert sink.written == [str(i) for i in range(25)]
+    assert sink.stats.written == 25
+    assert sink.stats.dropped == 0
+    assert sink.stats.batches >= 3
+
+
+def test_drop_oldest_keeps_the_newest_events():
+    sink = GatedSink(queue_size=3, overflow="drop_oldest")
+    _stall(sink)
+    for i in range(1, 8):
+        sink.emit(_event(i))
+    sink.release.set()
+    sink.close()
+
+    assert sink.written == ["0", "5", "6", "7"]
+    assert sink.stats.dropped == 4
+    assert sink.stats.emitted == 8
+
+
+def test_sample_keeps_every_nth_event_from_half_full():
+    sink = GatedSink(queue_size=8, overflow="sample", sample_every=3)
+    _stall(sink)
+    for i in range(1, 14):
+        sink.emit(_event(i))
+    sink.release.set()
+    sink.close()
+
+    # 1-4 fill half the queue, then one in three of 5-13 is kept.
+    assert sink.written == ["0", "1", "2", "3", "4", "7", "10", "13"]
+    assert sink.stats.dropped == 6
+
+
+def test_block_waits_for_room_instead_of_dropping():
+    sink = GatedSink(queue_size=2, overflow="block")
+    _stall(sink)
+    sink.emit(_event(1))
+    sink.emit(_event(2))
+
+    emitted = threading.Event()
+    producer = threading.Thread(target=lambda: (sink.emit(_event(3)), emitted.set()))
+    producer.start()
+    assert not emitted.wait(0.2)
+
+    sink.release.set()
+    assert emitted.wait(5)
+    producer.join()
+    sink.close()
+
+    assert sink.written == ["0", "1", "2", "3"]
+    assert sink.stats.dropped == 0
+
+
+def test_failed_writes_are_logged_and_counted(caplog):
+    class FailingSink(EventSink):
+        def _write(self, payload: bytes) -> None:
+            raise OSError("disk full")
+
+    sink = FailingSink()
+    with caplog.at_level(logging.WARNING, logger="src.app.event.sinks"):
+        sink.emit(_event(0))
+        assert sink.flush(5)
+    sink.close()
+
+    assert sink.stats.dropped == 1
+    assert sink.stats.written == 0
+    assert "disk full" in caplog.text
+
+
+def test_emit_after_close_raises():
+    sink = GatedSink()
+    sink.release.set()
+    sink.close()
+    with pytest.raises(RuntimeError):
+        sink.emit(_event(0))
+
+
+def test_file_sink_rotates_without_splitting_batches(tmp_path):
+    path = tmp_path / "events.ndjson"
+    line = len(_event(0).model_dump_json()) + 1
+    with RotatingFileSink(path, max_bytes=line * 3, backups=2, batch_size=1) as sink:
+        for i in range(7):
+            sink.emit(_event(i))
+            sink.flush(5)
+
+    def run_ids(file):
+        return [json.loads(text)["run_id"] for text in file.read_text().splitlines()]
+
+    assert run_ids(path) == ["6"]
+    assert run_ids(tmp_path / "events.ndjson.1") == ["3", "4", "5"]
+    assert run_ids(tmp_path / "events.ndjson.2") == ["0", "1", "2"]
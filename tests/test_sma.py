@@ -0,0 +1,86 @@
+import array
+import math
+import random
+
+import pytest
+
+from src.app.service.market import OHLCVFrame
+from src.app.service.technical.columns import cumsum, rolling_mean
+from src.app.service.technical.sma import compute_smas, default_sma_fn
+
+
+def _frame(n: int, seed: int = 7) -> OHLCVFrame:
+    rng = random.Random(seed)
+    closes = array.array("d")
+    price = 100.0
+    for _ in range(n):
+        price *= 1 + rng.uniform(-0.05, 0.05)
+        closes.append(price)
+    return OHLCVFrame(
+        timestamp=array.array("q", range(0, n * 86_400, 86_400)),
+        open=closes,
+        high=array.array("d", (close * 1.02 for close in closes)),
+        low=array.array("d", (close * 0.98 for close in closes)),
+        close=closes,
+        volume=array.array("d", [1.0]) * n,
+        value=closes,
+    )
+
+
+def _naive_sma(closes, period):
+    """The former O(n * period) loop."""
+    return [
+        None if i + 1 < period else sum(closes[i + 1 - period : i + 1]) / period
+        for i in range(len(closes))
+    ]
+
+
+def _assert_series_equal(actual, expected):
+    assert len(actual) == len(expected)
+    for a, e in zip(actual, expected):
+        if e is None:
+            assert a is None or math.isnan(a)
+        else:
+            assert a == pytest.approx(e, rel=1e-9)
+
+
+@pytest.mark.parametrize("period", [1, 2, 5, 20, 200, 250])
+def test_rolling_mean_matches_the_windowed_sum(period):
+    closes = _frame(250).close
+    _assert_series_equal(rolling_mean(closes, period), _naive_sma(closes, period))
+
+
+def test_rolling_mean_shares_precomputed_sums():
+    closes = _frame(100).close
+    sums = cumsum(closes)
+    assert rolling_mean(closes, 10, sums=sums)[9:] == rolling_mean(closes, 10)[9:]
+
+
+def test_rolling_mean_isolates_missing_values():
+    values = array.array("d", [1.0, 2.0, math.nan, 4.0, 5.0, 6.0, 7.0])
+    means = rolling_mean(values, 2)
+    assert math.isnan(means[0])
+    assert means[1] == 1.5
+    assert math.isnan(means[2]) and math.isnan(means[3])
+    assert list(means[4:]) == [4.5, 5.5, 6.5]
+
+
+def test_rolling_mean_rejects_empty_windows():
+    with pytest.raises(ValueError):
+        rolling_mean(array.array("d", [1.0]), 0)
+
+
+def test_compute_smas_matches_the_former_loop_for_every_period():
+    frame = _frame(300)
+    periods = [5, 20, 60, 120, 200]
+    smas = compute_smas(frame, periods)
+
+    assert smas.timestamps == list(frame.timestamp)
+    for period in periods:
+        _assert_series_equal(smas[period].series, _naive_sma(frame.close, period))
+    assert default_sma_fn(frame, period=20).series == smas[20].series
+
+
+def test_short_frames_are_all_warm_up():
+    frame = _frame(3)
+    assert compute_smas(frame, [5])[5].series == [None, None, None]
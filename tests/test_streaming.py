@@ -0,0 +1,127 @@
+import array
+import random
+
+import pytest
+
+from src.app.service.market import OHLCVFrame
+from src.app.service.technical.sma import compute_smas
+from src.app.service.technical.streaming import (
+    StreamingIndicators,
+    StreamingIndicatorsState,
+    StreamingSMA,
+)
+from src.app.service.technical.volatile import compute_atr
+
+PERIODS = [5, 20, 60]
+
+
+def _frame(n: int, seed: int = 3) -> OHLCVFrame:
+    rng = random.Random(seed)
+    highs, lows, closes = (array.array("d") for _ in range(3))
+    price = 100.0
+    for _ in range(n):
+        price *= 1 + rng.uniform(-0.04, 0.04)
+        closes.append(price)
+        highs.append(price * (1 + rng.uniform(0, 0.03)))
+        lows.append(price * (1 - rng.uniform(0, 0.03)))
+    return OHLCVFrame(
+        timestamp=array.array("q", range(0, n * 86_400, 86_400)),
+        open=closes,
+        high=highs,
+        low=lows,
+        close=closes,
+        volume=array.array("d", [1.0]) * n,
+        value=closes,
+    )
+
+
+def _head(frame: OHLCVFrame, n: int) -> OHLCVFrame:
+    return OHLCVFrame(**{column: getattr(frame, column)[:n] for column in OHLCVFrame.COLUMNS})
+
+
+def _indicators(smoothing: str = "simple") -> StreamingIndicators:
+    return StreamingIndicators(
+        sma_periods=PERIODS,
+        slope_period=20,
+        atr_period=14,
+        atr_smoothing=smoothing,  # type: ignore[arg-type]
+    )
+
+
+def _assert_close(actual, expected):
+    if expected is None:
+        assert actual is None
+    else:
+        assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("smoothing", ["simple", "exponential", "wilder"])
+def test_candle_by_candle_matches_batch(smoothing):
+    frame = _frame(150)
+    streaming = _indicators(smoothing)
+    points = [
+        streaming.update(frame.timestamp[i], frame.high[i], frame.low[i], frame.close[i])
+        for i in range(len(frame))
+    ]
+
+    smas = compute_smas(frame, PERIODS)
+    atr = compute_atr(frame, period=14, smoothing=smoothing)  # type: ignore[arg-type]
+    for i, point in enumerate(points):
+        for period in PERIODS:
+            _assert_close(point.smas[period], smas[period].series[i])
+        _assert_close(point.atr, atr.series[i])
+        previous, current = smas[20].series[i - 1] if i else None, smas[20].series[i]
+        _assert_close(point.slope, None if previous is None or current is None else current - previous)
+
+
+def test_revisions_of_the_open_candle_replace_it():
+    frame = _frame(80)
+    streaming = _indicators("wilder")
+    streaming.feed(_head(frame, 60))
+
+    # The last candle is revised a few times before it closes.
+    for bump in (1.01, 0.99, 1.0):
+        streaming.update(frame.timestamp[59], frame.high[59] * bump, frame.low[59], frame.close[59] * bump)
+    points = streaming.feed(frame)
+
+    assert [point.timestamp for point in points] == list(frame.timestamp[59:])
+    batch = compute_atr(frame, period=14, smoothing="wilder")
+    _assert_close(points[-1].atr, batch.series[-1])
+    _assert_close(points[-1].smas[60], compute_smas(frame, [60])[60].series[-1])
+
+
+def test_feed_only_touches_the_last_and_newer_candles():
+    frame = _frame(100)
+    streaming = _indicators()
+    assert len(streaming.feed(_head(frame, 90))) == 90
+    assert len(streaming.feed(_head(frame, 90))) == 1
+    assert len(streaming.feed(frame)) == 11
+
+
+def test_candles_out_of_order_are_rejected():
+    sma = StreamingSMA(3)
+    sma.update(10, 1.0)
+    with pytest.raises(ValueError):
+        sma.update(5, 1.0)
+
+
+@pytest.mark.parametrize("smoothing", ["simple", "wilder"])
+def test_snapshot_restore_resumes_where_it_left_off(smoothing):
+    frame = _frame(120)
+    uninterrupted = _indicators(smoothing)
+    uninterrupted.feed(_head(frame, 70))
+    expected = uninterrupted.feed(frame)
+
+    interrupted = _indicators(smoothing)
+    interrupted.feed(_head(frame, 70))
+    state = StreamingIndicatorsState.model_validate_json(interrupted.snapshot().model_dump_json())
+    restored = StreamingIndicators.restore(state)
+
+    # Restoring re-sums the windows exactly, so values agree to rounding.
+    resumed = restored.feed(frame)
+    assert [point.timestamp for point in resumed] == [point.timestamp for point in expected]
+    for point, reference in zip(resumed, expected):
+        for period in PERIODS:
+            _assert_close(point.smas[period], reference.smas[period])
+        _assert_close(point.slope, reference.slope)
+        _assert_close(point.atr, reference.atr)